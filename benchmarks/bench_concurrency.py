@@ -0,0 +1,113 @@
+"""
+Multithreaded snapshot-read stress benchmark.
+
+One writer thread recalculates an RSIIndicator on a sliding window of candles
+while several reader threads poll the (value, buy, sell) triple. Compares a
+coarse lock around every read and write with snapshot publication
+(``Indicator.enable_concurrent_reads``), and counts torn reads, i.e. triples
+where ``buy``/``sell`` disagree with ``value``.
+
+Usage:
+    python benchmarks/bench_concurrency.py [--readers 4] [--seconds 3]
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from python_trading_indicators.rsi import RSIIndicator
+
+BUY_THRESHOLD = 45
+SELL_THRESHOLD = 55
+WINDOW = 200
+
+
+def make_candles(length: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, length)))
+    return pd.DataFrame({"close": closes})
+
+
+def is_consistent(value: float, buy: bool, sell: bool) -> bool:
+    if value == 0.0:  # Not computed yet
+        return not buy and not sell
+    return buy == (value < BUY_THRESHOLD) and sell == (value > SELL_THRESHOLD)
+
+
+def run(mode: str, readers: int, seconds: float, candles: pd.DataFrame) -> dict:
+    rsi = RSIIndicator(14, BUY_THRESHOLD, SELL_THRESHOLD)
+    lock = threading.Lock()
+    if mode == "snapshot":
+        rsi.enable_concurrent_reads()
+        read = lambda: rsi.snapshot[:3]  # noqa: E731
+        write = rsi.calculate
+    else:
+
+        def read():
+            with lock:
+                return (
+                    rsi.current_value,
+                    rsi.check_buy_condition(),
+                    rsi.check_sell_condition(),
+                )
+
+        def write(window):
+            with lock:
+                rsi.calculate(window)
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "torn": 0}
+
+    def writer():
+        position = WINDOW
+        while not stop.is_set():
+            write(candles.iloc[position - WINDOW: position])
+            counts["writes"] += 1
+            position = position + 1 if position < len(candles) else WINDOW
+
+    def reader():
+        reads = torn = 0
+        while not stop.is_set():
+            if not is_consistent(*read()):
+                torn += 1
+            reads += 1
+        with lock:
+            counts["reads"] += reads
+            counts["torn"] += torn
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {
+        "reads": counts["reads"] / seconds,
+        "writes": counts["writes"] / seconds,
+        "torn": counts["torn"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    candles = make_candles(5000)
+    print(f"{'mode':<12}{'reads/s':>14}{'writes/s':>12}{'torn reads':>12}")
+    for mode in ("coarse-lock", "snapshot"):
+        result = run(mode, args.readers, args.seconds, candles)
+        print(
+            f"{mode:<12}{result['reads']:>14,.0f}{result['writes']:>12,.0f}"
+            f"{result['torn']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
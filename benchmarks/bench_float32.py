@@ -0,0 +1,93 @@
+"""
+float32 vs float64 cross-sectional scan benchmark.
+
+Runs the vectorized RSI and VIX kernels over a (bars x symbols) close matrix,
+and the drop and candlestick kernels symbol by symbol, in both dtypes. Reports
+the input and output memory, throughput, and the largest deviation of the
+float32 results from float64: absolute RSI points, VIX relative error, and the
+share of drop/candlestick signals that differ.
+
+Usage:
+    python benchmarks/bench_float32.py [--bars 2000] [--symbols 2000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from python_trading_indicators.candlestick import candlestick_series
+from python_trading_indicators.drop import drop_series
+from python_trading_indicators.rsi import rsi_series
+from python_trading_indicators.vix import vix_series
+
+SIGNAL_SYMBOLS = 200
+
+
+def make_market(bars: int, symbols: int):
+    rng = np.random.default_rng(0)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (bars, symbols)), axis=0))
+    opens = np.vstack([closes[:1], closes[:-1]]) * (1 + rng.normal(0, 0.001, closes.shape))
+    volumes = rng.integers(100, 10_000, (bars, symbols)).astype(float)
+    return opens, closes, volumes
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=2000)
+    parser.add_argument("--symbols", type=int, default=2000)
+    args = parser.parse_args()
+
+    opens, closes, volumes = make_market(args.bars, args.symbols)
+    cells = args.bars * args.symbols
+    results = {}
+    print(f"{'kernel':<14}{'dtype':<9}{'input MB':>10}{'output MB':>11}{'Mcells/s':>10}")
+    for dtype in (np.float64, np.float32):
+        prices = closes.astype(dtype)
+        for name, kernel in (("rsi", rsi_series), ("vix", vix_series)):
+            values, seconds = timed(kernel, prices, 14, dtype)
+            results[name, dtype] = values
+            print(
+                f"{name:<14}{np.dtype(dtype).name:<9}{prices.nbytes / 1e6:>10.1f}"
+                f"{values.nbytes / 1e6:>11.1f}{cells / seconds / 1e6:>10.2f}"
+            )
+        signals = {"drop": [], "candlestick": []}
+        start = time.perf_counter()
+        for symbol in range(SIGNAL_SYMBOLS):
+            signals["drop"].append(
+                drop_series(closes[:, symbol], volumes[:, symbol], 2, 5, 1.5, dtype)
+            )
+            signals["candlestick"].append(
+                candlestick_series(
+                    opens[:, symbol], closes[:, symbol], volumes[:, symbol], 3, 1.5, dtype
+                )
+            )
+        seconds = time.perf_counter() - start
+        for name, values in signals.items():
+            results[name, dtype] = np.vstack(values)
+        print(
+            f"{'drop+candle':<14}{np.dtype(dtype).name:<9}"
+            f"{3 * closes[:, :SIGNAL_SYMBOLS].size * np.dtype(dtype).itemsize / 1e6:>10.1f}"
+            f"{2 * results['drop', dtype].nbytes / 1e6:>11.1f}"
+            f"{args.bars * SIGNAL_SYMBOLS / seconds / 1e6:>10.2f}"
+        )
+
+    rsi_error = np.abs(results["rsi", np.float32] - results["rsi", np.float64])
+    vix_64 = results["vix", np.float64]
+    vix_error = np.abs(results["vix", np.float32] - vix_64) / vix_64
+    print()
+    print(f"RSI max abs error:      {np.nanmax(rsi_error):.2e} points")
+    print(f"VIX max rel error:      {np.nanmax(vix_error):.2e}")
+    for name in ("drop", "candlestick"):
+        mismatches = np.mean(results[name, np.float32] != results[name, np.float64])
+        print(f"{name + ' mismatches:':<24}{mismatches:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Import-time benchmark.
+
+Measures, in fresh interpreters, the wall time of importing the package alone,
+of resolving a single indicator by name, and of the previous eager behaviour
+(importing every indicator module).
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import package": "import python_trading_indicators",
+    "create('rsi')": (
+        "import python_trading_indicators as p; p.create('rsi', period=14)"
+    ),
+    "all indicators (eager)": (
+        "import python_trading_indicators as p; "
+        "[getattr(p, name) for name in p.__all__]"
+    ),
+}
+
+TIMER = (
+    "import time; _start = time.perf_counter(); {code}; "
+    "print(time.perf_counter() - _start)"
+)
+
+
+def measure(code: str, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip()) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<28}{'median ms':>12}{'min ms':>10}")
+    for name, code in SCENARIOS.items():
+        timings = measure(code, args.runs)
+        print(f"{name:<28}{statistics.median(timings):>12.2f}{min(timings):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,15 @@ Available Indicators:
 - CandlestickIndicator: Candlestick pattern analysis with volume confirmation
 - SuddenPriceDropIndicator: Detects significant price drops
 - VIXIndicator: Volatility index for panic detection
+- MACDIndicator: MACD / signal line crossovers
+- BollingerBandsIndicator: Closes outside Bollinger Bands
+- ATRIndicator: Close-to-close moves beyond a multiple of the average true range
+- CorrelationIndicator: Rolling beta / correlation of returns against reference series
 - PassThroughIndicator: Utility indicator for testing
 
 Example Usage:
     >>> import pandas as pd
-    >>> from python_trading_indicators.rsi import RSIIndicator
+    >>> from python_trading_indicators import RSIIndicator, create
     >>>
     >>> # Sample data
     >>> data = {'close': [100, 102, 105, 103, 108]}
@@ -22,24 +26,114 @@ Example Usage:
     >>> rsi = RSIIndicator(period=14, buy_threshold=30, sell_threshold=70)
     >>> rsi.calculate(candles)
     >>>
+    >>> # Or build it by name
+    >>> rsi = create("rsi", period=14)
+    >>>
     >>> if rsi.check_buy_condition():
     >>>     print("Buy signal detected!")
 """
 
-from .candlestick import CandlestickIndicator
-from .drop import SuddenPriceDropIndicator
-from .indicator import Indicator
-from .passthrough import PassThroughIndicator
-from .rsi import RSIIndicator
-from .vix import VIXIndicator
+import importlib
+from typing import Any, List
+
+from .registry import (
+    available_indicators,
+    create,
+    create_from_config,
+    get_indicator_class,
+    register_indicator,
+)
 
 __version__ = "0.1.0"
 
+# Indicator classes are resolved on first attribute access (PEP 562) so that
+# ``import python_trading_indicators`` does not import pandas/numpy.
+_lazy_attributes = {
+    "Indicator": ".indicator",
+    "IndicatorSnapshot": ".indicator",
+    "RSIIndicator": ".rsi",
+    "CandlestickIndicator": ".candlestick",
+    "SuddenPriceDropIndicator": ".drop",
+    "VIXIndicator": ".vix",
+    "MACDIndicator": ".macd",
+    "BollingerBandsIndicator": ".bollinger",
+    "ATRIndicator": ".atr",
+    "CorrelationIndicator": ".correlation",
+    "PassThroughIndicator": ".passthrough",
+    "Bar": ".config",
+    "IndicatorConfig": ".config",
+    "IndicatorState": ".config",
+    "RSIConfig": ".rsi",
+    "VIXConfig": ".vix",
+    "DropConfig": ".drop",
+    "CandlestickConfig": ".candlestick",
+    "MACDConfig": ".macd",
+    "BollingerConfig": ".bollinger",
+    "ATRConfig": ".atr",
+    "RollingComoments": ".correlation",
+    "PatternConfig": ".patterns",
+    "detect_patterns": ".patterns",
+    "TimeframeAggregator": ".resample",
+    "resample_candles": ".resample",
+    "BarBuilder": ".bars",
+    "CandleBuffer": ".bars",
+    "IndicatorStream": ".stream",
+    "Screener": ".screener",
+    "SignalMatrix": ".signals",
+    "SignalEdgeDetector": ".events",
+    "SignalEvent": ".events",
+}
+
 __all__ = [
     "Indicator",
+    "IndicatorSnapshot",
     "RSIIndicator",
     "CandlestickIndicator",
     "SuddenPriceDropIndicator",
     "VIXIndicator",
+    "MACDIndicator",
+    "BollingerBandsIndicator",
+    "ATRIndicator",
+    "CorrelationIndicator",
     "PassThroughIndicator",
+    "Bar",
+    "IndicatorConfig",
+    "IndicatorState",
+    "RSIConfig",
+    "VIXConfig",
+    "DropConfig",
+    "CandlestickConfig",
+    "MACDConfig",
+    "BollingerConfig",
+    "ATRConfig",
+    "RollingComoments",
+    "PatternConfig",
+    "detect_patterns",
+    "TimeframeAggregator",
+    "resample_candles",
+    "BarBuilder",
+    "CandleBuffer",
+    "IndicatorStream",
+    "Screener",
+    "SignalMatrix",
+    "SignalEdgeDetector",
+    "SignalEvent",
+    "create",
+    "create_from_config",
+    "register_indicator",
+    "get_indicator_class",
+    "available_indicators",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
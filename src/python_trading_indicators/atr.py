@@ -0,0 +1,195 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    column,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.smoothing import WilderMA, wilder_series
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("atr")
+
+
+def true_range_series(highs: Any, lows: Any, closes: Any) -> np.ndarray:
+    """
+    True range of every bar: the high-low range stretched to the previous
+    close (just the range for the first bar). Inputs may be 1-D or 2-D.
+    """
+    highs, lows, closes = (
+        np.asarray(values, dtype=np.float64) for values in (highs, lows, closes)
+    )
+    ranges = highs - lows
+    if len(closes) > 1:
+        previous = closes[:-1]
+        ranges[1:] = np.maximum(
+            ranges[1:],
+            np.maximum(np.abs(highs[1:] - previous), np.abs(lows[1:] - previous)),
+        )
+    return ranges
+
+
+def atr_series(
+        highs: Any, lows: Any, closes: Any, period: int = 14, dtype: Any = np.float64
+) -> np.ndarray:
+    """
+    Average true range (Wilder's RMA of the true range) for every bar, NaN for
+    the first ``period - 1``. Inputs may be 1-D or 2-D (bars x symbols).
+    """
+    return wilder_series(true_range_series(highs, lows, closes), period, dtype)
+
+
+def _true_range(high: float, low: float, previous: Optional[float]) -> float:
+    if previous is None:
+        return high - low
+    return max(high - low, abs(high - previous), abs(low - previous))
+
+
+def _moves(
+        move: float, atr: Optional[float], multiplier: float
+) -> Tuple[bool, bool]:
+    # A close-to-close move beyond `multiplier` ATRs of the bars before it
+    if atr is None:
+        return False, False
+    return move > multiplier * atr, move < -multiplier * atr
+
+
+class ATRState(IndicatorState):
+    __slots__ = ("prev_close", "ranges", "atr")
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        self.prev_close: Optional[float] = None
+        self.ranges = WilderMA(period)
+        self.atr: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ATRConfig(IndicatorConfig):
+    """
+    ``value`` is the ATR; ``buy`` / ``sell`` are set when the close moves up /
+    down by more than ``multiplier`` times the previous bar's ATR.
+    """
+
+    period: int = 14
+    multiplier: float = 2.0
+
+    def __post_init__(self):
+        if self.period < 1:
+            raise ValueError("period must be >= 1")
+
+    def new_state(self) -> ATRState:
+        return ATRState(self.period)
+
+    def compute(self, candles: Any) -> ATRState:
+        closes = column(candles, "close")
+        state = self.new_state()
+        state.bars = len(closes)
+        if not len(closes):
+            return state
+        ranges = true_range_series(column(candles, "high"), column(candles, "low"), closes)
+        atr = wilder_series(ranges, self.period)
+        state.ranges.load(ranges)
+        if len(closes) > self.period:
+            state.atr = float(atr[-2])
+        if len(closes) > 1:
+            state.prev_close = float(closes[-2])
+        if state.ranges.ready:
+            self._publish(state, float(closes[-1]), float(atr[-1]))
+        state.prev_close = float(closes[-1])
+        return state
+
+    def update(self, state: ATRState, bar: Bar) -> ATRState:  # type: ignore[override]
+        state.bars += 1
+        atr = state.ranges.update(_true_range(bar.high, bar.low, state.prev_close))
+        if state.ranges.ready:
+            self._publish(state, bar.close, atr)
+        state.prev_close = bar.close
+        return state
+
+    def peek(self, state: ATRState, bar: Bar) -> IndicatorSnapshot:  # type: ignore[override]
+        sequence = state.bars + 1
+        if sequence < self.period:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, sequence)
+        atr = state.ranges.peek(_true_range(bar.high, bar.low, state.prev_close))
+        return IndicatorSnapshot(atr, *self._signals(state, bar.close), sequence)
+
+    def _signals(self, state: ATRState, close: float) -> Tuple[bool, bool]:
+        if state.prev_close is None:
+            return False, False
+        return _moves(close - state.prev_close, state.atr, self.multiplier)
+
+    def _publish(self, state: ATRState, close: float, atr: float):
+        state.buy, state.sell = self._signals(state, close)
+        state.value = state.atr = atr
+        state.ready = True
+
+
+class ATRIndicator(Indicator):
+
+    def __init__(
+            self,
+            period: int = 14,
+            multiplier: float = 2.0,
+            enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+    ):
+        super().__init__(enabled, history, dtype)
+        self.__period = period
+        self.__multiplier = multiplier
+        self.__atr: Optional[float] = None
+        self.__moves = (False, False)
+
+    def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
+        self.__moves = (False, False)
+        if len(candles) < self.__period:
+            logger.warning("Not enough candles for ATRIndicator")
+            self.__atr = None
+            return
+
+        closes = column(candles, "close")
+        atr = atr_series(
+            column(candles, "high"), column(candles, "low"), closes, self.__period, self._dtype
+        )
+        self._history.assign(atr[self.__period - 1:])
+        self.__atr = float(atr[-1])
+        if len(closes) > self.__period:
+            self.__moves = _moves(
+                float(closes[-1] - closes[-2]), float(atr[-2]), self.__multiplier
+            )
+        logger.info("ATR: %.4f", self.__atr)
+
+    def evaluate_sell_condition(self) -> bool:
+        if not self.is_enabled or self.__atr is None:
+            return False
+        return self.__moves[1]
+
+    def evaluate_buy_condition(self) -> bool:
+        if not self.is_enabled or self.__atr is None:
+            return False
+        return self.__moves[0]
+
+    @property
+    def current_value(self) -> float:
+        """Return the current ATR"""
+        if self.__atr is None:
+            return 0.0
+        return self.__atr
+
+    @property
+    def period(self) -> int:
+        """Return the ATR period"""
+        return self.__period
+
+    @property
+    def config(self) -> ATRConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return ATRConfig(self.__period, self.__multiplier)
@@ -0,0 +1,238 @@
+"""
+Trade-to-bar building and candle storage.
+
+``BarBuilder`` ingests trades in NumPy batches of (timestamp, price, size) and
+emits time-, tick- or volume-based OHLCV bars using vectorized group reductions;
+the last, still incomplete bar is carried over to the next batch.
+``CandleBuffer`` is a fixed-capacity columnar store for the resulting candles
+that the stateless configs can read directly and that converts to a DataFrame
+for the ``Indicator`` classes.
+"""
+
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+from pandas import DataFrame
+
+from python_trading_indicators.config import Bar
+
+BAR_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume", "trades")
+BAR_MODES = ("time", "tick", "volume")
+
+
+class CandleBuffer:
+    """
+    Ring buffer of the last ``capacity`` candles, stored column by column.
+
+    Columns are kept contiguous by writing into a buffer twice the capacity and
+    sliding the live window back to the start when it reaches the end, so
+    ``buffer["close"]`` is always a zero-copy chronological view. Pass
+    ``dtype=np.float32`` to halve the memory of large multi-symbol buffers.
+    """
+
+    def __init__(self, capacity: int, columns=BAR_COLUMNS, dtype: Any = np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.__capacity = capacity
+        self.__columns = tuple(columns)
+        self.__data = np.zeros((len(self.__columns), 2 * capacity), dtype=dtype)
+        self.__index = {name: i for i, name in enumerate(self.__columns)}
+        self.__end = 0
+        self.__size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def columns(self):
+        return self.__columns
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__data.dtype
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        view = self.__data[self.__index[name], self.__end - self.__size: self.__end]
+        view.flags.writeable = False
+        return view
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.__index
+
+    def _reserve(self, count: int):
+        if self.__end + count <= self.__data.shape[1]:
+            return
+        keep = min(self.__size, self.__capacity - count)
+        self.__data[:, :keep] = self.__data[:, self.__end - keep: self.__end]
+        self.__end = keep
+        self.__size = keep
+
+    def append(self, bar: Bar, **extra: float):
+        """Append a single candle"""
+        self._reserve(1)
+        values = bar._asdict()
+        values.update(extra)
+        for name, row in self.__index.items():
+            value = values.get(name)
+            self.__data[row, self.__end] = np.nan if value is None else value
+        self.__end += 1
+        self.__size = min(self.__size + 1, self.__capacity)
+
+    def extend(self, candles: Mapping[str, Any]):
+        """Append candles from a DataFrame or a mapping of equal-length columns"""
+        first = next(iter(self.__columns))
+        count = len(candles[first]) if first in candles else len(candles["close"])
+        if count == 0:
+            return
+        start = max(count - self.__capacity, 0)
+        count -= start
+        self._reserve(count)
+        for name, row in self.__index.items():
+            if name in candles:
+                values = np.asarray(candles[name], dtype=self.__data.dtype)[start:]
+            else:
+                values = np.nan
+            self.__data[row, self.__end: self.__end + count] = values
+        self.__end += count
+        self.__size = min(self.__size + count, self.__capacity)
+
+    def to_frame(self) -> DataFrame:
+        """Return a DataFrame copy of the stored candles"""
+        return DataFrame({name: self[name].copy() for name in self.__columns})
+
+
+class _PartialBar:
+    __slots__ = (
+        "bar_id",
+        "timestamp",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "trades",
+    )
+
+    def __init__(self, bars: Dict[str, np.ndarray], bar_id: float):
+        self.bar_id = bar_id
+        self.timestamp = float(bars["timestamp"][-1])
+        self.open = float(bars["open"][-1])
+        self.high = float(bars["high"][-1])
+        self.low = float(bars["low"][-1])
+        self.close = float(bars["close"][-1])
+        self.volume = float(bars["volume"][-1])
+        self.trades = float(bars["trades"][-1])
+
+
+class BarBuilder:
+    """
+    Builds OHLCV bars from trade batches.
+
+    ``mode="time"``: bars of ``size`` seconds, labelled with the bucket start.
+    ``mode="tick"``: bars of ``size`` trades.
+    ``mode="volume"``: a bar closes each time the cumulative traded size crosses
+    a multiple of ``size``; the crossing trade belongs to the closing bar.
+    Tick and volume bars are labelled with their first trade's timestamp.
+    Trades must arrive in timestamp order.
+    """
+
+    def __init__(self, mode: str = "time", size: float = 60):
+        if mode not in BAR_MODES:
+            raise ValueError(f"mode must be one of {BAR_MODES}")
+        if size <= 0 or (mode == "tick" and int(size) != size):
+            raise ValueError("size must be positive (and an integer for tick bars)")
+        self.__mode = mode
+        self.__size = size
+        self.__partial: Optional[_PartialBar] = None
+        # Trades (tick bars) or traded size (volume bars) seen so far
+        self.__traded = 0.0
+
+    @property
+    def partial(self) -> Optional[Bar]:
+        """Return the bar still being built, if any"""
+        partial = self.__partial
+        if partial is None:
+            return None
+        return Bar(
+            partial.open,
+            partial.high,
+            partial.low,
+            partial.close,
+            partial.volume,
+            partial.timestamp,
+        )
+
+    def _bar_ids(self, timestamps: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        if self.__mode == "time":
+            return np.floor_divide(timestamps, self.__size)
+        steps = np.ones_like(sizes) if self.__mode == "tick" else sizes
+        # Position on the tick/volume grid before each trade
+        positions = self.__traded + np.cumsum(steps) - steps
+        self.__traded += float(steps.sum())
+        return np.floor_divide(positions, self.__size)
+
+    def ingest(self, timestamps: Any, prices: Any, sizes: Any) -> DataFrame:
+        """Add a batch of trades; return the bars it completed"""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        if not len(timestamps) == len(prices) == len(sizes):
+            raise ValueError("timestamps, prices and sizes must have the same length")
+        if len(timestamps) == 0:
+            return DataFrame({name: np.empty(0) for name in BAR_COLUMNS})
+
+        ids = self._bar_ids(timestamps, sizes)
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(ids)) + 1])
+        ends = np.concatenate([starts[1:], [len(ids)]]) - 1
+        bars = {
+            "timestamp": (
+                ids[starts] * self.__size if self.__mode == "time" else timestamps[starts]
+            ),
+            "open": prices[starts],
+            "high": np.maximum.reduceat(prices, starts),
+            "low": np.minimum.reduceat(prices, starts),
+            "close": prices[ends],
+            "volume": np.add.reduceat(sizes, starts),
+            "trades": np.diff(np.concatenate([starts, [len(ids)]])).astype(np.float64),
+        }
+        group_ids = ids[starts]
+
+        partial = self.__partial
+        if partial is not None and group_ids[0] == partial.bar_id:
+            bars["timestamp"][0] = partial.timestamp
+            bars["open"][0] = partial.open
+            bars["high"][0] = max(bars["high"][0], partial.high)
+            bars["low"][0] = min(bars["low"][0], partial.low)
+            bars["volume"][0] += partial.volume
+            bars["trades"][0] += partial.trades
+            completed_partial = None
+        else:
+            completed_partial = partial
+
+        # Only the last group can still be incomplete
+        last_complete = (
+            self.__mode != "time" and self.__traded >= (group_ids[-1] + 1) * self.__size
+        )
+        if last_complete:
+            self.__partial = None
+        else:
+            self.__partial = _PartialBar(bars, group_ids[-1])
+            bars = {name: values[:-1] for name, values in bars.items()}
+        if completed_partial is not None:
+            bars = {
+                name: np.concatenate([[getattr(completed_partial, name)], values])
+                for name, values in bars.items()
+            }
+        return DataFrame(bars)
+
+    def flush(self) -> DataFrame:
+        """Emit the incomplete bar, if any"""
+        partial = self.__partial
+        self.__partial = None
+        if partial is None:
+            return DataFrame({name: np.empty(0) for name in BAR_COLUMNS})
+        return DataFrame({name: [getattr(partial, name)] for name in BAR_COLUMNS})
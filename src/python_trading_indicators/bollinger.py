@@ -0,0 +1,220 @@
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    column,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.smoothing import (
+    _add_moment,
+    _remove_moment,
+    sma_series,
+)
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("bollinger")
+
+
+def bollinger_series(
+        closes: Any, period: int = 20, width: float = 2.0, dtype: Any = np.float64
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lower band, middle band (SMA) and upper band for every bar (NaN for the
+    first ``period - 1``); the bands lie ``width`` population standard
+    deviations of the last ``period`` closes from the middle. ``closes`` may
+    be 1-D or 2-D (bars x symbols).
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    middle = sma_series(closes, period)
+    deviation = (
+        DataFrame(closes.reshape(len(closes), -1))
+        .rolling(period)
+        .std(ddof=0)
+        .to_numpy()
+        .reshape(closes.shape)
+    )
+    return (
+        (middle - width * deviation).astype(dtype),
+        middle.astype(dtype),
+        (middle + width * deviation).astype(dtype),
+    )
+
+
+def percent_b(close: Any, lower: Any, upper: Any) -> Any:
+    """Position of ``close`` in the bands: 0 on the lower band, 1 on the upper"""
+    close, lower, upper = np.asarray(close), np.asarray(lower), np.asarray(upper)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        position = (close - lower) / (upper - lower)
+    # Flat bands: the close sits on the middle band
+    return np.where(upper == lower, 0.5, position)
+
+
+class BollingerState(IndicatorState):
+    __slots__ = ("closes", "mean", "m2", "lower", "middle", "upper")
+
+    def __init__(self):
+        super().__init__()
+        self.closes: Deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.lower: Optional[float] = None
+        self.middle: Optional[float] = None
+        self.upper: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BollingerConfig(IndicatorConfig):
+    """
+    ``value`` is %B (see ``percent_b``); ``buy`` / ``sell`` are set while the
+    close is below the lower / above the upper band.
+    """
+
+    period: int = 20
+    width: float = 2.0
+
+    def __post_init__(self):
+        if self.period < 1:
+            raise ValueError("period must be >= 1")
+
+    def new_state(self) -> BollingerState:
+        return BollingerState()
+
+    def compute(self, candles: Any) -> BollingerState:
+        closes = column(candles, "close")
+        state = self.new_state()
+        # Only the last `period` closes can influence the state
+        window = closes[-self.period:]
+        state.bars = len(closes)
+        state.closes.extend(window.tolist())
+        if len(window):
+            state.mean = float(window.mean())
+            state.m2 = float(((window - state.mean) ** 2).sum())
+        if state.bars >= self.period:
+            self._publish(state, float(closes[-1]), state.mean, state.m2)
+        return state
+
+    def update(self, state: BollingerState, bar: Bar) -> BollingerState:  # type: ignore[override]
+        state.bars += 1
+        state.mean, state.m2 = self._moments(state, bar.close)
+        closes = state.closes
+        if len(closes) == self.period:
+            closes.popleft()
+        closes.append(bar.close)
+        if state.bars >= self.period:
+            self._publish(state, bar.close, state.mean, state.m2)
+        return state
+
+    def peek(self, state: BollingerState, bar: Bar) -> IndicatorSnapshot:  # type: ignore[override]
+        sequence = state.bars + 1
+        if sequence < self.period:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, sequence)
+        mean, m2 = self._moments(state, bar.close)
+        value, buy, sell = self._reading(bar.close, *self._bands(mean, m2))
+        return IndicatorSnapshot(value, buy, sell, sequence)
+
+    def _moments(self, state: BollingerState, close: float) -> Tuple[float, float]:
+        # Sliding Welford update over the last `period` closes
+        closes = state.closes
+        mean = state.mean
+        m2 = state.m2
+        count = len(closes)
+        if count == self.period:
+            count -= 1
+            mean, m2 = _remove_moment(mean, m2, count, closes[0])
+        return _add_moment(mean, m2, count + 1, close)
+
+    def _bands(self, mean: float, m2: float) -> Tuple[float, float, float]:
+        offset = self.width * math.sqrt(max(m2, 0.0) / self.period)
+        return mean - offset, mean, mean + offset
+
+    @staticmethod
+    def _reading(
+            close: float, lower: float, middle: float, upper: float
+    ) -> Tuple[float, bool, bool]:
+        return float(percent_b(close, lower, upper)), close < lower, close > upper
+
+    def _publish(self, state: BollingerState, close: float, mean: float, m2: float):
+        state.lower, state.middle, state.upper = self._bands(mean, m2)
+        state.value, state.buy, state.sell = self._reading(
+            close, state.lower, state.middle, state.upper
+        )
+        state.ready = True
+
+
+class BollingerBandsIndicator(Indicator):
+
+    def __init__(
+            self,
+            period: int = 20,
+            width: float = 2.0,
+            enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+    ):
+        super().__init__(enabled, history, dtype)
+        self.__period = period
+        self.__width = width
+        self.__percent_b: Optional[float] = None
+        self.__bands: Optional[Tuple[float, float, float]] = None
+        self.__close = 0.0
+
+    def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
+        if len(candles) < self.__period:
+            logger.warning("Not enough candles for BollingerBandsIndicator")
+            self.__percent_b = None
+            self.__bands = None
+            return
+
+        closes = column(candles, "close")
+        if not self._history.enabled:
+            closes = closes[-self.__period:]
+        lower, middle, upper = bollinger_series(
+            closes, self.__period, self.__width, self._dtype
+        )
+        start = self.__period - 1
+        self._history.assign(percent_b(closes[start:], lower[start:], upper[start:]))
+        self.__bands = (float(lower[-1]), float(middle[-1]), float(upper[-1]))
+        self.__close = float(closes[-1])
+        self.__percent_b = float(percent_b(self.__close, self.__bands[0], self.__bands[2]))
+        logger.info("Bollinger %%B: %.4f", self.__percent_b)
+
+    def evaluate_sell_condition(self) -> bool:
+        if not self.is_enabled or self.__bands is None:
+            return False
+        return self.__close > self.__bands[2]
+
+    def evaluate_buy_condition(self) -> bool:
+        if not self.is_enabled or self.__bands is None:
+            return False
+        return self.__close < self.__bands[0]
+
+    @property
+    def current_value(self) -> float:
+        """Return the current %B"""
+        if self.__percent_b is None:
+            return 0.0
+        return self.__percent_b
+
+    @property
+    def period(self) -> int:
+        """Return the moving average period"""
+        return self.__period
+
+    @property
+    def bands(self) -> Optional[Tuple[float, float, float]]:
+        """Return the current (lower, middle, upper) bands"""
+        return self.__bands
+
+    @property
+    def config(self) -> BollingerConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return BollingerConfig(self.__period, self.__width)
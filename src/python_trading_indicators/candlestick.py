@@ -1,7 +1,252 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import DataFrame
 
-from python_trading_indicators.indicator import Indicator
-from python_trading_indicators.tools.logger import logger
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    TimeWindowState,
+    candle_timestamps,
+    column,
+    time_window_series,
+    window_seconds,
+    window_start,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.patterns import PATTERN_BARS, detect_patterns
+from python_trading_indicators.tools.logger import get_logger
+from python_trading_indicators.volume import (
+    METHODS as VOLUME_METHODS,
+    VolumeBaseline,
+    latest_volume_confirmed,
+    volume_confirmed_series,
+)
+
+logger = get_logger("candlestick")
+
+
+def volume_window(lookback_period: int) -> Optional[int]:
+    """
+    Previous volumes a candle is compared with: the rest of the lookback, or
+    the whole history for a single-candle lookback
+    """
+    return lookback_period - 1 if lookback_period > 1 else None
+
+
+def candlestick_series(
+        opens: Any,
+        closes: Any,
+        volumes: Any,
+        lookback_period: int = 3,
+        volume_threshold: float = 1.5,
+        dtype: Any = np.float64,
+        volume_method: str = "mean",
+) -> np.ndarray:
+    """
+    ``CandlestickIndicator`` value (1.0 bullish, -1.0 bearish, 0.0 neutral)
+    for every bar from index ``lookback_period - 1`` on
+    """
+    opens = np.asarray(opens, dtype=dtype)
+    closes = np.asarray(closes, dtype=dtype)
+    volumes = np.asarray(volumes, dtype=dtype)
+    if len(closes) < lookback_period:
+        return np.empty(0, dtype=dtype)
+    directions = np.sign(closes - opens).astype(np.int8)
+    balance = sliding_window_view(directions, lookback_period).sum(axis=-1)
+    confirmed = volume_confirmed_series(
+        volumes, volume_window(lookback_period), volume_threshold, volume_method
+    )
+    confirmed = confirmed[lookback_period - 1:]
+    values = np.zeros(len(balance), dtype=dtype)
+    values[confirmed & (balance > 0)] = 1.0
+    values[confirmed & (balance < 0)] = -1.0
+    return values
+
+
+class CandlestickState(TimeWindowState):
+    __slots__ = (
+        "directions",
+        "balance",
+        "volumes",
+        "is_bullish",
+        "is_bearish",
+        "volume_confirmed",
+    )
+
+    def __init__(
+            self,
+            lookback_period: int,
+            window: Optional[float] = None,
+            volume_method: str = "mean",
+    ):
+        super().__init__()
+        self.balance = 0
+        self.directions: Deque[Any]
+        if window is None:
+            # +1 bullish, -1 bearish, 0 doji for the last `lookback_period` candles
+            self.directions = deque(maxlen=lookback_period)
+        else:
+            # (timestamp, direction) of the candles in the time window
+            self.directions = deque()
+        # A single-candle lookback compares against the whole volume history
+        self.volumes = VolumeBaseline(
+            volume_window(lookback_period), volume_method, timed=window is not None
+        )
+        self.is_bullish = False
+        self.is_bearish = False
+        self.volume_confirmed = False
+
+
+@dataclass(frozen=True)
+class CandlestickConfig(IndicatorConfig):
+    """
+    With a time ``window`` (seconds) the direction balance and the volume
+    baseline cover the candles of the last ``window`` seconds instead of
+    ``lookback_period`` candles, and signals start once the candles seen span
+    a whole window
+    """
+
+    lookback_period: int = 3
+    volume_threshold: float = 1.5
+    window: Optional[float] = None
+    volume_method: str = "mean"
+
+    def __post_init__(self):
+        if self.lookback_period < 1:
+            raise ValueError("lookback_period must be >= 1")
+        if self.volume_method not in VOLUME_METHODS:
+            raise ValueError(f"volume_method must be one of {VOLUME_METHODS}")
+        object.__setattr__(self, "window", window_seconds(self.window))
+
+    def new_state(self) -> CandlestickState:
+        return CandlestickState(self.lookback_period, self.window, self.volume_method)
+
+    def compute(self, candles: Any) -> CandlestickState:
+        opens = column(candles, "open")
+        closes = column(candles, "close")
+        volumes = column(candles, "volume")
+        state = self.new_state()
+        if self.window is not None:
+            if not len(closes):
+                return state
+            timestamps = candle_timestamps(candles)
+            start = window_start(timestamps, self.window)
+            state.bars = start
+            state.first_timestamp = float(timestamps[0])
+            for row in zip(
+                    opens[start:].tolist(),
+                    closes[start:].tolist(),
+                    volumes[start:].tolist(),
+                    timestamps[start:].tolist(),
+            ):
+                self._push_window(state, *row)
+            return state
+        start = max(len(closes) - self.lookback_period, 0)
+        if self.lookback_period == 1 and start > 0:
+            state.volumes = VolumeBaseline(None, self.volume_method, values=volumes[:start])
+        state.bars = start
+        for open_, close, volume in zip(
+                opens[start:], closes[start:], volumes[start:]
+        ):
+            self._push(state, float(open_), float(close), float(volume))
+        return state
+
+    def update(  # type: ignore[override]
+            self, state: CandlestickState, bar: Bar
+    ) -> CandlestickState:
+        if self.window is None:
+            self._push(state, bar.open, bar.close, bar.volume)
+        else:
+            self._push_window(state, bar.open, bar.close, bar.volume, bar.timestamp)
+        return state
+
+    def peek(  # type: ignore[override]
+            self, state: CandlestickState, bar: Bar
+    ) -> IndicatorSnapshot:
+        if self.window is not None:
+            return self._peek_window(state, bar)
+        bars = state.bars + 1
+        if bars < self.lookback_period:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, bars)
+        balance, _ = self._balance(state, bar.open, bar.close)
+        bullish = balance > 0
+        bearish = balance < 0
+        confirmed = state.volumes.confirms(bar.volume, self.volume_threshold)
+        return self._reading(bullish and confirmed, bearish and confirmed, bars)
+
+    def _peek_window(self, state: CandlestickState, bar: Bar) -> IndicatorSnapshot:
+        # Skip the candles the window would expire instead of popping them
+        cutoff, ready = state.preview(bar.timestamp, self.window)  # type: ignore[arg-type]
+        bars = state.bars + 1
+        if not ready:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, bars)
+        balance = state.balance + (bar.close > bar.open) - (bar.close < bar.open)
+        for timestamp, direction in state.directions:
+            if timestamp > cutoff:
+                break
+            balance -= direction
+        confirmed = state.volumes.confirms(bar.volume, self.volume_threshold, cutoff)
+        return self._reading(balance > 0 and confirmed, balance < 0 and confirmed, bars)
+
+    def _push(
+            self, state: CandlestickState, open_: float, close: float, volume: float
+    ):
+        state.bars += 1
+        state.balance, direction = self._balance(state, open_, close)
+        state.directions.append(direction)
+        if state.bars >= self.lookback_period:
+            self._publish(state, volume)
+        state.volumes.push(volume)
+
+    def _push_window(
+            self,
+            state: CandlestickState,
+            open_: float,
+            close: float,
+            volume: float,
+            timestamp: Optional[float],
+    ):
+        cutoff = state.advance(timestamp, self.window)  # type: ignore[arg-type]
+        state.bars += 1
+        directions = state.directions
+        while directions and directions[0][0] <= cutoff:
+            state.balance -= directions.popleft()[1]
+        state.volumes.expire(cutoff)
+        direction = (close > open_) - (close < open_)
+        directions.append((state.timestamp, direction))
+        state.balance += direction
+        if state.covers(self.window):  # type: ignore[arg-type]
+            self._publish(state, volume)
+        state.volumes.push(volume, state.timestamp)
+
+    def _publish(self, state: CandlestickState, volume: float):
+        state.is_bullish = state.balance > 0
+        state.is_bearish = state.balance < 0
+        state.volume_confirmed = state.volumes.confirms(volume, self.volume_threshold)
+        state.value, state.buy, state.sell, _ = self._reading(
+            state.is_bullish and state.volume_confirmed,
+            state.is_bearish and state.volume_confirmed,
+            state.bars,
+        )
+        state.ready = True
+
+    @staticmethod
+    def _balance(state: CandlestickState, open_: float, close: float) -> Tuple[int, int]:
+        # Direction balance over the lookback window once this candle is added
+        directions = state.directions
+        balance = state.balance
+        if len(directions) == directions.maxlen:
+            balance -= directions[0]
+        direction = (close > open_) - (close < open_)
+        return balance + direction, direction
+
+    @staticmethod
+    def _reading(buy: bool, sell: bool, sequence: int) -> IndicatorSnapshot:
+        return IndicatorSnapshot(1.0 if buy else -1.0 if sell else 0.0, buy, sell, sequence)
 
 
 class CandlestickIndicator(Indicator):
@@ -11,15 +256,33 @@ class CandlestickIndicator(Indicator):
             lookback_period: int = 3,
             volume_threshold: float = 1.5,
             enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+            window: Any = None,
+            volume_method: str = "mean",
     ):
-        super().__init__(enabled)
+        super().__init__(enabled, history, dtype)
+        if volume_method not in VOLUME_METHODS:
+            raise ValueError(f"volume_method must be one of {VOLUME_METHODS}")
         self.__lookback_period = lookback_period
         self.__volume_threshold = volume_threshold
+        self.__window = window_seconds(window)
+        self.__volume_method = volume_method
         self.__is_bullish = False
         self.__is_bearish = False
         self.__volume_confirmed = False
+        # Last candles of the latest calculation; the pattern is detected on
+        # first read
+        self.__recent: Optional[DataFrame] = None
+        self.__pattern: Optional[int] = None
 
     def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
+        self.__recent = None
+        self.__pattern = None
+        if self.__window is not None:
+            self._compute_window(candles)
+            return
         if len(candles) < self.__lookback_period:
             logger.warning("Not enough candles for CandlestickIndicator")
             self.__is_bullish = False
@@ -27,42 +290,74 @@ class CandlestickIndicator(Indicator):
             self.__volume_confirmed = False
             return
 
+        self.__recent = candles.tail(PATTERN_BARS)
+        if self._history.enabled:
+            self._history.assign(
+                candlestick_series(
+                    candles["open"],
+                    candles["close"],
+                    candles["volume"],
+                    self.__lookback_period,
+                    self.__volume_threshold,
+                    self._dtype,
+                    self.__volume_method,
+                )
+            )
         recent_candles = candles.tail(self.__lookback_period)
-        closes = recent_candles["close"]
-        opens = recent_candles["open"]
 
         # Check for bullish/bearish pattern (majority of recent candles)
-        bullish_count = sum(1 for c, o in zip(closes, opens) if c > o)
-        bearish_count = sum(1 for c, o in zip(closes, opens) if c < o)
+        directions = np.sign(column(recent_candles, "close") - column(recent_candles, "open"))
+        bullish_count = int((directions > 0).sum())
+        bearish_count = int((directions < 0).sum())
         self.__is_bullish = bool(bullish_count > bearish_count)
         self.__is_bearish = bool(bearish_count > bullish_count)
 
-        # Volume confirmation
-        if len(recent_candles) > 1:
-            avg_volume = recent_candles["volume"].iloc[:-1].mean()
-            latest_volume = recent_candles["volume"].iloc[-1]
-            self.__volume_confirmed = (
-                bool(latest_volume > avg_volume * self.__volume_threshold)
-                if avg_volume > 0
-                else False
-            )
-        else:
-            # For single candle, we need historical data from the full candles to compare
-            if len(candles) > 1:
-                avg_volume = candles["volume"].iloc[:-1].mean()
-                latest_volume = candles["volume"].iloc[-1]
-                self.__volume_confirmed = (
-                    bool(latest_volume > avg_volume * self.__volume_threshold)
-                    if avg_volume > 0
-                    else False
-                )
-            else:
-                # Only one candle total, can't confirm volume
-                self.__volume_confirmed = False
+        self.__volume_confirmed = latest_volume_confirmed(
+            candles["volume"],
+            volume_window(self.__lookback_period),
+            self.__volume_threshold,
+            self.__volume_method,
+        )
+
+        logger.info(
+            "Candlestick: bullish=%s, bearish=%s, volume_confirmed=%s",
+            self.__is_bullish,
+            self.__is_bearish,
+            self.__volume_confirmed,
+        )
 
+    @staticmethod
+    def _last_pattern(recent: Optional[DataFrame]) -> int:
+        if recent is None or not len(recent):
+            return 0
+        if "high" not in recent or "low" not in recent:
+            return 0
+        return int(
+            detect_patterns(
+                recent["open"], recent["high"], recent["low"], recent["close"]
+            )[-1]
+        )
+
+    def _compute_window(self, candles: DataFrame):
+        config = self.config
+        state = config.compute(candles)
+        if not state.covers(config.window):  # type: ignore[arg-type]
+            logger.warning("Not enough candles for CandlestickIndicator")
+            self.__is_bullish = False
+            self.__is_bearish = False
+            self.__volume_confirmed = False
+            return
+        self.__recent = candles.tail(PATTERN_BARS)
+        if self._history.enabled:
+            self._history.assign(time_window_series(config, candles))
+        self.__is_bullish = state.is_bullish
+        self.__is_bearish = state.is_bearish
+        self.__volume_confirmed = state.volume_confirmed
         logger.info(
-            f"Candlestick: bullish={self.__is_bullish}, bearish={self.__is_bearish}, "
-            f"volume_confirmed={self.__volume_confirmed}"
+            "Candlestick: bullish=%s, bearish=%s, volume_confirmed=%s",
+            self.__is_bullish,
+            self.__is_bearish,
+            self.__volume_confirmed,
         )
 
     def evaluate_sell_condition(self) -> bool:
@@ -89,3 +384,28 @@ class CandlestickIndicator(Indicator):
     def period(self) -> int:
         """Return the candlestick lookback period"""
         return self.__lookback_period
+
+    @property
+    def pattern(self) -> int:
+        """
+        Return the pattern code of the latest candle (see ``patterns``; 0 when
+        there were not enough candles or no high/low columns)
+        """
+        if self.__pattern is None:
+            self.__pattern = self._last_pattern(self.__recent)
+        return self.__pattern
+
+    @property
+    def window(self) -> Optional[float]:
+        """Return the time window in seconds, or None for a bar-count lookback"""
+        return self.__window
+
+    @property
+    def config(self) -> CandlestickConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return CandlestickConfig(
+            self.__lookback_period,
+            self.__volume_threshold,
+            self.__window,
+            self.__volume_method,
+        )
@@ -0,0 +1,369 @@
+"""
+Stateless compute API.
+
+An ``IndicatorConfig`` is an immutable, hashable set of parameters; everything
+that changes per symbol lives in an ``IndicatorState`` returned by ``compute``
+and advanced by ``update``. One config can therefore evaluate any number of
+symbols, concurrently, without per-symbol indicator objects::
+
+    config = RSIConfig(period=14)
+    states = config.compute_many(candles_by_symbol, executor=thread_pool)
+    for symbol, bar in new_bars.items():
+        config.update(states[symbol], bar)
+
+``peek`` gives a provisional reading on a still-forming bar without touching the
+state; ``update`` commits the bar once it closes::
+
+    value, buy, sell, _ = config.peek(states[symbol], forming_bar)
+
+The VIX, drop and candlestick configs also take a time ``window`` (seconds)
+instead of a bar count, for irregular bars: the window then holds the bars
+whose timestamp lies in ``(t - window, t]`` of the latest bar ``t``.
+"""
+
+import copy
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import numpy as np
+
+from python_trading_indicators.indicator import IndicatorSnapshot
+
+StateT = TypeVar("StateT", bound="IndicatorState")
+
+
+class Bar(NamedTuple):
+    """A single OHLCV candle"""
+
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+    timestamp: Optional[float] = None
+
+
+class IndicatorState:
+    """
+    Per-symbol result and streaming state of an indicator.
+
+    ``value``, ``buy`` and ``sell`` mirror ``Indicator.current_value`` and the
+    buy/sell conditions; subclasses add whatever they need to continue with O(1)
+    ``IndicatorConfig.update`` calls. ``ready`` turns True once the config has
+    published a value from enough bars; until then ``value`` is a placeholder.
+    """
+
+    __slots__ = ("value", "buy", "sell", "bars", "ready")
+
+    def __init__(self):
+        self.value = 0.0
+        self.buy = False
+        self.sell = False
+        self.bars = 0
+        self.ready = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(value={self.value!r}, buy={self.buy!r}, "
+            f"sell={self.sell!r}, bars={self.bars!r})"
+        )
+
+
+class TimeWindowState(IndicatorState):
+    """
+    State of an indicator that can use a time window; it also records the
+    first and latest bar timestamps.
+    """
+
+    __slots__ = ("first_timestamp", "timestamp")
+
+    def __init__(self):
+        super().__init__()
+        self.first_timestamp: Optional[float] = None
+        self.timestamp: Optional[float] = None
+
+    def advance(self, timestamp: Optional[float], window: float) -> float:
+        """
+        Record the next bar's timestamp and return the window cutoff: entries
+        stamped at or before it have left the window
+        """
+        if timestamp is None:
+            raise ValueError("Time windows need bar timestamps")
+        if self.timestamp is not None and timestamp < self.timestamp:
+            raise ValueError("Bar timestamps must not decrease")
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.timestamp = timestamp
+        return timestamp - window
+
+    def covers(self, window: float) -> bool:
+        """Whether the bars seen so far span a whole window"""
+        if self.first_timestamp is None or self.timestamp is None:
+            return False
+        return self.first_timestamp <= self.timestamp - window
+
+    def preview(self, timestamp: Optional[float], window: float) -> Tuple[float, bool]:
+        """
+        The cutoff ``advance(timestamp, window)`` would return and whether
+        ``covers(window)`` would then hold, leaving the state untouched
+        """
+        if timestamp is None:
+            raise ValueError("Time windows need bar timestamps")
+        if self.timestamp is not None and timestamp < self.timestamp:
+            raise ValueError("Bar timestamps must not decrease")
+        first = timestamp if self.first_timestamp is None else self.first_timestamp
+        return timestamp - window, first <= timestamp - window
+
+
+class IndicatorConfig(ABC):
+    """
+    Immutable indicator parameters. Concrete configs are frozen dataclasses.
+    """
+
+    @abstractmethod
+    def new_state(self) -> IndicatorState:
+        """Return an empty state, ready for ``update``."""
+
+    @abstractmethod
+    def compute(self, candles: Any) -> IndicatorState:
+        """
+        Compute the indicator over a whole candle history (a DataFrame or a
+        mapping of column arrays) and return the state after the last bar.
+        """
+
+    @abstractmethod
+    def update(self, state: StateT, bar: Bar) -> StateT:
+        """Advance ``state`` in place by one closed bar and return it."""
+
+    def peek(self, state: IndicatorState, bar: Bar) -> IndicatorSnapshot:
+        """
+        Return the reading ``update(state, bar)`` would produce, leaving ``state``
+        untouched: the provisional value of a still-forming bar. ``sequence`` is
+        the number of the bar being previewed. The built-in configs do this in
+        O(1), plus O(1) per entry a time window would expire (O(window) for
+        time-windowed median volume baselines); this fallback updates a copy of
+        the state.
+        """
+        provisional = self.update(copy.deepcopy(state), bar)
+        return IndicatorSnapshot(
+            provisional.value, provisional.buy, provisional.sell, provisional.bars
+        )
+
+    def compute_many(
+            self,
+            candles_by_symbol: Mapping[str, Any],
+            executor: Optional[Executor] = None,
+    ) -> Dict[str, IndicatorState]:
+        """
+        Compute one state per symbol. When an executor is given the symbols are
+        spread across it; the config itself is shared read-only.
+        """
+        symbols = list(candles_by_symbol)
+        if executor is None:
+            return {
+                symbol: self.compute(candles_by_symbol[symbol]) for symbol in symbols
+            }
+        states = executor.map(
+            self.compute, (candles_by_symbol[symbol] for symbol in symbols)
+        )
+        return dict(zip(symbols, states))
+
+    def replay(
+            self, bars: Iterable[Bar], state: Optional[IndicatorState] = None
+    ) -> IndicatorState:
+        """Feed ``bars`` one by one into ``state`` (a new one by default)."""
+        if state is None:
+            state = self.new_state()
+        for bar in bars:
+            self.update(state, bar)
+        return state
+
+
+def column(candles: Any, name: str) -> np.ndarray:
+    """Return a candle column as a float64 NumPy array"""
+    return np.asarray(candles[name], dtype=np.float64)
+
+
+def candle_bars(candles: Any, start: int = 0) -> List[Bar]:
+    """
+    Return the candles from row ``start`` on as bars. Missing open/high/low
+    columns default to the close, a missing volume to 0; the timestamp is kept
+    when there is one.
+    """
+    closes = column(candles, "close")[start:]
+    columns = [
+        column(candles, name)[start:] if name in candles else closes
+        for name in ("open", "high", "low")
+    ]
+    columns.append(closes)
+    columns.append(
+        column(candles, "volume")[start:] if "volume" in candles else closes * 0.0
+    )
+    if "timestamp" in candles:
+        columns.append(timestamp_seconds(candles["timestamp"])[start:])
+    return [Bar(*row) for row in zip(*(values.tolist() for values in columns))]
+
+
+def timestamp_seconds(timestamps: Any) -> np.ndarray:
+    """Timestamps (seconds or datetime64) as float64 seconds"""
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        return timestamps.astype("datetime64[ns]").astype(np.int64) / 1e9
+    return timestamps.astype(np.float64)
+
+
+def candle_timestamps(candles: Any) -> np.ndarray:
+    """The ``timestamp`` column in seconds, required by time windows"""
+    if "timestamp" not in candles:
+        raise ValueError("Time windows need a timestamp column")
+    return timestamp_seconds(candles["timestamp"])
+
+
+def window_seconds(window: Any) -> Optional[float]:
+    """A time window in seconds (a number or a ``timedelta``), or None"""
+    if window is None:
+        return None
+    seconds = float(window.total_seconds() if hasattr(window, "total_seconds") else window)
+    if not seconds > 0:
+        raise ValueError("window must be > 0 seconds")
+    return seconds
+
+
+def window_start(timestamps: np.ndarray, window: float) -> int:
+    """Index of the first bar inside the time window ending at the last bar"""
+    return int(np.searchsorted(timestamps, timestamps[-1] - window, side="right"))
+
+
+def time_window_series(config: IndicatorConfig, candles: Any) -> np.ndarray:
+    """
+    Streaming value of a time-window config after every bar once its window
+    is covered. Each bar costs amortized O(1), so the whole series is O(n).
+    """
+    window = config.window  # type: ignore[attr-defined]
+    state = config.new_state()
+    values = []
+    for bar in candle_bars(candles):
+        config.update(state, bar)
+        if state.covers(window):  # type: ignore[attr-defined]
+            values.append(state.value)
+    return np.asarray(values, dtype=np.float64)
+
+
+class _WindowSum:
+    """
+    Sum of the finite values among the last ``size`` pushed, updated in O(1);
+    ``missing`` counts the non-finite ones left out of ``total``.
+    ``size=None`` keeps a cumulative sum over everything pushed.
+    """
+
+    __slots__ = ("values", "total", "count", "missing")
+
+    def __init__(self, size: Optional[int], values: Iterable[float] = ()):
+        self.values: Optional[Deque[float]] = (
+            None if size is None else deque(maxlen=max(size, 0))
+        )
+        self.total = 0.0
+        self.count = 0
+        self.missing = 0
+        for value in values:
+            self.push(float(value))
+
+    @property
+    def finite(self) -> int:
+        """Number of values in ``total``"""
+        return self.count - self.missing
+
+    def push(self, value: float):
+        values = self.values
+        if values is not None:
+            if values.maxlen == 0:
+                return
+            if len(values) == values.maxlen:
+                self._remove(values[0])
+            values.append(value)
+        self._add(value)
+
+    def preview(self, value: float) -> Tuple[float, int]:
+        """``total`` and ``finite`` after pushing ``value``, without pushing it"""
+        total, finite = self.total, self.finite
+        values = self.values
+        if values is not None and values.maxlen and len(values) == values.maxlen:
+            if math.isfinite(values[0]):
+                total -= values[0]
+                finite -= 1
+        if math.isfinite(value):
+            total += value
+            finite += 1
+        return total, finite
+
+    def _add(self, value: float):
+        self.count += 1
+        if math.isfinite(value):
+            self.total += value
+        else:
+            self.missing += 1
+
+    def _remove(self, value: float):
+        self.count -= 1
+        if math.isfinite(value):
+            self.total -= value
+        else:
+            self.missing -= 1
+
+
+class _TimeWindowSum(_WindowSum):
+    """
+    Sum of the finite values pushed with a timestamp after the last
+    ``expire`` cutoff. Each value is added and removed once: amortized O(1)
+    per push.
+    """
+
+    __slots__ = ("stamped",)
+
+    def __init__(self):
+        super().__init__(None)
+        self.stamped: Deque[Tuple[float, float]] = deque()
+
+    def push(self, timestamp: float, value: float):  # type: ignore[override]
+        self.stamped.append((timestamp, value))
+        self._add(value)
+
+    def preview(self, value: float, cutoff: float) -> Tuple[float, int]:  # type: ignore[override]
+        """
+        ``total`` and ``finite`` after ``expire(cutoff)`` and pushing ``value``,
+        without doing either
+        """
+        total, finite = self.total, self.finite
+        for timestamp, stamped in self.stamped:
+            if timestamp > cutoff:
+                break
+            if math.isfinite(stamped):
+                total -= stamped
+                finite -= 1
+        if not finite:
+            total = 0.0  # As `expire` drops the drift of an emptied window
+        if math.isfinite(value):
+            total += value
+            finite += 1
+        return total, finite
+
+    def expire(self, cutoff: float):
+        stamped = self.stamped
+        while stamped and stamped[0][0] <= cutoff:
+            self._remove(stamped.popleft()[1])
+        if not self.finite:
+            self.total = 0.0  # Drop the rounding drift of an emptied window
@@ -0,0 +1,317 @@
+"""
+Rolling covariance, correlation and beta of returns against reference series.
+
+``comoment_series`` computes them for every bar of a whole universe at once:
+``returns`` is 1-D or (bars x symbols), ``references`` 1-D or
+(bars x references), and each output has shape
+``returns.shape + references.shape[1:]``. ``RollingComoments`` keeps the same
+statistics bar by bar with sliding co-moment updates, O(1) per symbol and
+reference::
+
+    comoments = RollingComoments(window=60, symbols=len(universe))
+    for closes, index_close in bars:
+        comoments.update(np.log(closes / previous), np.log(index_close / previous_index))
+        betas = comoments.beta[:, 0]
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from python_trading_indicators.config import column
+from python_trading_indicators.indicator import Indicator
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("correlation")
+
+
+class Comoments(NamedTuple):
+    """Sample covariance, correlation and beta (returns on reference)"""
+
+    covariance: np.ndarray
+    correlation: np.ndarray
+    beta: np.ndarray
+
+
+def log_returns(closes: Any) -> np.ndarray:
+    """Log returns of consecutive closes, one row fewer than ``closes``"""
+    closes = np.asarray(closes, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log(closes[1:] / closes[:-1])
+
+
+def _statistics(
+        cross: np.ndarray, squares_x: np.ndarray, squares_y: np.ndarray, count: int
+) -> Comoments:
+    # Co-moment sums about the window means -> the three statistics
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return Comoments(
+            cross / (count - 1),
+            cross / np.sqrt(squares_x * squares_y),
+            cross / squares_y,
+        )
+
+
+def comoment_series(
+        returns: Any, references: Any, window: int, dtype: Any = np.float64
+) -> Comoments:
+    """
+    Rolling statistics over the last ``window`` returns of every bar (NaN for
+    the first ``window - 1``). Inputs must be finite: windows are differences
+    of float64 running sums, taken about each column's overall mean so they
+    do not cancel.
+    """
+    if window < 2:
+        raise ValueError("window must be >= 2")
+    returns = np.asarray(returns, dtype=np.float64)
+    references = np.asarray(references, dtype=np.float64)
+    if len(returns) != len(references):
+        raise ValueError("returns and references must have the same length")
+    shape = returns.shape + references.shape[1:]
+    length = len(returns)
+    if length < window:
+        empty = np.full(shape, np.nan, dtype=dtype)
+        return Comoments(empty, empty.copy(), empty.copy())
+    x = returns.reshape(length, -1, 1)
+    y = references.reshape(length, 1, -1)
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+
+    def window_sums(values: np.ndarray) -> np.ndarray:
+        sums = np.cumsum(values, axis=0)
+        sums = np.concatenate([np.zeros((1,) + sums.shape[1:]), sums])
+        return sums[window:] - sums[:-window]
+
+    sum_x, sum_y = window_sums(x), window_sums(y)
+    # Sums of products about the window means
+    cross = window_sums(x * y) - sum_x * sum_y / window
+    squares_x = window_sums(x * x) - sum_x * sum_x / window
+    squares_y = window_sums(y * y) - sum_y * sum_y / window
+    statistics = _statistics(cross, squares_x, squares_y, window)
+    outputs = []
+    for values in statistics:
+        output = np.full((length,) + values.shape[1:], np.nan, dtype=dtype)
+        output[window - 1:] = values
+        outputs.append(output.reshape(shape))
+    return Comoments(*outputs)
+
+
+def latest_comoments(returns: Any, references: Any, window: int) -> Comoments:
+    """``comoment_series`` of the last bar only, from the last ``window`` rows"""
+    if window < 2:
+        raise ValueError("window must be >= 2")
+    returns = np.asarray(returns, dtype=np.float64)[-window:]
+    references = np.asarray(references, dtype=np.float64)[-window:]
+    shape = returns.shape[1:] + references.shape[1:]
+    if len(returns) < window:
+        return Comoments(*(np.full(shape, np.nan) for _ in range(3)))
+    x = returns.reshape(window, -1, 1)
+    y = references.reshape(window, 1, -1)
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+    statistics = _statistics(
+        (x * y).sum(axis=0), (x * x).sum(axis=0), (y * y).sum(axis=0), window
+    )
+    return Comoments(*(values.reshape(shape) for values in statistics))
+
+
+class RollingComoments:
+    """
+    Co-moments of the last ``window`` (returns, reference returns) rows,
+    updated in O(symbols x references) per row: sliding Welford updates of
+    the means, the sums of squares and the cross sums. Statistics are
+    (symbols x references) arrays, NaN until ``window`` rows are in.
+    """
+
+    __slots__ = (
+        "window",
+        "rows",
+        "mean_x",
+        "mean_y",
+        "squares_x",
+        "squares_y",
+        "cross",
+    )
+
+    def __init__(self, window: int, symbols: int = 1, references: int = 1):
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.window = window
+        self.rows: Deque[Tuple[np.ndarray, np.ndarray]] = deque()
+        self.mean_x = np.zeros(symbols)
+        self.mean_y = np.zeros(references)
+        self.squares_x = np.zeros(symbols)
+        self.squares_y = np.zeros(references)
+        self.cross = np.zeros((symbols, references))
+
+    @property
+    def ready(self) -> bool:
+        return len(self.rows) == self.window
+
+    def update(self, returns: Any, references: Any):
+        """Add one row: a return per symbol and per reference (or scalars)"""
+        x = np.asarray(returns, dtype=np.float64).reshape(self.mean_x.shape)
+        y = np.asarray(references, dtype=np.float64).reshape(self.mean_y.shape)
+        rows = self.rows
+        if len(rows) == self.window:
+            self._remove(*rows.popleft())
+        rows.append((x, y))
+        count = len(rows)
+        delta_x = x - self.mean_x
+        delta_y = y - self.mean_y
+        self.mean_x = self.mean_x + delta_x / count
+        self.mean_y = self.mean_y + delta_y / count
+        self.squares_x = self.squares_x + delta_x * (x - self.mean_x)
+        self.squares_y = self.squares_y + delta_y * (y - self.mean_y)
+        self.cross = self.cross + np.outer(delta_x, y - self.mean_y)
+
+    def _remove(self, x: np.ndarray, y: np.ndarray):
+        # Inverse of the update that added (x, y); `window` >= 2 keeps count > 0
+        count = len(self.rows)
+        mean_x = self.mean_x - (x - self.mean_x) / count
+        mean_y = self.mean_y - (y - self.mean_y) / count
+        self.cross = self.cross - np.outer(x - mean_x, y - self.mean_y)
+        self.squares_x = self.squares_x - (x - self.mean_x) * (x - mean_x)
+        self.squares_y = self.squares_y - (y - self.mean_y) * (y - mean_y)
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+
+    def statistics(self) -> Comoments:
+        if not self.ready:
+            nan = np.full(self.cross.shape, np.nan)
+            return Comoments(nan, nan.copy(), nan.copy())
+        return _statistics(
+            self.cross,
+            np.maximum(self.squares_x, 0.0)[:, None],
+            np.maximum(self.squares_y, 0.0)[None, :],
+            self.window,
+        )
+
+    @property
+    def covariance(self) -> np.ndarray:
+        return self.statistics().covariance
+
+    @property
+    def correlation(self) -> np.ndarray:
+        return self.statistics().correlation
+
+    @property
+    def beta(self) -> np.ndarray:
+        return self.statistics().beta
+
+
+class CorrelationIndicator(Indicator):
+    """
+    Beta, correlation and covariance of the candles' log returns against the
+    log returns of the ``references`` columns (e.g. an index close joined to
+    the candles) over the last ``window`` returns. ``current_value`` is the
+    beta to the first reference; buy / sell flag a beta below ``low_beta`` /
+    above ``high_beta``.
+    """
+
+    def __init__(
+            self,
+            window: int = 60,
+            references: Sequence[str] = ("reference",),
+            low_beta: float = 0.5,
+            high_beta: float = 1.5,
+            enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+    ):
+        super().__init__(enabled, history, dtype)
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        if isinstance(references, str):
+            references = (references,)
+        if not references:
+            raise ValueError("at least one reference column is required")
+        self.__window = window
+        self.__references = tuple(references)
+        self.__low_beta = low_beta
+        self.__high_beta = high_beta
+        self.__comoments: Optional[Comoments] = None
+
+    def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
+        # `window` returns need one more close
+        if len(candles) <= self.__window:
+            logger.warning("Not enough candles for CorrelationIndicator")
+            self.__comoments = None
+            return
+
+        if not self._history.enabled:
+            candles = candles.tail(self.__window + 1)
+        returns = log_returns(column(candles, "close"))
+        references = log_returns(
+            np.column_stack([column(candles, name) for name in self.__references])
+        )
+        if self._history.enabled:
+            series = comoment_series(returns, references, self.__window, self._dtype)
+            self._history.assign(series.beta[self.__window - 1:, 0])
+            comoments = Comoments(*(values[-1] for values in series))
+        else:
+            comoments = latest_comoments(returns, references, self.__window)
+        self.__comoments = Comoments(
+            *(values.astype(np.float64) for values in comoments)
+        )
+        logger.info(
+            "Beta: %.4f, correlation: %.4f",
+            self.__comoments.beta[0],
+            self.__comoments.correlation[0],
+        )
+
+    def _primary_beta(self) -> Optional[float]:
+        if self.__comoments is None:
+            return None
+        beta = float(self.__comoments.beta[0])
+        return None if math.isnan(beta) else beta
+
+    def evaluate_sell_condition(self) -> bool:
+        beta = self._primary_beta()
+        if not self.is_enabled or beta is None:
+            return False
+        return beta > self.__high_beta
+
+    def evaluate_buy_condition(self) -> bool:
+        beta = self._primary_beta()
+        if not self.is_enabled or beta is None:
+            return False
+        return beta < self.__low_beta
+
+    def _by_reference(self, values: Optional[np.ndarray]) -> Dict[str, float]:
+        if values is None:
+            return {}
+        return dict(zip(self.__references, values.tolist()))
+
+    @property
+    def current_value(self) -> float:
+        """Return the beta to the first reference"""
+        beta = self._primary_beta()
+        return 0.0 if beta is None else beta
+
+    @property
+    def beta(self) -> Dict[str, float]:
+        """Return the beta to each reference"""
+        comoments = self.__comoments
+        return self._by_reference(None if comoments is None else comoments.beta)
+
+    @property
+    def correlation(self) -> Dict[str, float]:
+        """Return the correlation with each reference"""
+        comoments = self.__comoments
+        return self._by_reference(None if comoments is None else comoments.correlation)
+
+    @property
+    def covariance(self) -> Dict[str, float]:
+        """Return the covariance with each reference"""
+        comoments = self.__comoments
+        return self._by_reference(None if comoments is None else comoments.covariance)
+
+    @property
+    def window(self) -> int:
+        """Return the number of returns in the window"""
+        return self.__window
@@ -1,7 +1,212 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import DataFrame
 
-from python_trading_indicators.indicator import Indicator
-from python_trading_indicators.tools.logger import logger
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    TimeWindowState,
+    candle_timestamps,
+    column,
+    time_window_series,
+    window_seconds,
+    window_start,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.tools.logger import get_logger
+from python_trading_indicators.volume import (
+    METHODS as VOLUME_METHODS,
+    VolumeBaseline,
+    latest_volume_confirmed,
+    volume_confirmed_series,
+)
+
+logger = get_logger("drop")
+
+
+def drop_series(
+        closes: Any,
+        volumes: Any,
+        drop_percentage: float = 5,
+        lookback_period: int = 5,
+        volume_threshold: float = 1.5,
+        dtype: Any = np.float64,
+        volume_method: str = "mean",
+) -> np.ndarray:
+    """
+    ``SuddenPriceDropIndicator`` value (1.0 for a volume-confirmed drop, else
+    0.0) for every bar from index ``lookback_period - 1`` on
+    """
+    closes = np.asarray(closes, dtype=dtype)
+    volumes = np.asarray(volumes, dtype=dtype)
+    if len(closes) < lookback_period:
+        return np.empty(0, dtype=dtype)
+    max_closes = sliding_window_view(closes, lookback_period).max(axis=-1)
+    drops = closes[lookback_period - 1:] / max_closes - 1 < -drop_percentage / 100
+    confirmed = volume_confirmed_series(
+        volumes, lookback_period - 1, volume_threshold, volume_method
+    )
+    return (drops & confirmed[lookback_period - 1:]).astype(dtype)
+
+
+class DropState(TimeWindowState):
+    __slots__ = ("max_closes", "volumes", "drop_detected", "volume_confirmed")
+
+    def __init__(
+            self,
+            lookback_period: int,
+            window: Optional[float] = None,
+            volume_method: str = "mean",
+    ):
+        super().__init__()
+        # Monotonic deque of (bar number, close) for the rolling maximum,
+        # (timestamp, close) with a time window
+        self.max_closes: Deque[Tuple[float, float]] = deque()
+        self.volumes = VolumeBaseline(
+            lookback_period - 1, volume_method, timed=window is not None
+        )
+        self.drop_detected = False
+        self.volume_confirmed = False
+
+
+@dataclass(frozen=True)
+class DropConfig(IndicatorConfig):
+    """
+    With a time ``window`` (seconds) the maximum close and the volume baseline
+    cover the bars of the last ``window`` seconds instead of
+    ``lookback_period`` bars, and signals start once the bars seen span a whole
+    window
+    """
+
+    drop_percentage: float = 5
+    lookback_period: int = 5
+    volume_threshold: float = 1.5
+    window: Optional[float] = None
+    volume_method: str = "mean"
+
+    def __post_init__(self):
+        if self.lookback_period < 1:
+            raise ValueError("lookback_period must be >= 1")
+        if self.volume_method not in VOLUME_METHODS:
+            raise ValueError(f"volume_method must be one of {VOLUME_METHODS}")
+        object.__setattr__(self, "window", window_seconds(self.window))
+
+    def new_state(self) -> DropState:
+        return DropState(self.lookback_period, self.window, self.volume_method)
+
+    def compute(self, candles: Any) -> DropState:
+        closes = column(candles, "close")
+        volumes = column(candles, "volume")
+        state = self.new_state()
+        if self.window is not None:
+            if not len(closes):
+                return state
+            timestamps = candle_timestamps(candles)
+            start = window_start(timestamps, self.window)
+            state.bars = start
+            state.first_timestamp = float(timestamps[0])
+            for close, volume, timestamp in zip(
+                    closes[start:].tolist(),
+                    volumes[start:].tolist(),
+                    timestamps[start:].tolist(),
+            ):
+                self._push(state, close, volume, timestamp)
+            return state
+        # Only the last `lookback_period` bars can influence the state
+        start = max(len(closes) - self.lookback_period, 0)
+        state.bars = start
+        for close, volume in zip(closes[start:], volumes[start:]):
+            self._push(state, float(close), float(volume))
+        return state
+
+    def update(self, state: DropState, bar: Bar) -> DropState:  # type: ignore[override]
+        self._push(state, bar.close, bar.volume, bar.timestamp)
+        return state
+
+    def peek(self, state: DropState, bar: Bar) -> IndicatorSnapshot:  # type: ignore[override]
+        if self.window is not None:
+            return self._peek_window(state, bar)
+        bars = state.bars + 1
+        if bars < self.lookback_period:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, bars)
+        # Rolling maximum once the bar is added: the front of the monotonic
+        # deque, or the next entry if the front leaves the window
+        max_closes = state.max_closes
+        max_close = bar.close
+        if max_closes:
+            index, front = max_closes[0]
+            if index <= bars - self.lookback_period:
+                front = max_closes[1][1] if len(max_closes) > 1 else bar.close
+            max_close = max(front, bar.close)
+        drop_detected, volume_confirmed = self._signals(
+            state, bar.close, max_close, bar.volume
+        )
+        return self._reading(drop_detected, volume_confirmed, bars)
+
+    def _peek_window(self, state: DropState, bar: Bar) -> IndicatorSnapshot:
+        # Skip the entries the window would expire instead of popping them
+        cutoff, ready = state.preview(bar.timestamp, self.window)  # type: ignore[arg-type]
+        bars = state.bars + 1
+        if not ready:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, bars)
+        max_close = bar.close
+        for timestamp, close in state.max_closes:
+            if timestamp > cutoff:
+                max_close = max(close, bar.close)
+                break
+        drop_detected = bar.close / max_close - 1 < -self.drop_percentage / 100
+        volume_confirmed = state.volumes.confirms(bar.volume, self.volume_threshold, cutoff)
+        return self._reading(drop_detected, volume_confirmed, bars)
+
+    def _push(
+            self,
+            state: DropState,
+            close: float,
+            volume: float,
+            timestamp: Optional[float] = None,
+    ):
+        state.bars += 1
+        if self.window is None:
+            key: float = state.bars
+            cutoff: float = state.bars - self.lookback_period
+            ready = state.bars >= self.lookback_period
+        else:
+            cutoff = state.advance(timestamp, self.window)
+            key = state.timestamp  # type: ignore[assignment]
+            ready = state.covers(self.window)
+            state.volumes.expire(cutoff)
+        max_closes = state.max_closes
+        while max_closes and max_closes[-1][1] <= close:
+            max_closes.pop()
+        max_closes.append((key, close))
+        while max_closes[0][0] <= cutoff:
+            max_closes.popleft()
+        if ready:
+            state.drop_detected, state.volume_confirmed = self._signals(
+                state, close, max_closes[0][1], volume
+            )
+            state.value, state.buy, state.sell, _ = self._reading(
+                state.drop_detected, state.volume_confirmed, state.bars
+            )
+            state.ready = True
+        state.volumes.push(volume, state.timestamp)
+
+    def _signals(
+            self, state: DropState, close: float, max_close: float, volume: float
+    ) -> Tuple[bool, bool]:
+        drop_detected = close / max_close - 1 < -self.drop_percentage / 100
+        return drop_detected, state.volumes.confirms(volume, self.volume_threshold)
+
+    @staticmethod
+    def _reading(
+            drop_detected: bool, volume_confirmed: bool, sequence: int
+    ) -> IndicatorSnapshot:
+        sell = drop_detected and volume_confirmed
+        return IndicatorSnapshot(1.0 if sell else 0.0, not drop_detected, sell, sequence)
 
 
 class SuddenPriceDropIndicator(Indicator):
@@ -12,16 +217,28 @@ class SuddenPriceDropIndicator(Indicator):
             lookback_period: int = 5,
             volume_threshold: float = 1.5,
             enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+            window: Any = None,
+            volume_method: str = "mean",
     ):
-        super().__init__(enabled)
+        super().__init__(enabled, history, dtype)
+        if volume_method not in VOLUME_METHODS:
+            raise ValueError(f"volume_method must be one of {VOLUME_METHODS}")
         self.__drop_percentage = drop_percentage / 100
         self.__lookback_period = lookback_period
         self.__volume_threshold = volume_threshold
+        self.__window = window_seconds(window)
+        self.__volume_method = volume_method
         self.__drop_detected = False
         self.__volume_confirmed = False
         self.__insufficient_data = True
 
     def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
+        if self.__window is not None:
+            self._compute_window(candles)
+            return
         if len(candles) < self.__lookback_period:
             logger.warning("Not enough candles for SuddenPriceDropIndicator")
             self.__drop_detected = False
@@ -30,6 +247,18 @@ class SuddenPriceDropIndicator(Indicator):
             return
 
         self.__insufficient_data = False
+        if self._history.enabled:
+            self._history.assign(
+                drop_series(
+                    candles["close"],
+                    candles["volume"],
+                    self.__drop_percentage * 100,
+                    self.__lookback_period,
+                    self.__volume_threshold,
+                    self._dtype,
+                    self.__volume_method,
+                )
+            )
         closes = candles["close"]
         recent_closes = closes.tail(self.__lookback_period)
         current_close = recent_closes.iloc[-1]
@@ -39,22 +268,40 @@ class SuddenPriceDropIndicator(Indicator):
             (current_close / max_close - 1) < -self.__drop_percentage
         )
 
-        avg_volume = (
-            candles["volume"].iloc[-self.__lookback_period: -1].mean()
-            if len(candles) > 1
-            else 0
+        self.__volume_confirmed = latest_volume_confirmed(
+            candles["volume"],
+            self.__lookback_period - 1,
+            self.__volume_threshold,
+            self.__volume_method,
         )
-        latest_volume = candles["volume"].iloc[-1]
-        self.__volume_confirmed = (
-            bool(latest_volume > avg_volume * self.__volume_threshold)
-            if avg_volume > 0
-            else False
+
+        logger.info(
+            "SuddenPriceDrop: drop_detected=%s, current_close=%.2f, "
+            "max_close=%.2f, volume_confirmed=%s",
+            self.__drop_detected,
+            current_close,
+            max_close,
+            self.__volume_confirmed,
         )
 
+    def _compute_window(self, candles: DataFrame):
+        config = self.config
+        state = config.compute(candles)
+        self.__insufficient_data = not state.covers(config.window)  # type: ignore[arg-type]
+        if self.__insufficient_data:
+            logger.warning("Not enough candles for SuddenPriceDropIndicator")
+            self.__drop_detected = False
+            self.__volume_confirmed = False
+            return
+        if self._history.enabled:
+            self._history.assign(time_window_series(config, candles))
+        self.__drop_detected = state.drop_detected
+        self.__volume_confirmed = state.volume_confirmed
         logger.info(
-            f"SuddenPriceDrop: drop_detected={self.__drop_detected}, "
-            f"current_close={current_close:.2f}, max_close={max_close:.2f}, "
-            f"volume_confirmed={self.__volume_confirmed}"
+            "SuddenPriceDrop: drop_detected=%s, max_close=%.2f, volume_confirmed=%s",
+            self.__drop_detected,
+            state.max_closes[0][1],
+            self.__volume_confirmed,
         )
 
     def evaluate_sell_condition(self) -> bool:
@@ -78,3 +325,19 @@ class SuddenPriceDropIndicator(Indicator):
     def period(self) -> int:
         """Return the drop detection lookback period"""
         return self.__lookback_period
+
+    @property
+    def window(self) -> Optional[float]:
+        """Return the time window in seconds, or None for a bar-count lookback"""
+        return self.__window
+
+    @property
+    def config(self) -> DropConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return DropConfig(
+            round(self.__drop_percentage * 100, 12),
+            self.__lookback_period,
+            self.__volume_threshold,
+            self.__window,
+            self.__volume_method,
+        )
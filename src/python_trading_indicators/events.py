@@ -0,0 +1,175 @@
+"""
+Signal transition events.
+
+Instead of polling every indicator of every symbol on each bar, consumers
+receive an event only when an indicator's signal changes. A signal is the
+two-bit code ``BUY | SELL`` (0 = no signal); an event records the code before
+and after the change. Every signal starts at 0, so the first bar with a signal
+emits an event too.
+
+``SignalEdgeDetector`` does this in streaming mode, one observation at a
+time. ``series_events`` and ``matrix_events`` do it vectorized over whole
+signal series and return compact structured arrays.
+"""
+
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from python_trading_indicators.config import IndicatorState
+from python_trading_indicators.indicator import Indicator
+from python_trading_indicators.signals import BUY, SELL, SignalMatrix
+
+EVENT_DTYPE = np.dtype(
+    [
+        ("bar", "<i8"),
+        ("symbol", "<i4"),
+        ("indicator", "u1"),
+        ("previous", "u1"),
+        ("current", "u1"),
+    ]
+)
+
+
+def signal_code(buy: bool, sell: bool) -> int:
+    return (BUY if buy else 0) | (SELL if sell else 0)
+
+
+class SignalEvent(NamedTuple):
+    """One indicator's signal changed from ``previous`` to ``current`` at ``bar``"""
+
+    symbol: str
+    indicator: str
+    bar: int
+    previous: int
+    current: int
+
+    @property
+    def buy(self) -> bool:
+        return bool(self.current & BUY)
+
+    @property
+    def sell(self) -> bool:
+        return bool(self.current & SELL)
+
+
+class SignalEdgeDetector:
+    """
+    Remembers the last signal of every (symbol, indicator) and queues an event
+    whenever an observation differs from it::
+
+        detector = SignalEdgeDetector()
+        for symbol, bar in new_bars.items():
+            detector.observe_state(symbol, "rsi", config.update(states[symbol], bar))
+        for event in detector.drain():
+            ...
+    """
+
+    def __init__(self):
+        self.__signals: Dict[Tuple[str, str], int] = {}
+        self.__events: List[SignalEvent] = []
+
+    def observe(
+            self, symbol: str, indicator: str, bar: int, buy: bool, sell: bool
+    ) -> Optional[SignalEvent]:
+        """Record one signal; return (and queue) the event if it changed"""
+        key = (symbol, indicator)
+        current = signal_code(buy, sell)
+        previous = self.__signals.get(key, 0)
+        if current == previous:
+            return None
+        self.__signals[key] = current
+        event = SignalEvent(symbol, indicator, bar, previous, current)
+        self.__events.append(event)
+        return event
+
+    def observe_state(
+            self, symbol: str, indicator: str, state: IndicatorState, bar: Optional[int] = None
+    ) -> Optional[SignalEvent]:
+        """Record a streaming state; the bar index defaults to its last bar"""
+        return self.observe(
+            symbol, indicator, state.bars - 1 if bar is None else bar, state.buy, state.sell
+        )
+
+    def observe_states(
+            self, indicator: str, states: Mapping[str, IndicatorState], bar: Optional[int] = None
+    ) -> List[SignalEvent]:
+        """Record one indicator's states for many symbols"""
+        events = []
+        for symbol, state in states.items():
+            event = self.observe_state(symbol, indicator, state, bar)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def observe_indicator(
+            self, symbol: str, name: str, indicator: Indicator, bar: int
+    ) -> Optional[SignalEvent]:
+        """Record an ``Indicator``'s current buy/sell conditions"""
+        return self.observe(
+            symbol,
+            name,
+            bar,
+            indicator.check_buy_condition(),
+            indicator.check_sell_condition(),
+        )
+
+    def signal(self, symbol: str, indicator: str) -> int:
+        """Return the last recorded signal code"""
+        return self.__signals.get((symbol, indicator), 0)
+
+    def drain(self) -> List[SignalEvent]:
+        """Return and clear the queued events"""
+        events = self.__events
+        self.__events = []
+        return events
+
+    def reset(self):
+        self.__signals.clear()
+        self.__events.clear()
+
+
+def _events(codes: np.ndarray, indicator: int, start_bar: int) -> np.ndarray:
+    # `codes` is (bars x symbols); returns events ordered by bar then symbol
+    previous = np.zeros_like(codes)
+    previous[1:] = codes[:-1]
+    bars, symbols = np.nonzero(codes != previous)
+    events = np.empty(len(bars), dtype=EVENT_DTYPE)
+    events["bar"] = bars + start_bar
+    events["symbol"] = symbols
+    events["indicator"] = indicator
+    events["previous"] = previous[bars, symbols]
+    events["current"] = codes[bars, symbols]
+    return events
+
+
+def series_events(
+        buys: Any, sells: Any, indicator: int = 0, start_bar: int = 0
+) -> np.ndarray:
+    """
+    Transition events of buy/sell series, 1-D for one symbol or 2-D (bars x
+    symbols). ``indicator`` is stored in the events; ``start_bar`` is the bar
+    index of the first row.
+    """
+    buys = np.asarray(buys, dtype=bool)
+    sells = np.asarray(sells, dtype=bool)
+    codes = buys.astype(np.uint8) * BUY | sells.astype(np.uint8) * SELL
+    return _events(codes.reshape(len(codes), -1), indicator, start_bar)
+
+
+def matrix_events(
+        signals: SignalMatrix, indicators: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    """
+    Transition events of a ``SignalMatrix``, ordered by bar, symbol and
+    indicator position in ``signals.indicators``
+    """
+    names = signals.indicators if indicators is None else indicators
+    events = np.concatenate(
+        [
+            _events(signals.codes(name), signals.indicators.index(name), 0)
+            for name in names
+        ]
+        or [np.empty(0, dtype=EVENT_DTYPE)]
+    )
+    return np.sort(events, order=("bar", "symbol", "indicator"), kind="stable")
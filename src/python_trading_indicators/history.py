@@ -0,0 +1,96 @@
+"""
+Retention policy for indicator value series.
+
+``ValueHistory(0)`` keeps nothing, ``ValueHistory(n)`` keeps the last ``n``
+values in a ring buffer (float64 unless another dtype is given) and
+``ValueHistory(None)`` keeps everything, mirroring the ``size=None`` convention
+of the rolling helpers.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+
+class ValueHistory:
+    """
+    Retained indicator values, exposed as a read-only chronological view.
+
+    A bounded history writes into a buffer twice its size and slides the live
+    window back to the start when it reaches the end, so ``view()`` never
+    copies (and a view is only valid until the next write); an unbounded one
+    grows its buffer geometrically.
+    """
+
+    __slots__ = ("__size", "__data", "__end", "__count")
+
+    def __init__(self, size: Optional[int] = 0, dtype: Any = np.float64):
+        if size is not None and size < 0:
+            raise ValueError("history size must be >= 0 or None")
+        self.__size = size
+        self.__data = np.empty(0 if size is None else 2 * size, dtype=dtype)
+        self.__end = 0
+        self.__count = 0
+
+    @property
+    def size(self) -> Optional[int]:
+        return self.__size
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__data.dtype
+
+    @property
+    def enabled(self) -> bool:
+        return self.__size != 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def view(self) -> np.ndarray:
+        """
+        Read-only view of the retained values, oldest first. It aliases the
+        buffer, so later writes overwrite it: copy it to keep it.
+        """
+        view = self.__data[self.__end - self.__count: self.__end]
+        view.flags.writeable = False
+        return view
+
+    def clear(self):
+        self.__end = self.__count = 0
+
+    def _reserve(self, count: int):
+        data = self.__data
+        if self.__end + count <= len(data):
+            return
+        if self.__size is None:
+            grown = np.empty(max(2 * len(data), self.__end + count, 16), dtype=data.dtype)
+            grown[: self.__end] = data[: self.__end]
+            self.__data = grown
+            return
+        keep = min(self.__count, self.__size - count)
+        data[:keep] = data[self.__end - keep: self.__end]
+        self.__end = self.__count = keep
+
+    def extend(self, values: Any):
+        """Append values, dropping the oldest beyond ``size``"""
+        if self.__size == 0:
+            return
+        values = np.asarray(values, dtype=self.__data.dtype).ravel()
+        if self.__size is not None:
+            values = values[-self.__size:] if len(values) else values
+        count = len(values)
+        self._reserve(count)
+        self.__data[self.__end: self.__end + count] = values
+        self.__end += count
+        self.__count += count
+        if self.__size is not None:
+            self.__count = min(self.__count, self.__size)
+
+    def append(self, value: float):
+        self.extend((value,))
+
+    def assign(self, values: Any):
+        """Replace the contents with (the retained tail of) ``values``"""
+        self.clear()
+        self.extend(values)
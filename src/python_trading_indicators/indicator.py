@@ -1,13 +1,60 @@
+import functools
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from time import perf_counter_ns
+from typing import Any, NamedTuple, Optional
 
+import numpy as np
 from pandas import DataFrame
 
+from python_trading_indicators.history import ValueHistory
+from python_trading_indicators.tools.metrics import IndicatorStats
+
+
+class IndicatorSnapshot(NamedTuple):
+    """Immutable (value, buy, sell) triple published after each calculation"""
+
+    value: float
+    buy: bool
+    sell: bool
+    sequence: int = 0
+
+
+def _published(fget: Any) -> Any:
+    # A subclass's `current_value` getter, served from the published snapshot
+    # in concurrent mode; `__wrapped__` keeps the live getter
+    @functools.wraps(fget)
+    def current_value(self: "Indicator") -> Any:
+        if self._write_lock is not None:
+            return self._snapshot.value
+        return fget(self)
+
+    return current_value
+
 
 class Indicator(ABC):
 
-    def __init__(self, enabled: bool = True):
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        prop = cls.__dict__.get("current_value")
+        if isinstance(prop, property) and prop.fget is not None:
+            cls.current_value = property(  # type: ignore[method-assign]
+                _published(prop.fget), doc=prop.__doc__
+            )
+
+    def __init__(
+            self, enabled: bool = True, history: Optional[int] = 0, dtype: Any = np.float64
+    ):
         self.is_enabled = enabled
+        # Floating-point type of the series kernels and the history buffer
+        self._dtype = np.dtype(dtype)
+        # Indicator values kept from the last calculation: 0 = none,
+        # n = the last n, None = all
+        self._history = ValueHistory(history, self._dtype)
+        self._stats: Optional[IndicatorStats] = None
+        self._sequence = 0
+        self._write_lock: Optional[threading.Lock] = None
+        self._snapshot = IndicatorSnapshot(0.0, False, False)
 
     @abstractmethod
     def compute_indicator(self, candles: DataFrame):
@@ -19,20 +66,101 @@ class Indicator(ABC):
     def calculate(self, candles: DataFrame) -> bool:
         if not self.is_enabled:
             return True
-        else:
+        lock = self._write_lock
+        if lock is None:
+            self._compute(candles)
+            return True  # Return True to indicate that calculation has been performed
+        with lock:  # Serializes writers only; readers use the published snapshot
+            self._compute(candles)
+            self._snapshot = self._build_snapshot()
+        return True
+
+    def _compute(self, candles: DataFrame):
+        self._sequence += 1
+        stats = self._stats
+        if stats is None:
             self.compute_indicator(
                 candles
             )  # Call the specific indicator computation method
-            return True  # Return True to indicate that calculation has been performed
+            return
+        start = perf_counter_ns()
+        self.compute_indicator(candles)
+        stats.record(perf_counter_ns() - start, len(candles))
+
+    def _build_snapshot(self) -> IndicatorSnapshot:
+        # The live value, not the published one
+        prop = type(self).current_value
+        fget = getattr(prop, "fget", None)
+        value = getattr(fget, "__wrapped__", fget)(self) if fget else self.current_value
+        return IndicatorSnapshot(
+            float(value) if value is not None else 0.0,
+            bool(self.evaluate_buy_condition()),
+            bool(self.evaluate_sell_condition()),
+            self._sequence,
+        )
+
+    def history(self) -> np.ndarray:
+        """
+        Return the retained indicator values of the last calculation, oldest
+        first, as a read-only view (empty unless ``history`` was set). The view
+        shares the history buffer and is only valid until the next calculation
+        overwrites it; copy it to keep the values.
+        """
+        return self._history.view()
+
+    def enable_concurrent_reads(self):
+        """
+        Switch to snapshot publication: every calculation ends with a single
+        reference swap to a new immutable ``IndicatorSnapshot``, and
+        ``check_buy_condition`` / ``check_sell_condition`` / ``current_value`` /
+        ``snapshot`` read it without locking. Each of these reads is consistent on
+        its own; read ``snapshot`` once to get a value and signals from the same
+        calculation.
+        """
+        if self._write_lock is None:
+            self._snapshot = self._build_snapshot()
+            self._write_lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> IndicatorSnapshot:
+        """Return a consistent (value, buy, sell, sequence) view of the indicator"""
+        if self._write_lock is not None:
+            return self._snapshot
+        return self._build_snapshot()
+
+    def enable_stats(
+            self, name: Optional[str] = None, significant_bits: int = 5
+    ) -> IndicatorStats:
+        """
+        Start collecting call counts, compute latency and rows processed.
+        Returns the (possibly already existing) stats object.
+        """
+        if self._stats is None:
+            self._stats = IndicatorStats(
+                name or type(self).__name__, significant_bits
+            )
+        return self._stats
+
+    def disable_stats(self):
+        self._stats = None
+
+    @property
+    def stats(self) -> Optional[IndicatorStats]:
+        """Return the collected stats, or None when instrumentation is disabled"""
+        return self._stats
 
     def check_sell_condition(self) -> bool:
         if not self.is_enabled:
             return False  # Disabled indicators provide no signal
+        if self._write_lock is not None:
+            return self._snapshot.sell
         return self.evaluate_sell_condition()
 
     def check_buy_condition(self) -> bool:
         if not self.is_enabled:
             return False  # Disabled indicators provide no signal
+        if self._write_lock is not None:
+            return self._snapshot.buy
         return self.evaluate_buy_condition()
 
     @abstractmethod
@@ -0,0 +1,206 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    column,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.smoothing import EMA, ema_series
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("macd")
+
+
+def macd_series(
+        closes: Any,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+        dtype: Any = np.float64,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line (fast EMA - slow EMA), signal line (EMA of the MACD line) and
+    histogram (MACD - signal) for every bar: NaN until the slow EMA, and then
+    the signal EMA, are seeded. ``closes`` may be 1-D or 2-D (bars x symbols).
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    line = ema_series(closes, fast) - ema_series(closes, slow)
+    signal_line = np.full(closes.shape, np.nan)
+    if len(closes) >= slow:
+        signal_line[slow - 1:] = ema_series(line[slow - 1:], signal)
+    return (
+        line.astype(dtype),
+        signal_line.astype(dtype),
+        (line - signal_line).astype(dtype),
+    )
+
+
+def _crosses(previous: Optional[float], histogram: float) -> Tuple[bool, bool]:
+    # Bullish / bearish crossover of the MACD and signal lines
+    if previous is None:
+        return False, False
+    return previous <= 0 < histogram, previous >= 0 > histogram
+
+
+class MACDState(IndicatorState):
+    __slots__ = ("fast_ema", "slow_ema", "signal_ema", "macd", "signal", "histogram")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__()
+        self.fast_ema = EMA(fast)
+        self.slow_ema = EMA(slow)
+        # EMA of the MACD line, fed once the slow EMA is seeded
+        self.signal_ema = EMA(signal)
+        self.macd: Optional[float] = None
+        self.signal: Optional[float] = None
+        self.histogram: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class MACDConfig(IndicatorConfig):
+    """
+    ``value`` is the MACD line; ``buy`` / ``sell`` are set on the bar where it
+    crosses above / below the signal line.
+    """
+
+    fast: int = 12
+    slow: int = 26
+    signal: int = 9
+
+    def __post_init__(self):
+        if min(self.fast, self.slow, self.signal) < 1:
+            raise ValueError("periods must be >= 1")
+        if self.fast >= self.slow:
+            raise ValueError("fast must be < slow")
+
+    def new_state(self) -> MACDState:
+        return MACDState(self.fast, self.slow, self.signal)
+
+    def compute(self, candles: Any) -> MACDState:
+        closes = column(candles, "close")
+        state = self.new_state()
+        state.bars = len(closes)
+        state.fast_ema.load(closes)
+        state.slow_ema.load(closes)
+        if len(closes) < self.slow:
+            return state
+        line, _, histogram = macd_series(closes, self.fast, self.slow, self.signal)
+        state.signal_ema.load(line[self.slow - 1:])
+        if len(closes) >= 2 and not np.isnan(histogram[-2]):
+            state.histogram = float(histogram[-2])
+        self._publish(state, float(line[-1]), state.signal_ema.value)
+        return state
+
+    def update(self, state: MACDState, bar: Bar) -> MACDState:  # type: ignore[override]
+        state.bars += 1
+        fast = state.fast_ema.update(bar.close)
+        slow = state.slow_ema.update(bar.close)
+        if state.slow_ema.ready:
+            line = fast - slow
+            self._publish(state, line, state.signal_ema.update(line))
+        return state
+
+    def peek(self, state: MACDState, bar: Bar) -> IndicatorSnapshot:  # type: ignore[override]
+        sequence = state.bars + 1
+        if state.slow_ema.count + 1 < self.slow:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, sequence)
+        line = state.fast_ema.peek(bar.close) - state.slow_ema.peek(bar.close)
+        signal = state.signal_ema.peek(line)
+        value, buy, sell = self._reading(state, line, signal)
+        return IndicatorSnapshot(value, buy, sell, sequence)
+
+    def _reading(
+            self, state: MACDState, line: float, signal: float
+    ) -> Tuple[float, bool, bool]:
+        if np.isnan(signal):
+            return line, False, False
+        return (line,) + _crosses(state.histogram, line - signal)
+
+    def _publish(self, state: MACDState, line: float, signal: float):
+        state.value, state.buy, state.sell = self._reading(state, line, signal)
+        state.ready = True
+        state.macd = line
+        if not np.isnan(signal):
+            state.signal = signal
+            state.histogram = line - signal
+
+
+class MACDIndicator(Indicator):
+
+    def __init__(
+            self,
+            fast: int = 12,
+            slow: int = 26,
+            signal: int = 9,
+            enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+    ):
+        super().__init__(enabled, history, dtype)
+        MACDConfig(fast, slow, signal)  # Validates the periods
+        self.__fast = fast
+        self.__slow = slow
+        self.__signal = signal
+        self.__macd: Optional[float] = None
+        self.__signal_value: Optional[float] = None
+        self.__histogram: Optional[float] = None
+        self.__crosses = (False, False)
+
+    def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
+        self.__signal_value = self.__histogram = None
+        self.__crosses = (False, False)
+        if len(candles) < self.__slow:
+            logger.warning("Not enough candles for MACDIndicator")
+            self.__macd = None
+            return
+
+        line, signal, histogram = macd_series(
+            column(candles, "close"), self.__fast, self.__slow, self.__signal, self._dtype
+        )
+        self._history.assign(line[self.__slow - 1:])
+        self.__macd = float(line[-1])
+        if not np.isnan(histogram[-1]):
+            self.__signal_value = float(signal[-1])
+            self.__histogram = float(histogram[-1])
+            if not np.isnan(histogram[-2]):
+                self.__crosses = _crosses(float(histogram[-2]), self.__histogram)
+        logger.info("MACD: %.4f, histogram=%s", self.__macd, self.__histogram)
+
+    def evaluate_sell_condition(self) -> bool:
+        if not self.is_enabled or self.__macd is None:
+            return False
+        return self.__crosses[1]
+
+    def evaluate_buy_condition(self) -> bool:
+        if not self.is_enabled or self.__macd is None:
+            return False
+        return self.__crosses[0]
+
+    @property
+    def current_value(self) -> float:
+        """Return the current MACD line value"""
+        if self.__macd is None:
+            return 0.0
+        return self.__macd
+
+    @property
+    def signal(self) -> Optional[float]:
+        """Return the current signal line value"""
+        return self.__signal_value
+
+    @property
+    def histogram(self) -> Optional[float]:
+        """Return the current MACD - signal histogram value"""
+        return self.__histogram
+
+    @property
+    def config(self) -> MACDConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return MACDConfig(self.__fast, self.__slow, self.__signal)
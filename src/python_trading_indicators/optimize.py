@@ -0,0 +1,278 @@
+"""
+Threshold grid search and walk-forward evaluation.
+
+A grid computes its indicator series once per window and evaluates every
+threshold combination by broadcasting the comparisons against the grid axes.
+Each combination is scored as a long-only strategy: enter on a buy signal at
+the bar's close, exit on a sell signal (a sell wins when both fire), hold in
+between::
+
+    grid = RSIThresholdGrid(period=14, buy_thresholds=range(20, 45, 5),
+                            sell_thresholds=range(55, 85, 5))
+    result = grid.evaluate(candles)
+    result.best("total_return")          # {"buy_threshold": ..., "sell_threshold": ...}
+
+    with ProcessPoolExecutor() as pool:
+        splits = walk_forward(grid, candles, train_size=2000, test_size=500,
+                              executor=pool)
+"""
+
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from python_trading_indicators.config import column
+from python_trading_indicators.rsi import rsi_series
+from python_trading_indicators.vix import vix_series
+from python_trading_indicators.volume import volume_confirmed_series
+
+METRICS = ("buy_signals", "sell_signals", "trades", "total_return", "exposure")
+
+
+class GridResult(NamedTuple):
+    """Per-combination statistics; each array has one axis per parameter"""
+
+    parameters: Tuple[str, ...]
+    values: Tuple[np.ndarray, ...]
+    buy_signals: np.ndarray
+    sell_signals: np.ndarray
+    trades: np.ndarray
+    total_return: np.ndarray
+    exposure: np.ndarray
+
+    def best(self, metric: str = "total_return") -> Dict[str, float]:
+        """Return the parameter combination maximizing ``metric``"""
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}")
+        scores = getattr(self, metric)
+        position = np.unravel_index(np.nanargmax(scores), scores.shape)
+        return {
+            name: float(values[i])
+            for name, values, i in zip(self.parameters, self.values, position)
+        }
+
+    def at(self, **parameters: float) -> Dict[str, float]:
+        """Return the statistics of one combination"""
+        position = tuple(
+            int(np.flatnonzero(values == parameters[name])[0])
+            for name, values in zip(self.parameters, self.values)
+        )
+        return {metric: float(getattr(self, metric)[position]) for metric in METRICS}
+
+
+def _log_returns(closes: np.ndarray) -> np.ndarray:
+    # Return earned by holding from bar t to bar t + 1, at index t
+    returns = np.zeros(len(closes))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns[:-1] = np.log(closes[1:] / closes[:-1])
+    return returns
+
+
+def _last_signal(signals: np.ndarray, start: int) -> np.ndarray:
+    """Index of the latest signal at or before every bar (-1 if none yet)"""
+    index = np.where(signals, np.arange(signals.shape[-1]), -1)
+    index[..., :start] = -1
+    return np.maximum.accumulate(index, axis=-1)
+
+
+def _score(
+        last_buy: np.ndarray, last_sell: np.ndarray, returns: np.ndarray, start: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(trades, total_return, exposure) of long positions, broadcast over grid axes"""
+    position = (last_buy > last_sell)[..., start:]
+    held = position[..., :-1]
+    trades = (position[..., 1:] & ~position[..., :-1]).sum(axis=-1) + position[..., 0]
+    total_return = np.expm1(held @ returns[start:-1])
+    exposure = held.mean(axis=-1) if held.shape[-1] else np.zeros(held.shape[:-1])
+    return trades, total_return, exposure
+
+
+def _padded(series: np.ndarray, length: int) -> np.ndarray:
+    # Align a series that starts at bar `length - len(series)` with the candles
+    return np.concatenate([np.full(length - len(series), np.nan), series])
+
+
+@dataclass(frozen=True)
+class RSIThresholdGrid:
+    """All (buy_threshold, sell_threshold) pairs for one RSI period"""
+
+    period: int = 14
+    buy_thresholds: Tuple[float, ...] = (20, 25, 30, 35, 40)
+    sell_thresholds: Tuple[float, ...] = (60, 65, 70, 75, 80)
+
+    def __post_init__(self):
+        object.__setattr__(self, "buy_thresholds", tuple(self.buy_thresholds))
+        object.__setattr__(self, "sell_thresholds", tuple(self.sell_thresholds))
+
+    @property
+    def warmup(self) -> int:
+        return self.period
+
+    def evaluate(self, candles: Any, start: int = 0) -> GridResult:
+        """Score every combination on the bars from ``start`` on"""
+        closes = column(candles, "close")
+        rsi = _padded(rsi_series(closes, self.period), len(closes))
+        buy_thresholds = np.asarray(self.buy_thresholds, dtype=np.float64)
+        sell_thresholds = np.asarray(self.sell_thresholds, dtype=np.float64)
+        buys = rsi < buy_thresholds[:, None]  # (buy thresholds, bars)
+        sells = rsi > sell_thresholds[:, None]  # (sell thresholds, bars)
+        last_buy = _last_signal(buys, start)
+        last_sell = _last_signal(sells, start)
+        returns = _log_returns(closes)
+        shape = (len(buy_thresholds), len(sell_thresholds))
+        trades = np.empty(shape, dtype=np.int64)
+        total_return = np.empty(shape)
+        exposure = np.empty(shape)
+        # One buy threshold at a time keeps memory at (sell thresholds x bars)
+        for i in range(len(buy_thresholds)):
+            trades[i], total_return[i], exposure[i] = _score(
+                last_buy[i], last_sell, returns, start
+            )
+        return GridResult(
+            ("buy_threshold", "sell_threshold"),
+            (buy_thresholds, sell_thresholds),
+            np.broadcast_to(buys[:, start:].sum(axis=1)[:, None], shape),
+            np.broadcast_to(sells[:, start:].sum(axis=1)[None, :], shape),
+            trades,
+            total_return,
+            exposure,
+        )
+
+    def restrict(self, buy_threshold: float, sell_threshold: float) -> "RSIThresholdGrid":
+        return replace(
+            self, buy_thresholds=(buy_threshold,), sell_thresholds=(sell_threshold,)
+        )
+
+
+@dataclass(frozen=True)
+class VIXThresholdGrid:
+    """Every panic threshold for one VIX period and volume threshold"""
+
+    period: int = 14
+    panic_thresholds: Tuple[float, ...] = (20, 25, 30, 35, 40)
+    volume_threshold: float = 1.5
+
+    def __post_init__(self):
+        object.__setattr__(self, "panic_thresholds", tuple(self.panic_thresholds))
+
+    @property
+    def warmup(self) -> int:
+        return self.period
+
+    def evaluate(self, candles: Any, start: int = 0) -> GridResult:
+        """Score every panic threshold on the bars from ``start`` on"""
+        closes = column(candles, "close")
+        vix = _padded(vix_series(closes, self.period), len(closes))
+        confirmed = volume_confirmed_series(
+            column(candles, "volume"), self.period - 1, self.volume_threshold
+        )
+        panic = np.asarray(self.panic_thresholds, dtype=np.float64)[:, None]
+        buys = vix < panic - 5
+        sells = (vix > panic) & confirmed
+        trades, total_return, exposure = _score(
+            _last_signal(buys, start), _last_signal(sells, start), _log_returns(closes), start
+        )
+        return GridResult(
+            ("panic_threshold",),
+            (panic[:, 0],),
+            buys[:, start:].sum(axis=1),
+            sells[:, start:].sum(axis=1),
+            trades,
+            total_return,
+            exposure,
+        )
+
+    def restrict(self, panic_threshold: float) -> "VIXThresholdGrid":
+        return replace(self, panic_thresholds=(panic_threshold,))
+
+
+class WalkForwardSplit(NamedTuple):
+    """Parameters chosen on a training window and their out-of-sample statistics"""
+
+    train_start: int
+    test_start: int
+    test_end: int
+    parameters: Dict[str, float]
+    in_sample: Dict[str, float]
+    out_of_sample: Dict[str, float]
+
+
+def _walk_forward_split(
+        grid: Any,
+        candles: Dict[str, np.ndarray],
+        offset: int,
+        train_size: int,
+        test_size: int,
+        metric: str,
+) -> WalkForwardSplit:
+    # `candles` holds warmup + train + test bars, starting at bar `offset`
+    warmup = len(candles["close"]) - train_size - test_size
+    train = {name: values[: warmup + train_size] for name, values in candles.items()}
+    in_sample = grid.evaluate(train, start=warmup)
+    parameters = in_sample.best(metric)
+    out_of_sample = grid.restrict(**parameters).evaluate(
+        candles, start=warmup + train_size
+    )
+    return WalkForwardSplit(
+        offset + warmup,
+        offset + warmup + train_size,
+        offset + warmup + train_size + test_size,
+        parameters,
+        in_sample.at(**parameters),
+        out_of_sample.at(**parameters),
+    )
+
+
+def _windows(
+        length: int, warmup: int, train_size: int, test_size: int, step: int
+) -> Iterable[Tuple[int, int]]:
+    train_start = warmup
+    while train_start + train_size + test_size <= length:
+        yield train_start - warmup, train_start + train_size + test_size
+        train_start += step
+
+
+def walk_forward(
+        grid: Any,
+        candles: Any,
+        train_size: int,
+        test_size: int,
+        step: Optional[int] = None,
+        metric: str = "total_return",
+        executor: Optional[Executor] = None,
+) -> List[WalkForwardSplit]:
+    """
+    Pick the best combination of ``grid`` on each training window and score it
+    on the following ``test_size`` bars. Windows advance by ``step`` bars
+    (``test_size`` by default) and are independent, so they are spread across
+    ``executor`` when given (a ``ProcessPoolExecutor`` for CPU parallelism).
+    """
+    if train_size < 2 or test_size < 2:
+        raise ValueError("train_size and test_size must be >= 2")
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}")
+    step = test_size if step is None else step
+    if step < 1:
+        raise ValueError("step must be >= 1")
+    columns = {
+        name: column(candles, name) for name in ("close", "volume") if name in candles
+    }
+    windows = list(
+        _windows(len(columns["close"]), grid.warmup, train_size, test_size, step)
+    )
+    tasks = [
+        (
+            grid,
+            {name: values[begin:end] for name, values in columns.items()},
+            begin,
+            train_size,
+            test_size,
+            metric,
+        )
+        for begin, end in windows
+    ]
+    if executor is None:
+        return [_walk_forward_split(*task) for task in tasks]
+    return list(executor.map(_walk_forward_split, *zip(*tasks))) if tasks else []
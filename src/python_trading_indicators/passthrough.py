@@ -1,7 +1,9 @@
 from pandas import DataFrame
 
 from python_trading_indicators.indicator import Indicator
-from python_trading_indicators.tools.logger import logger
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("passthrough")
 
 
 class PassThroughIndicator(Indicator):
@@ -0,0 +1,223 @@
+"""
+Vectorized candlestick pattern engine.
+
+``detect_patterns`` evaluates every pattern for every bar in one pass over the
+OHLC arrays and returns one ``uint16`` code per bar, a bitwise OR of the
+pattern flags below. Patterns are purely geometric: the prior trend a hammer
+or a star is meant to reverse is left to the caller (e.g. combine with RSI).
+``PatternConfig`` is the streaming variant and only keeps the last
+``PATTERN_BARS`` bars::
+
+    codes = detect_patterns(opens, highs, lows, closes)
+    hammers = np.flatnonzero(codes & HAMMER)
+    pattern_names(codes[-1])             # ["doji", "inside_bar"]
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, List, Tuple
+
+import numpy as np
+
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    column,
+)
+
+DOJI = 1 << 0
+HAMMER = 1 << 1
+SHOOTING_STAR = 1 << 2
+BULLISH_ENGULFING = 1 << 3
+BEARISH_ENGULFING = 1 << 4
+MORNING_STAR = 1 << 5
+EVENING_STAR = 1 << 6
+INSIDE_BAR = 1 << 7
+OUTSIDE_BAR = 1 << 8
+
+PATTERNS = {
+    "doji": DOJI,
+    "hammer": HAMMER,
+    "shooting_star": SHOOTING_STAR,
+    "bullish_engulfing": BULLISH_ENGULFING,
+    "bearish_engulfing": BEARISH_ENGULFING,
+    "morning_star": MORNING_STAR,
+    "evening_star": EVENING_STAR,
+    "inside_bar": INSIDE_BAR,
+    "outside_bar": OUTSIDE_BAR,
+}
+BULLISH = HAMMER | BULLISH_ENGULFING | MORNING_STAR
+BEARISH = SHOOTING_STAR | BEARISH_ENGULFING | EVENING_STAR
+# Bars a pattern can span (the stars)
+PATTERN_BARS = 3
+
+
+def pattern_names(code: int) -> List[str]:
+    """Names of the patterns set in one code"""
+    return [name for name, flag in PATTERNS.items() if int(code) & flag]
+
+
+def detect_patterns(
+        opens: Any,
+        highs: Any,
+        lows: Any,
+        closes: Any,
+        doji_ratio: float = 0.1,
+        shadow_ratio: float = 2.0,
+        star_ratio: float = 0.3,
+) -> np.ndarray:
+    """
+    Pattern codes (``uint16``) of every bar; inputs may be 1-D or 2-D
+    (bars x symbols).
+
+    - doji: body at most ``doji_ratio`` of the bar's range
+    - hammer / shooting star: a non-zero lower / upper shadow of at least
+      ``shadow_ratio`` bodies, the other shadow at most one body (never on a
+      flat bar)
+    - engulfing: body of the opposite colour to the previous bar's, and
+      covering it
+    - morning / evening star: a bearish / bullish bar, a small body (at most
+      ``star_ratio`` of the first) beyond the first body's midpoint, then a
+      bar of the other colour closing past that midpoint
+    - inside / outside bar: range strictly inside / outside the previous one
+    """
+    opens, highs, lows, closes = (
+        np.asarray(values, dtype=np.float64) for values in (opens, highs, lows, closes)
+    )
+    tops = np.maximum(opens, closes)
+    bottoms = np.minimum(opens, closes)
+    bodies = tops - bottoms
+    ranges = highs - lows
+    upper = highs - tops
+    lower = bottoms - lows
+    bullish = closes > opens
+    bearish = closes < opens
+
+    codes = np.zeros(closes.shape, dtype=np.uint16)
+    doji = (ranges > 0) & (bodies <= doji_ratio * ranges)
+    _mark(codes, doji, DOJI)
+    # A flat bar (zero range) has no shadows to speak of
+    shaped = ~doji & (ranges > 0)
+    _mark(
+        codes,
+        shaped & (lower > 0) & (lower >= shadow_ratio * bodies) & (upper <= bodies),
+        HAMMER,
+    )
+    _mark(
+        codes,
+        shaped & (upper > 0) & (upper >= shadow_ratio * bodies) & (lower <= bodies),
+        SHOOTING_STAR,
+    )
+    if len(closes) < 2:
+        return codes
+
+    # Two-bar patterns, marked on the second bar
+    now = slice(1, None)
+    before = slice(None, -1)
+    covers = (
+        (tops[now] >= tops[before])
+        & (bottoms[now] <= bottoms[before])
+        & (bodies[now] > bodies[before])
+    )
+    _mark(codes[now], bullish[now] & bearish[before] & covers, BULLISH_ENGULFING)
+    _mark(codes[now], bearish[now] & bullish[before] & covers, BEARISH_ENGULFING)
+    _mark(codes[now], (highs[now] < highs[before]) & (lows[now] > lows[before]), INSIDE_BAR)
+    _mark(
+        codes[now], (highs[now] > highs[before]) & (lows[now] < lows[before]), OUTSIDE_BAR
+    )
+    if len(closes) < 3:
+        return codes
+
+    # Three-bar stars: first bar, star and confirming bar, marked on the last
+    first = slice(None, -2)
+    star = slice(1, -1)
+    last = slice(2, None)
+    midpoints = (opens[first] + closes[first]) / 2
+    small = bodies[star] <= star_ratio * bodies[first]
+    _mark(
+        codes[last],
+        bearish[first]
+        & small
+        & (tops[star] < midpoints)
+        & bullish[last]
+        & (closes[last] > midpoints),
+        MORNING_STAR,
+    )
+    _mark(
+        codes[last],
+        bullish[first]
+        & small
+        & (bottoms[star] > midpoints)
+        & bearish[last]
+        & (closes[last] < midpoints),
+        EVENING_STAR,
+    )
+    return codes
+
+
+def _mark(codes: np.ndarray, mask: np.ndarray, flag: int):
+    # `codes` may be a view into the full code array
+    codes[mask] |= np.uint16(flag)
+
+
+class PatternState(IndicatorState):
+    __slots__ = ("recent", "code")
+
+    def __init__(self):
+        super().__init__()
+        # (open, high, low, close) of the last `PATTERN_BARS` bars
+        self.recent: Deque[Tuple[float, ...]] = deque(maxlen=PATTERN_BARS)
+        self.code = 0
+
+
+@dataclass(frozen=True)
+class PatternConfig(IndicatorConfig):
+    """
+    Streaming pattern detection. ``value`` is the latest bar's pattern code;
+    ``buy`` / ``sell`` are set by bullish / bearish reversal patterns (hammer,
+    engulfing, stars).
+    """
+
+    doji_ratio: float = 0.1
+    shadow_ratio: float = 2.0
+    star_ratio: float = 0.3
+
+    def new_state(self) -> PatternState:
+        return PatternState()
+
+    def compute(self, candles: Any) -> PatternState:
+        state = self.new_state()
+        columns = [
+            column(candles, name)[-PATTERN_BARS:]
+            for name in ("open", "high", "low", "close")
+        ]
+        state.bars = len(column(candles, "close")) - len(columns[3])
+        for row in zip(*(values.tolist() for values in columns)):
+            state.bars += 1
+            state.recent.append(row)
+        if state.recent:
+            self._publish(state)
+        return state
+
+    def update(self, state: PatternState, bar: Bar) -> PatternState:  # type: ignore[override]
+        state.bars += 1
+        state.recent.append((bar.open, bar.high, bar.low, bar.close))
+        self._publish(state)
+        return state
+
+    def _publish(self, state: PatternState):
+        # The last few bars through the vectorized engine keep both modes in step
+        code = int(
+            detect_patterns(
+                *np.array(state.recent).T,
+                doji_ratio=self.doji_ratio,
+                shadow_ratio=self.shadow_ratio,
+                star_ratio=self.star_ratio,
+            )[-1]
+        )
+        state.code = code
+        state.value = float(code)
+        state.buy = bool(code & BULLISH)
+        state.sell = bool(code & BEARISH)
+        state.ready = True
@@ -0,0 +1,227 @@
+"""
+Adaptive thresholds from rolling quantiles of an indicator's own values.
+
+Fixed levels such as RSI 30/70 or a VIX panic level of 30 do not carry over
+between assets. With ``adaptive=AdaptiveThresholds(...)`` the RSI and VIX
+indicators and configs compare each value against the ``lower`` / ``upper``
+quantiles of their last ``window`` values instead. Streaming states keep those
+values in a ``RollingQuantile`` (an indexable skip list, O(log n) per bar);
+``AdaptiveThresholds.series`` computes the levels of every bar at once::
+
+    config = RSIConfig(adaptive=AdaptiveThresholds(window=500, lower=0.1, upper=0.9))
+    lower, upper = config.adaptive.series(rsi_series(closes))
+"""
+
+import math
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+# Enough levels for O(log n) searches up to ~2**20 values
+_MAX_LEVELS = 20
+
+
+class _Node:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: float, levels: int):
+        self.value = value
+        self.next: List[Any] = [None] * levels
+        # Number of values skipped by each link, for rank lookups
+        self.width: List[int] = [1] * levels
+
+
+class _SkipList:
+    """
+    Sorted multiset with O(log n) expected insertion, removal and lookup by
+    rank: each link records how many values it skips.
+    """
+
+    __slots__ = ("head", "end", "size", "random")
+
+    def __init__(self):
+        self.end = _Node(math.inf, 0)
+        self.head = _Node(math.nan, _MAX_LEVELS)
+        self.head.next = [self.end] * _MAX_LEVELS
+        self.size = 0
+        self.random = random.Random(0)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, rank: int) -> float:
+        node = self.head
+        rank += 1
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.width[level] <= rank:
+                rank -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def insert(self, value: float):
+        chain = [self.head] * _MAX_LEVELS
+        steps = [0] * _MAX_LEVELS
+        node = self.head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].value <= value:
+                steps[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        # Geometric level: half the nodes reach level 2, a quarter level 3...
+        levels = min(_MAX_LEVELS, 1 - int(math.log2(1.0 - self.random.random())))
+        new = _Node(value, levels)
+        skipped = 0
+        for level in range(levels):
+            previous = chain[level]
+            new.next[level] = previous.next[level]
+            previous.next[level] = new
+            new.width[level] = previous.width[level] - skipped
+            previous.width[level] = skipped + 1
+            skipped += steps[level]
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, value: float):
+        chain = [self.head] * _MAX_LEVELS
+        node = self.head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target.value != value:
+            raise ValueError(f"{value!r} is not in the skip list")
+        levels = len(target.next)
+        for level in range(levels):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+
+class RollingQuantile:
+    """
+    Quantiles of the last ``size`` pushed values in O(log size) per push.
+    NaN and infinite values take a place in the window but are left out of
+    the quantiles.
+    """
+
+    __slots__ = ("size", "values", "sorted")
+
+    def __init__(self, size: int, values: Iterable[float] = ()):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.values: Deque[float] = deque(maxlen=size)
+        self.sorted = _SkipList()
+        for value in values:
+            self.push(float(value))
+
+    def __reduce__(self) -> Any:
+        # Rebuilt from the window: copying the linked nodes would recurse
+        # once per value
+        return type(self), (self.size, list(self.values))
+
+    @property
+    def count(self) -> int:
+        """Number of finite values in the window"""
+        return len(self.sorted)
+
+    def push(self, value: float):
+        values = self.values
+        if len(values) == self.size:
+            oldest = values[0]
+            if math.isfinite(oldest):
+                self.sorted.remove(oldest)
+        values.append(value)
+        if math.isfinite(value):
+            self.sorted.insert(value)
+
+    def quantile(self, q: float) -> float:
+        """Linearly interpolated quantile (NaN when empty), as ``np.quantile``"""
+        count = len(self.sorted)
+        if not count:
+            return float("nan")
+        position = q * (count - 1)
+        index = int(position)
+        low = self.sorted[index]
+        if index + 1 >= count:
+            return low
+        return low + (self.sorted[index + 1] - low) * (position - index)
+
+
+@dataclass(frozen=True)
+class AdaptiveThresholds:
+    """
+    Buy/sell levels at the ``lower`` / ``upper`` quantiles of the indicator's
+    last ``window`` values before the current bar. The indicator's fixed
+    thresholds apply until ``min_periods`` values (``window`` by default) are
+    available.
+    """
+
+    window: int = 250
+    lower: float = 0.1
+    upper: float = 0.9
+    min_periods: Optional[int] = None
+
+    def __post_init__(self):
+        if self.window < 1:
+            raise ValueError("window must be >= 1")
+        if not 0 <= self.lower <= self.upper <= 1:
+            raise ValueError("quantiles must satisfy 0 <= lower <= upper <= 1")
+        if self.min_periods is None:
+            object.__setattr__(self, "min_periods", self.window)
+        if not 1 <= self.min_periods <= self.window:  # type: ignore[operator]
+            raise ValueError("min_periods must be between 1 and window")
+
+    def new_window(self) -> RollingQuantile:
+        return RollingQuantile(self.window)
+
+    def levels(
+            self, window: RollingQuantile, lower: float, upper: float
+    ) -> Tuple[float, float]:
+        """The quantile levels of ``window``, or the fixed ``lower`` / ``upper``"""
+        if window.count < self.min_periods:  # type: ignore[operator]
+            return lower, upper
+        return window.quantile(self.lower), window.quantile(self.upper)
+
+    def latest(self, values: Any, lower: float, upper: float) -> Tuple[float, float]:
+        """``levels`` applying to the last of ``values``"""
+        prior = np.asarray(values, dtype=np.float64)[-self.window - 1: -1]
+        prior = prior[np.isfinite(prior)]
+        if len(prior) < self.min_periods:  # type: ignore[operator]
+            return lower, upper
+        low, high = np.quantile(prior, [self.lower, self.upper])
+        return float(low), float(high)
+
+    def series(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lower and upper levels applying to every value (NaN until
+        ``min_periods`` earlier values exist). ``values`` may be 1-D or 2-D
+        (bars x symbols); pandas' skip-list rolling quantile does the work.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        finite = np.where(np.isfinite(values), values, np.nan)
+        rolling = (
+            DataFrame(finite.reshape(len(values), -1))
+            .shift(1)
+            .rolling(self.window, min_periods=self.min_periods)
+        )
+        return tuple(  # type: ignore[return-value]
+            rolling.quantile(q).to_numpy().reshape(values.shape)
+            for q in (self.lower, self.upper)
+        )
+
+
+def adaptive_thresholds(adaptive: Any) -> Optional[AdaptiveThresholds]:
+    """``AdaptiveThresholds`` from an instance, a mapping of its fields, or None"""
+    if adaptive is None or isinstance(adaptive, AdaptiveThresholds):
+        return adaptive
+    return AdaptiveThresholds(**adaptive)
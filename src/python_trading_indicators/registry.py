@@ -0,0 +1,103 @@
+"""
+Name-based indicator registry.
+
+Built-in and third-party indicators are registered as ``"module:attribute"``
+references and only imported when first created, so looking names up never pulls
+in pandas or numpy. Third-party packages can expose indicators through the
+``python_trading_indicators.indicators`` entry point group::
+
+    [project.entry-points."python_trading_indicators.indicators"]
+    my_indicator = "my_package.indicators:MyIndicator"
+"""
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Type, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from python_trading_indicators.indicator import Indicator
+
+ENTRY_POINT_GROUP = "python_trading_indicators.indicators"
+
+_registry: Dict[str, Any] = {
+    "rsi": "python_trading_indicators.rsi:RSIIndicator",
+    "vix": "python_trading_indicators.vix:VIXIndicator",
+    "drop": "python_trading_indicators.drop:SuddenPriceDropIndicator",
+    "candlestick": "python_trading_indicators.candlestick:CandlestickIndicator",
+    "macd": "python_trading_indicators.macd:MACDIndicator",
+    "bollinger": "python_trading_indicators.bollinger:BollingerBandsIndicator",
+    "atr": "python_trading_indicators.atr:ATRIndicator",
+    "correlation": "python_trading_indicators.correlation:CorrelationIndicator",
+    "passthrough": "python_trading_indicators.passthrough:PassThroughIndicator",
+}
+_entry_points_loaded = False
+
+
+def _normalize(name: str) -> str:
+    return name.strip().lower()
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib import metadata
+
+    if sys.version_info >= (3, 10):
+        entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+    else:
+        entry_points = metadata.entry_points().get(ENTRY_POINT_GROUP, ())
+    for entry_point in entry_points:
+        # Explicit registrations win over installed plugins
+        _registry.setdefault(_normalize(entry_point.name), entry_point)
+
+
+def register_indicator(name: str, target: Union[str, Type["Indicator"]]):
+    """
+    Register an indicator class, or a lazy ``"module:attribute"`` reference to one,
+    under ``name``.
+    """
+    if isinstance(target, str) and ":" not in target:
+        raise ValueError(f"Expected 'module:attribute' reference, got {target!r}")
+    _registry[_normalize(name)] = target
+
+
+def available_indicators() -> List[str]:
+    _load_entry_points()
+    return sorted(_registry)
+
+
+def get_indicator_class(name: str) -> Type["Indicator"]:
+    key = _normalize(name)
+    if key not in _registry:
+        _load_entry_points()
+    if key not in _registry:
+        raise ValueError(
+            f"Unknown indicator {name!r}; available: {', '.join(available_indicators())}"
+        )
+    target = _registry[key]
+    if isinstance(target, str):
+        module_name, _, attribute = target.partition(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+    elif not isinstance(target, type):
+        target = target.load()  # importlib.metadata.EntryPoint
+    _registry[key] = target
+    return target
+
+
+def create(name: str, **params: Any) -> "Indicator":
+    """Build an indicator by registered name, e.g. ``create("rsi", period=14)``"""
+    return get_indicator_class(name)(**params)
+
+
+def create_from_config(config: Mapping[str, Any]) -> "Indicator":
+    """
+    Build an indicator from a config mapping such as
+    ``{"name": "rsi", "period": 14, "buy_threshold": 25}``.
+    """
+    params = dict(config)
+    name = params.pop("name", None)
+    if name is None:
+        raise ValueError("Indicator config requires a 'name' key")
+    return create(name, **params)
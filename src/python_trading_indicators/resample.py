@@ -0,0 +1,171 @@
+"""
+Multi-timeframe candle aggregation.
+
+``TimeframeAggregator`` derives several higher timeframes from one base bar
+stream, updating each forming bar in O(1) and pushing completed bars into that
+timeframe's streaming indicator states. ``resample_candles`` is the vectorized
+batch equivalent for historical data and produces the same bars.
+"""
+
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+from pandas import DataFrame
+
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    timestamp_seconds,
+)
+from python_trading_indicators.indicator import IndicatorSnapshot
+
+
+def bucket_start(timestamp: float, timeframe: float) -> float:
+    return (timestamp // timeframe) * timeframe
+
+
+def resample_candles(
+        candles: Any, timeframe: float, timestamp_column: str = "timestamp"
+) -> DataFrame:
+    """
+    Aggregate candles (with a timestamp column in seconds or datetime64) into
+    ``timeframe``-second OHLCV bars. Bars are labelled with their bucket start;
+    the last bar may still be forming.
+    """
+    timestamps = timestamp_seconds(candles[timestamp_column])
+    columns = ("open", "high", "low", "close", "volume")
+    if len(timestamps) == 0:
+        return DataFrame({name: [] for name in ("timestamp",) + columns})
+    buckets = np.floor_divide(timestamps, timeframe)
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(buckets)) + 1])
+    ends = np.concatenate([starts[1:], [len(timestamps)]]) - 1
+    opens, highs, lows, closes, volumes = (
+        np.asarray(candles[name], dtype=np.float64) for name in columns
+    )
+    return DataFrame(
+        {
+            "timestamp": buckets[starts] * timeframe,
+            "open": opens[starts],
+            "high": np.maximum.reduceat(highs, starts),
+            "low": np.minimum.reduceat(lows, starts),
+            "close": closes[ends],
+            "volume": np.add.reduceat(volumes, starts),
+        }
+    )
+
+
+class _FormingBar:
+    __slots__ = ("start", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: float, bar: Bar):
+        self.start = start
+        self.open = bar.open
+        self.high = bar.high
+        self.low = bar.low
+        self.close = bar.close
+        self.volume = bar.volume
+
+    def add(self, bar: Bar):
+        if bar.high > self.high:
+            self.high = bar.high
+        if bar.low < self.low:
+            self.low = bar.low
+        self.close = bar.close
+        self.volume += bar.volume
+
+    def to_bar(self) -> Bar:
+        return Bar(self.open, self.high, self.low, self.close, self.volume, self.start)
+
+
+class TimeframeAggregator:
+    """
+    Incremental OHLCV aggregation of one symbol's base bars into several
+    timeframes (in seconds), e.g. ``{"5m": 300, "15m": 900, "1h": 3600}``.
+
+    A forming bar completes when a base bar of a later bucket arrives or, when
+    ``base_interval`` is given, as soon as the base bar closing the bucket is
+    seen. Completed bars are pushed into the timeframe's indicator states.
+    """
+
+    def __init__(
+            self,
+            timeframes: Mapping[str, float],
+            indicators: Optional[Mapping[str, Mapping[str, IndicatorConfig]]] = None,
+            base_interval: Optional[float] = None,
+    ):
+        for name, timeframe in timeframes.items():
+            if timeframe <= 0:
+                raise ValueError(f"Timeframe {name!r} must be positive")
+        indicators = indicators or {}
+        unknown = set(indicators) - set(timeframes)
+        if unknown:
+            raise ValueError(f"Indicators configured for unknown timeframes: {unknown}")
+        self.__timeframes = dict(timeframes)
+        self.__base_interval = base_interval
+        self.__forming: Dict[str, Optional[_FormingBar]] = {
+            name: None for name in timeframes
+        }
+        self.__configs = {name: dict(configs) for name, configs in indicators.items()}
+        self.__states: Dict[str, Dict[str, IndicatorState]] = {
+            name: {key: config.new_state() for key, config in configs.items()}
+            for name, configs in self.__configs.items()
+        }
+
+    def update(self, bar: Bar) -> Dict[str, Bar]:
+        """Add one base bar; return the bars it completed, keyed by timeframe"""
+        if bar.timestamp is None:
+            raise ValueError("TimeframeAggregator requires timestamped bars")
+        completed = {}
+        for name, timeframe in self.__timeframes.items():
+            start = bucket_start(bar.timestamp, timeframe)
+            forming = self.__forming[name]
+            if forming is not None and forming.start != start:
+                completed[name] = self._complete(name)
+                forming = None
+            if forming is None:
+                self.__forming[name] = forming = _FormingBar(start, bar)
+            else:
+                forming.add(bar)
+            if (
+                    self.__base_interval is not None
+                    and bar.timestamp + self.__base_interval >= start + timeframe
+            ):
+                completed[name] = self._complete(name)
+        return completed
+
+    def _complete(self, name: str) -> Bar:
+        forming = self.__forming[name]
+        assert forming is not None
+        self.__forming[name] = None
+        bar = forming.to_bar()
+        for key, config in self.__configs.get(name, {}).items():
+            config.update(self.__states[name][key], bar)
+        return bar
+
+    def flush(self) -> Dict[str, Bar]:
+        """Complete every forming bar (e.g. at the end of a session)"""
+        return {
+            name: self._complete(name)
+            for name, forming in self.__forming.items()
+            if forming is not None
+        }
+
+    def forming(self, timeframe: str) -> Optional[Bar]:
+        """Return the still-forming bar of a timeframe, if any"""
+        forming = self.__forming[timeframe]
+        return forming.to_bar() if forming is not None else None
+
+    def peek(self, timeframe: str, indicator: str) -> Optional[IndicatorSnapshot]:
+        """Return an indicator's provisional reading on the forming bar, if any"""
+        forming = self.__forming[timeframe]
+        if forming is None:
+            return None
+        config = self.__configs[timeframe][indicator]
+        return config.peek(self.__states[timeframe][indicator], forming.to_bar())
+
+    def state(self, timeframe: str, indicator: str) -> IndicatorState:
+        return self.__states[timeframe][indicator]
+
+    def states(self, timeframe: str) -> Dict[str, IndicatorState]:
+        return dict(self.__states.get(timeframe, {}))
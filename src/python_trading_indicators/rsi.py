@@ -1,7 +1,265 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
 from pandas import DataFrame
 
-from python_trading_indicators.indicator import Indicator
-from python_trading_indicators.tools.logger import logger
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    column,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.quantile import (
+    AdaptiveThresholds,
+    RollingQuantile,
+    adaptive_thresholds,
+)
+from python_trading_indicators.smoothing import (
+    Smoother,
+    ewm_series,
+    smooth_series,
+    smoother_for,
+)
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("rsi")
+
+# RSI smoothing of the gains and losses -> moving-average kernel
+SMOOTHINGS = {"wilder": "wilder", "cutler": "sma", "ema": "ema"}
+
+
+def _check_smoothing(smoothing: str):
+    if smoothing not in SMOOTHINGS:
+        raise ValueError(f"smoothing must be one of {tuple(SMOOTHINGS)}")
+
+
+def _wilder(moves: np.ndarray, period: int) -> np.ndarray:
+    # Seed with the simple mean of the first `period` moves, then apply Wilder
+    # smoothing starting again from the last seeded move, as RSIIndicator has
+    # always done. Wilder smoothing is an EWM with alpha = 1 / period; pandas
+    # accumulates it in float64 whatever the input dtype.
+    seed = moves[:period].sum(axis=0, keepdims=True, dtype=np.float64) / period
+    return ewm_series(moves[period - 1:], 1.0 / period, seed.astype(moves.dtype), moves.dtype)
+
+
+def _moves(closes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    diffs = np.diff(closes, axis=0)
+    zero = diffs.dtype.type(0)
+    return np.maximum(diffs, zero), np.maximum(-diffs, zero)
+
+
+def _averages(
+        closes: np.ndarray, period: int, smoothing: str = "wilder"
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Average gain and loss of every bar from index `period` on
+    moves = _moves(closes)
+    if smoothing == "wilder":
+        return _wilder(moves[0], period), _wilder(moves[1], period)
+    kernel = SMOOTHINGS[smoothing]
+    return tuple(  # type: ignore[return-value]
+        smooth_series(values, period, kernel, values.dtype)[period - 1:]
+        for values in moves
+    )
+
+
+def _rsi_from_averages(avg_gain: Any, avg_loss: Any) -> Any:
+    avg_gain = np.asarray(avg_gain)
+    avg_loss = np.asarray(avg_loss)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0, avg_loss.dtype.type(100), rsi)
+
+
+def rsi_series(
+        closes: Any, period: int = 14, dtype: Any = np.float64, smoothing: str = "wilder"
+) -> np.ndarray:
+    """
+    RSI for every bar from index ``period`` on, with the same seeding and
+    smoothing as ``RSIIndicator``. ``closes`` may be 1-D, or 2-D with one column
+    per symbol (bars x symbols). ``dtype=np.float32`` halves memory traffic;
+    values then stay within 1e-3 RSI points of float64 (see README).
+
+    ``smoothing`` averages the gains and losses with Wilder's RMA, a simple
+    moving average ("cutler") or an EMA (see ``SMOOTHINGS``).
+    """
+    _check_smoothing(smoothing)
+    closes = np.asarray(closes, dtype=dtype)
+    if len(closes) <= period:
+        return np.empty((0,) + closes.shape[1:], dtype=dtype)
+    avg_gain, avg_loss = _averages(closes, period, smoothing)
+    return _rsi_from_averages(avg_gain, avg_loss)
+
+
+class RSIState(IndicatorState):
+    __slots__ = (
+        "prev_close",
+        "gain_sum",
+        "loss_sum",
+        "avg_gain",
+        "avg_loss",
+        "quantiles",
+        "thresholds",
+        "gains",
+        "losses",
+    )
+
+    def __init__(
+            self,
+            adaptive: Optional[AdaptiveThresholds] = None,
+            period: int = 14,
+            smoothing: str = "wilder",
+    ):
+        super().__init__()
+        self.prev_close = 0.0
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        # Smoothers of the gains and losses, except for the built-in Wilder
+        # averages above
+        self.gains: Optional[Smoother] = None
+        self.losses: Optional[Smoother] = None
+        if smoothing != "wilder":
+            self.gains = smoother_for(SMOOTHINGS[smoothing], period)
+            self.losses = smoother_for(SMOOTHINGS[smoothing], period)
+        # Recent RSI values behind adaptive thresholds
+        self.quantiles: Optional[RollingQuantile] = (
+            None if adaptive is None else adaptive.new_window()
+        )
+        # (buy, sell) thresholds the published value was held to
+        self.thresholds: Optional[Tuple[float, float]] = None
+
+
+@dataclass(frozen=True)
+class RSIConfig(IndicatorConfig):
+    """
+    With ``adaptive`` thresholds, buy / sell compare the RSI against quantiles
+    of its own recent values; the fixed thresholds apply until there are
+    enough of them. ``smoothing`` is one of ``SMOOTHINGS``.
+    """
+
+    period: int = 14
+    buy_threshold: float = 30
+    sell_threshold: float = 70
+    adaptive: Optional[AdaptiveThresholds] = None
+    smoothing: str = "wilder"
+
+    def __post_init__(self):
+        if self.period < 1:
+            raise ValueError("period must be >= 1")
+        _check_smoothing(self.smoothing)
+        object.__setattr__(self, "adaptive", adaptive_thresholds(self.adaptive))
+
+    def new_state(self) -> RSIState:
+        return RSIState(self.adaptive, self.period, self.smoothing)
+
+    def compute(self, candles: Any) -> RSIState:
+        closes = column(candles, "close")
+        state = self.new_state()
+        if len(closes) <= self.period:
+            for close in closes:
+                self._push(state, float(close))
+            return state
+        avg_gain, avg_loss = _averages(closes, self.period, self.smoothing)
+        state.bars = len(closes)
+        state.prev_close = float(closes[-1])
+        state.avg_gain = float(avg_gain[-1])
+        state.avg_loss = float(avg_loss[-1])
+        if state.gains is not None:
+            gains, losses = _moves(closes)
+            state.gains.load(gains)
+            state.losses.load(losses)  # type: ignore[union-attr]
+        if self.adaptive is not None:
+            # The RSI of the bars before the last one, the last is pushed below
+            window = self.adaptive.window
+            state.quantiles = RollingQuantile(
+                window,
+                _rsi_from_averages(avg_gain[-window - 1: -1], avg_loss[-window - 1: -1]),
+            )
+        self._publish(state)
+        return state
+
+    def update(self, state: RSIState, bar: Bar) -> RSIState:  # type: ignore[override]
+        self._push(state, bar.close)
+        return state
+
+    def peek(self, state: RSIState, bar: Bar) -> IndicatorSnapshot:  # type: ignore[override]
+        moves = state.bars
+        if moves < self.period:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, state.bars + 1)
+        diff = bar.close - state.prev_close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        avg_gain, avg_loss = self._smooth(state, gain, loss, moves)
+        return self._reading(state, avg_gain, avg_loss, state.bars + 1)
+
+    def _push(self, state: RSIState, close: float):
+        state.bars += 1
+        if state.bars == 1:
+            state.prev_close = close
+            return
+        diff = close - state.prev_close
+        state.prev_close = close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        moves = state.bars - 1
+        if state.gains is not None:
+            state.avg_gain = state.gains.update(gain)
+            state.avg_loss = state.losses.update(loss)  # type: ignore[union-attr]
+            if moves >= self.period:
+                self._publish(state)
+            return
+        if moves < self.period:
+            state.gain_sum += gain
+            state.loss_sum += loss
+            return
+        state.avg_gain, state.avg_loss = self._smooth(state, gain, loss, moves)
+        self._publish(state)
+
+    def _smooth(
+            self, state: RSIState, gain: float, loss: float, moves: int
+    ) -> Tuple[float, float]:
+        # Averages after the `moves`-th move; the first Wilder one is seeded
+        if state.gains is not None:
+            return state.gains.peek(gain), state.losses.peek(loss)  # type: ignore[union-attr]
+        period = self.period
+        if moves == period:
+            avg_gain = (state.gain_sum + gain) / period
+            avg_loss = (state.loss_sum + loss) / period
+        else:
+            avg_gain = state.avg_gain
+            avg_loss = state.avg_loss
+        return (
+            (avg_gain * (period - 1) + gain) / period,
+            (avg_loss * (period - 1) + loss) / period,
+        )
+
+    def _reading(
+            self, state: RSIState, avg_gain: float, avg_loss: float, sequence: int
+    ) -> IndicatorSnapshot:
+        value = float(_rsi_from_averages(avg_gain, avg_loss))
+        buy_threshold, sell_threshold = self._thresholds(state)
+        return IndicatorSnapshot(
+            value, value < buy_threshold, value > sell_threshold, sequence
+        )
+
+    def _thresholds(self, state: RSIState) -> Tuple[float, float]:
+        if state.quantiles is None:
+            return self.buy_threshold, self.sell_threshold
+        return self.adaptive.levels(  # type: ignore[union-attr]
+            state.quantiles, self.buy_threshold, self.sell_threshold
+        )
+
+    def _publish(self, state: RSIState):
+        state.thresholds = self._thresholds(state)
+        state.value, state.buy, state.sell, _ = self._reading(
+            state, state.avg_gain, state.avg_loss, state.bars
+        )
+        state.ready = True
+        if state.quantiles is not None:
+            state.quantiles.push(state.value)
 
 
 class RSIIndicator(Indicator):
@@ -12,64 +270,83 @@ class RSIIndicator(Indicator):
             buy_threshold: float = 30,
             sell_threshold: float = 70,
             enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+            adaptive: Any = None,
+            smoothing: str = "wilder",
     ):
-        super().__init__(enabled)
+        super().__init__(enabled, history, dtype)
+        _check_smoothing(smoothing)
         self.__period = period
         self.__buy_threshold = buy_threshold  # RSI < 30 for buy
         self.__sell_threshold = sell_threshold  # RSI > 70 for sell
-        self.__rsi_values = None
+        # Quantiles of recent RSI values replacing the fixed thresholds
+        self.__adaptive = adaptive_thresholds(adaptive)
+        self.__thresholds = (buy_threshold, sell_threshold)
+        self.__smoothing = smoothing
+        self.__rsi: Optional[float] = None
 
     def compute_indicator(self, candles: DataFrame):
+        self._history.clear()
         if len(candles) < self.__period:
             logger.warning("Not enough candles for RSIIndicator")
-            self.__rsi_values = None
+            self.__rsi = None
             return
 
-        closes = candles["close"]
-        gains = []
-        losses = []
-        for i in range(1, len(closes)):
-            diff = closes.iloc[i] - closes.iloc[i - 1]
-            gains.append(max(diff, 0))
-            losses.append(-min(diff, 0))
-
-        avg_gain = sum(gains[: self.__period]) / self.__period
-        avg_loss = sum(losses[: self.__period]) / self.__period
-
-        rsi_values = []
-        for i in range(self.__period, len(closes)):
-            avg_gain = (avg_gain * (self.__period - 1) + gains[i - 1]) / self.__period
-            avg_loss = (avg_loss * (self.__period - 1) + losses[i - 1]) / self.__period
-            if avg_loss == 0:
-                rsi = 100.0
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100.0 - (100.0 / (1 + rs))
-            rsi_values.append(rsi)
-
-        self.__rsi_values = rsi_values
-        logger.info(
-            f"RSI: {self.__rsi_values[-1]:.2f}" if self.__rsi_values else "RSI: None"
+        rsi_values = rsi_series(
+            column(candles, "close"), self.__period, self._dtype, self.__smoothing
         )
+        self._history.assign(rsi_values)
+        if self.__adaptive is not None:
+            self.__thresholds = self.__adaptive.latest(
+                rsi_values, self.__buy_threshold, self.__sell_threshold
+            )
+        if len(rsi_values):
+            self.__rsi = float(rsi_values[-1])
+            logger.info("RSI: %.2f", self.__rsi)
+        else:
+            self.__rsi = None
+            logger.info("RSI: None")
 
     def evaluate_sell_condition(self) -> bool:
-        if not self.is_enabled or not self.__rsi_values:
+        if not self.is_enabled or self.__rsi is None:
             return False
-        return bool(self.__rsi_values[-1] > self.__sell_threshold)
+        return bool(self.__rsi > self.__thresholds[1])
 
     def evaluate_buy_condition(self) -> bool:
-        if not self.is_enabled or not self.__rsi_values:
+        if not self.is_enabled or self.__rsi is None:
             return False
-        return bool(self.__rsi_values[-1] < self.__buy_threshold)
+        return bool(self.__rsi < self.__thresholds[0])
 
     @property
     def current_value(self) -> float:
         """Return the current RSI value"""
-        if not self.__rsi_values:
+        if self.__rsi is None:
             return 0.0
-        return self.__rsi_values[-1]
+        return self.__rsi
 
     @property
     def period(self) -> int:
         """Return the RSI period"""
         return self.__period
+
+    @property
+    def smoothing(self) -> str:
+        """Return the smoothing of the gains and losses"""
+        return self.__smoothing
+
+    @property
+    def thresholds(self) -> Tuple[float, float]:
+        """Return the buy and sell thresholds of the last calculation"""
+        return self.__thresholds
+
+    @property
+    def config(self) -> RSIConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return RSIConfig(
+            self.__period,
+            self.__buy_threshold,
+            self.__sell_threshold,
+            self.__adaptive,
+            self.__smoothing,
+        )
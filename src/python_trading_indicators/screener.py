@@ -0,0 +1,201 @@
+"""
+Cross-sectional screening of many symbols by indicator value.
+
+``top_k``, ``bottom_k`` and ``select`` work on one value per symbol, e.g. the
+last row of ``rsi_series`` over a (bars x symbols) matrix, and return index
+arrays into it: rankings use ``np.argpartition`` (O(n) plus O(k log k) to order
+the selection). ``Screener`` keeps those values per symbol across bars and can
+track the top/bottom k with lazily invalidated heaps (``StreamingTopK``) when
+only a few symbols change per update. NaN values never rank or match.
+"""
+
+import heapq
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from python_trading_indicators.config import IndicatorState
+
+
+def _ranked(values: Any, k: int, largest: bool) -> np.ndarray:
+    if k < 0:
+        raise ValueError("k must be >= 0")
+    values = np.asarray(values, dtype=np.float64)
+    keys = -values if largest else values
+    candidates = np.flatnonzero(~np.isnan(keys))
+    if len(candidates) == len(keys):
+        candidates = None  # No NaN: partition the whole array without a copy
+    if candidates is not None:
+        keys = keys[candidates]
+    if k < len(keys):
+        selected = np.argpartition(keys, k)[:k] if k else np.empty(0, dtype=np.intp)
+    else:
+        selected = np.arange(len(keys))
+    selected = selected[np.argsort(keys[selected], kind="stable")]
+    return selected if candidates is None else candidates[selected]
+
+
+def top_k(values: Any, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest values, largest first"""
+    return _ranked(values, k, largest=True)
+
+
+def bottom_k(values: Any, k: int) -> np.ndarray:
+    """Indices of the ``k`` smallest values, smallest first"""
+    return _ranked(values, k, largest=False)
+
+
+def select(
+        values: Any, below: Optional[float] = None, above: Optional[float] = None
+) -> np.ndarray:
+    """Indices of the values strictly below ``below`` and/or above ``above``"""
+    values = np.asarray(values, dtype=np.float64)
+    mask = np.ones(len(values), dtype=bool)
+    if below is not None:
+        mask &= values < below
+    if above is not None:
+        mask &= values > above
+    return np.flatnonzero(mask)
+
+
+class StreamingTopK:
+    """
+    Top (or bottom) ``k`` of ``size`` values that change one at a time.
+
+    Every update pushes a (key, version, index) entry in O(log n); entries of
+    older versions are discarded when they surface. A query pops the best ``k``
+    live entries and pushes them back, so it costs O(k log n) however many
+    symbols there are.
+    """
+
+    def __init__(self, size: int, k: int, largest: bool = True):
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        self.__k = k
+        self.__sign = -1.0 if largest else 1.0
+        self.__versions = np.zeros(size, dtype=np.int64)
+        self.__heap: List[Tuple[float, int, int]] = []
+
+    @property
+    def k(self) -> int:
+        return self.__k
+
+    def update(self, index: int, value: float):
+        version = int(self.__versions[index]) + 1
+        self.__versions[index] = version
+        if value == value:  # NaN values leave the ranking
+            heapq.heappush(self.__heap, (self.__sign * value, version, index))
+        if len(self.__heap) > 4 * len(self.__versions) + 64:
+            self._compact()
+
+    def _compact(self):
+        versions = self.__versions
+        self.__heap = [entry for entry in self.__heap if versions[entry[2]] == entry[1]]
+        heapq.heapify(self.__heap)
+
+    def indices(self, k: Optional[int] = None) -> np.ndarray:
+        """Indices of the best ``k`` (at most the tracked ``k``) values, best first"""
+        k = self.__k if k is None else min(k, self.__k)
+        heap = self.__heap
+        versions = self.__versions
+        best = []
+        while heap and len(best) < k:
+            entry = heapq.heappop(heap)
+            if versions[entry[2]] == entry[1]:
+                best.append(entry)
+        for entry in best:
+            heapq.heappush(heap, entry)
+        return np.array([entry[2] for entry in best], dtype=np.intp)
+
+
+class Screener:
+    """
+    Latest indicator value per symbol with top-k, bottom-k and threshold
+    queries returning indices into ``symbols``::
+
+        screener = Screener(symbols, streaming_k=50)
+        screener.update_states(RSIConfig(14).compute_many(candles_by_symbol))
+        oversold = screener.bottom_k(50)   # index array, most oversold first
+        screener.symbols_at(oversold)
+
+    With ``streaming_k`` the k best/worst are also maintained incrementally by
+    ``update`` and served from heaps; otherwise queries use ``argpartition``.
+    """
+
+    def __init__(self, symbols: Sequence[str], streaming_k: Optional[int] = None):
+        self.__symbols = np.asarray(symbols, dtype=object)
+        self.__index: Dict[str, int] = {symbol: i for i, symbol in enumerate(symbols)}
+        if len(self.__index) != len(self.__symbols):
+            raise ValueError("symbols must be unique")
+        self.__values = np.full(len(self.__symbols), np.nan)
+        self.__top: Optional[StreamingTopK] = None
+        self.__bottom: Optional[StreamingTopK] = None
+        if streaming_k is not None:
+            self.__top = StreamingTopK(len(self.__symbols), streaming_k, largest=True)
+            self.__bottom = StreamingTopK(len(self.__symbols), streaming_k, largest=False)
+
+    @property
+    def symbols(self) -> np.ndarray:
+        return self.__symbols
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view of the latest value per symbol (NaN if unknown)"""
+        view = self.__values.view()
+        view.flags.writeable = False
+        return view
+
+    def index(self, symbol: str) -> int:
+        return self.__index[symbol]
+
+    def symbols_at(self, indices: Any) -> List[str]:
+        return self.__symbols[indices].tolist()
+
+    def update(self, symbol: str, value: float):
+        """Set one symbol's value (O(1), or O(log n) with streaming heaps)"""
+        index = self.__index[symbol]
+        self.__values[index] = value
+        if self.__top is not None and self.__bottom is not None:
+            self.__top.update(index, value)
+            self.__bottom.update(index, value)
+
+    def update_many(self, values: Mapping[str, float]):
+        for symbol, value in values.items():
+            self.update(symbol, value)
+
+    def update_states(self, states: Mapping[str, IndicatorState]):
+        """
+        Take the ``value`` of each symbol's indicator state, NaN for states
+        that are not ready yet so they never rank
+        """
+        for symbol, state in states.items():
+            self.update(symbol, state.value if state.ready else np.nan)
+
+    def set_values(self, values: Any):
+        """Replace every value at once, in ``symbols`` order"""
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != self.__values.shape:
+            raise ValueError(f"Expected {len(self.__values)} values, got {values.shape}")
+        self.__values[:] = values
+        if self.__top is not None and self.__bottom is not None:
+            for index, value in enumerate(values.tolist()):
+                self.__top.update(index, value)
+                self.__bottom.update(index, value)
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Indices of the ``k`` highest values, highest first"""
+        if self.__top is not None and k <= self.__top.k:
+            return self.__top.indices(k)
+        return top_k(self.__values, k)
+
+    def bottom_k(self, k: int) -> np.ndarray:
+        """Indices of the ``k`` lowest values, lowest first"""
+        if self.__bottom is not None and k <= self.__bottom.k:
+            return self.__bottom.indices(k)
+        return bottom_k(self.__values, k)
+
+    def select(
+            self, below: Optional[float] = None, above: Optional[float] = None
+    ) -> np.ndarray:
+        """Indices of the symbols whose value is below and/or above a threshold"""
+        return select(self.__values, below, above)
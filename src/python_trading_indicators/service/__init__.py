@@ -0,0 +1,20 @@
+"""
+Sharded indicator service.
+
+Workers hold streaming indicator state for the symbols that consistent hashing
+assigns to them; the coordinator fans out each bar over a compact binary
+protocol on TCP or Unix sockets and gathers a per-bar signal table with a
+deadline.
+"""
+
+from .coordinator import Coordinator, SignalTable
+from .hashing import ConsistentHashRing
+from .worker import IndicatorWorker, run_worker
+
+__all__ = [
+    "Coordinator",
+    "SignalTable",
+    "ConsistentHashRing",
+    "IndicatorWorker",
+    "run_worker",
+]
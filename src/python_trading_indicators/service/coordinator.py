@@ -0,0 +1,147 @@
+import select
+import socket
+import time
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Tuple
+
+from python_trading_indicators.config import Bar
+from python_trading_indicators.indicator import IndicatorSnapshot
+from python_trading_indicators.service.hashing import ConsistentHashRing
+from python_trading_indicators.service.protocol import (
+    BARS,
+    HEADER,
+    RESULTS,
+    SHUTDOWN,
+    Address,
+    ResultKey,
+    connect,
+    decode_results,
+    encode_bars,
+    send_frame,
+)
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("service.coordinator")
+
+
+class SignalTable(NamedTuple):
+    """Results gathered for one bar; ``missing_nodes`` missed the deadline"""
+
+    bar_id: int
+    results: Dict[ResultKey, IndicatorSnapshot]
+    missing_nodes: List[str]
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing_nodes
+
+
+class _FrameBuffer:
+    """Reassembles frames from a non-blocking byte stream"""
+
+    __slots__ = ("data",)
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def frames(self) -> Iterator[Tuple[int, int, bytes]]:
+        while len(self.data) >= HEADER.size:
+            message_type, bar_id, length = HEADER.unpack_from(self.data, 0)
+            end = HEADER.size + length
+            if len(self.data) < end:
+                return
+            payload = bytes(self.data[HEADER.size: end])
+            del self.data[:end]
+            yield message_type, bar_id, payload
+
+
+class Coordinator:
+    """
+    Partitions symbols across workers by consistent hashing, fans out each bar
+    and gathers the per-bar signal table within a deadline.
+    """
+
+    def __init__(
+            self,
+            workers: Mapping[str, Address],
+            replicas: int = 64,
+            connect_timeout: float = 5.0,
+    ):
+        self.__ring = ConsistentHashRing(workers, replicas)
+        self.__sockets: Dict[str, socket.socket] = {}
+        self.__buffers: Dict[str, _FrameBuffer] = {}
+        for node, address in workers.items():
+            sock = connect(address, connect_timeout)
+            sock.setblocking(False)
+            self.__sockets[node] = sock
+            self.__buffers[node] = _FrameBuffer()
+        self.__bar_id = 0
+
+    @property
+    def ring(self) -> ConsistentHashRing:
+        return self.__ring
+
+    def process(self, bars: Mapping[str, Bar], timeout: float = 1.0) -> SignalTable:
+        """Send one closed bar per symbol and wait up to ``timeout`` seconds"""
+        self.__bar_id += 1
+        bar_id = self.__bar_id
+        deadline = time.monotonic() + timeout
+        pending = set()
+        failed = []
+        for node, symbols in self.__ring.partition(bars).items():
+            payload = encode_bars({symbol: bars[symbol] for symbol in symbols})
+            try:
+                self.__sockets[node].setblocking(True)
+                send_frame(self.__sockets[node], BARS, bar_id, payload)
+                pending.add(node)
+            except OSError:
+                logger.warning("Worker %s is unreachable", node)
+                failed.append(node)
+            finally:
+                self.__sockets[node].setblocking(False)
+
+        results: Dict[ResultKey, IndicatorSnapshot] = {}
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            by_socket = {self.__sockets[node]: node for node in pending}
+            readable, _, _ = select.select(list(by_socket), [], [], remaining)
+            for sock in readable:
+                node = by_socket[sock]
+                try:
+                    data = sock.recv(1 << 16)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    data = b""
+                if not data:
+                    logger.warning("Worker %s closed the connection", node)
+                    pending.discard(node)
+                    failed.append(node)
+                    continue
+                buffer = self.__buffers[node]
+                buffer.data.extend(data)
+                for message_type, frame_bar_id, payload in buffer.frames():
+                    # Late answers to earlier bars are dropped
+                    if message_type == RESULTS and frame_bar_id == bar_id:
+                        results.update(decode_results(payload))
+                        pending.discard(node)
+        return SignalTable(bar_id, results, sorted(pending) + sorted(failed))
+
+    def close(self, shutdown_workers: bool = False):
+        for sock in self.__sockets.values():
+            try:
+                if shutdown_workers:
+                    sock.setblocking(True)
+                    send_frame(sock, SHUTDOWN, 0)
+            except OSError:
+                pass
+            finally:
+                sock.close()
+        self.__sockets.clear()
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,55 @@
+import hashlib
+from bisect import bisect
+from typing import Dict, Iterable, List
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """
+    Consistent hashing of symbols onto worker nodes.
+
+    Each node owns ``replicas`` virtual points on the ring, so adding or removing
+    a node only moves about ``1 / len(nodes)`` of the symbols.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 64):
+        if replicas < 1:
+            raise ValueError("replicas must be >= 1")
+        self.__replicas = replicas
+        self.__points: List[int] = []
+        self.__owners: Dict[int, str] = {}
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(set(self.__owners.values()))
+
+    def add_node(self, node: str):
+        for replica in range(self.__replicas):
+            point = _hash(f"{node}#{replica}")
+            if point not in self.__owners:
+                self.__owners[point] = node
+        self.__points = sorted(self.__owners)
+
+    def remove_node(self, node: str):
+        self.__owners = {
+            point: owner for point, owner in self.__owners.items() if owner != node
+        }
+        self.__points = sorted(self.__owners)
+
+    def node_for(self, symbol: str) -> str:
+        if not self.__points:
+            raise ValueError("ConsistentHashRing has no nodes")
+        index = bisect(self.__points, _hash(symbol)) % len(self.__points)
+        return self.__owners[self.__points[index]]
+
+    def partition(self, symbols: Iterable[str]) -> Dict[str, List[str]]:
+        """Group symbols by owning node"""
+        partitions: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            partitions.setdefault(self.node_for(symbol), []).append(symbol)
+        return partitions
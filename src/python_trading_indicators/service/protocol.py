@@ -0,0 +1,146 @@
+"""
+Compact binary protocol between the coordinator and indicator workers.
+
+Every message is a frame: a 13-byte header ``!BQI`` (message type, bar id,
+payload length) followed by the payload. Strings are UTF-8 with a one-byte
+length prefix; numbers are big-endian IEEE-754 doubles.
+
+BARS payload:    count:u32, then per bar  symbol, open, high, low, close, volume,
+                 timestamp (NaN for a bar without one)
+RESULTS payload: count:u32, then per row  symbol, indicator, value:f64, flags:u8
+"""
+
+import math
+import socket
+import struct
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from python_trading_indicators.config import Bar
+from python_trading_indicators.indicator import IndicatorSnapshot
+
+BARS = 1
+RESULTS = 2
+SHUTDOWN = 3
+
+BUY_FLAG = 1
+SELL_FLAG = 2
+
+HEADER = struct.Struct("!BQI")
+COUNT = struct.Struct("!I")
+OHLCV = struct.Struct("!6d")
+RESULT = struct.Struct("!dB")
+
+Address = Union[Tuple[str, int], str]
+ResultKey = Tuple[str, str]
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode()
+    if len(encoded) > 255:
+        raise ValueError(f"String too long for the wire format: {value!r}")
+    return bytes((len(encoded),)) + encoded
+
+
+def _unpack_string(payload: bytes, offset: int) -> Tuple[str, int]:
+    length = payload[offset]
+    end = offset + 1 + length
+    return payload[offset + 1: end].decode(), end
+
+
+def encode_bars(bars: Mapping[str, Bar]) -> bytes:
+    parts = [COUNT.pack(len(bars))]
+    for symbol, bar in bars.items():
+        parts.append(_pack_string(symbol))
+        timestamp = math.nan if bar.timestamp is None else bar.timestamp
+        parts.append(
+            OHLCV.pack(bar.open, bar.high, bar.low, bar.close, bar.volume, timestamp)
+        )
+    return b"".join(parts)
+
+
+def decode_bars(payload: bytes) -> Dict[str, Bar]:
+    (count,) = COUNT.unpack_from(payload, 0)
+    offset = COUNT.size
+    bars = {}
+    for _ in range(count):
+        symbol, offset = _unpack_string(payload, offset)
+        *values, timestamp = OHLCV.unpack_from(payload, offset)
+        bars[symbol] = Bar(*values, None if math.isnan(timestamp) else timestamp)
+        offset += OHLCV.size
+    return bars
+
+
+def encode_results(results: Iterable[Tuple[str, str, IndicatorSnapshot]]) -> bytes:
+    parts = []
+    for symbol, indicator, snapshot in results:
+        flags = (BUY_FLAG if snapshot.buy else 0) | (SELL_FLAG if snapshot.sell else 0)
+        parts.append(_pack_string(symbol))
+        parts.append(_pack_string(indicator))
+        parts.append(RESULT.pack(snapshot.value, flags))
+    return COUNT.pack(len(parts) // 3) + b"".join(parts)
+
+
+def decode_results(payload: bytes) -> Dict[ResultKey, IndicatorSnapshot]:
+    (count,) = COUNT.unpack_from(payload, 0)
+    offset = COUNT.size
+    results = {}
+    for _ in range(count):
+        symbol, offset = _unpack_string(payload, offset)
+        indicator, offset = _unpack_string(payload, offset)
+        value, flags = RESULT.unpack_from(payload, offset)
+        offset += RESULT.size
+        results[(symbol, indicator)] = IndicatorSnapshot(
+            value, bool(flags & BUY_FLAG), bool(flags & SELL_FLAG)
+        )
+    return results
+
+
+def send_frame(sock: socket.socket, message_type: int, bar_id: int, payload: bytes = b""):
+    sock.sendall(HEADER.pack(message_type, bar_id, len(payload)) + payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Tuple[int, int, bytes]]:
+    """Return (message type, bar id, payload), or None once the peer has closed"""
+    header = _recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    message_type, bar_id, length = HEADER.unpack(header)
+    payload = _recv_exactly(sock, length) if length else b""
+    if payload is None:
+        return None
+    return message_type, bar_id, payload
+
+
+def connect(address: Address, timeout: Optional[float] = None) -> socket.socket:
+    """Connect to a ``(host, port)`` TCP address or a Unix socket path"""
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(timeout)
+    sock.connect(address)
+    return sock
+
+
+def listen(address: Address, backlog: int = 8) -> socket.socket:
+    """Bind a listening socket; use port 0 for an ephemeral TCP port"""
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(address)
+    sock.listen(backlog)
+    return sock
+
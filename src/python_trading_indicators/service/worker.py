@@ -0,0 +1,128 @@
+import os
+import socket
+import threading
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from python_trading_indicators.config import Bar, IndicatorConfig, IndicatorState
+from python_trading_indicators.indicator import IndicatorSnapshot
+from python_trading_indicators.service.protocol import (
+    BARS,
+    RESULTS,
+    SHUTDOWN,
+    Address,
+    decode_bars,
+    encode_results,
+    listen,
+    recv_frame,
+    send_frame,
+)
+from python_trading_indicators.tools.logger import get_logger
+
+logger = get_logger("service.worker")
+
+
+class IndicatorWorker:
+    """
+    Streaming indicator worker for a shard of the symbol universe.
+
+    Listens on a TCP ``(host, port)`` address or a Unix socket path, keeps one
+    streaming state per (symbol, indicator) and answers every BARS frame with a
+    RESULTS frame carrying the same bar id.
+    """
+
+    def __init__(
+            self,
+            configs: Mapping[str, IndicatorConfig],
+            address: Address = ("127.0.0.1", 0),
+    ):
+        self.__configs = dict(configs)
+        self.__states: Dict[Tuple[str, str], IndicatorState] = {}
+        self.__lock = threading.Lock()
+        self.__server = listen(address)
+        self.__server.settimeout(0.1)
+        self.__stopping = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Address:
+        address = self.__server.getsockname()
+        return address if isinstance(address, str) else (address[0], address[1])
+
+    def process(self, bars: Mapping[str, Bar]) -> List[Tuple[str, str, IndicatorSnapshot]]:
+        """Advance the streaming states by one bar per symbol"""
+        results = []
+        with self.__lock:
+            for symbol, bar in bars.items():
+                for name, config in self.__configs.items():
+                    state = self.__states.get((symbol, name))
+                    if state is None:
+                        state = self.__states[(symbol, name)] = config.new_state()
+                    config.update(state, bar)
+                    results.append(
+                        (symbol, name, IndicatorSnapshot(state.value, state.buy, state.sell))
+                    )
+        return results
+
+    def _serve_connection(self, connection: socket.socket):
+        with connection:
+            while not self.__stopping.is_set():
+                try:
+                    frame = recv_frame(connection)
+                except OSError:
+                    return
+                if frame is None:
+                    return
+                message_type, bar_id, payload = frame
+                if message_type == SHUTDOWN:
+                    self.__stopping.set()
+                    return
+                if message_type == BARS:
+                    results = self.process(decode_bars(payload))
+                    send_frame(connection, RESULTS, bar_id, encode_results(results))
+                else:
+                    logger.warning("Ignoring unexpected frame type %s", message_type)
+
+    def serve_forever(self):
+        """Accept coordinator connections until stopped or told to shut down"""
+        threads = []
+        try:
+            while not self.__stopping.is_set():
+                try:
+                    connection, _ = self.__server.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                connection.settimeout(None)
+                thread = threading.Thread(
+                    target=self._serve_connection, args=(connection,), daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+        finally:
+            self._close_server()
+
+    def start(self) -> "IndicatorWorker":
+        """Serve from a background thread"""
+        self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.__stopping.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        else:
+            self._close_server()
+
+    def _close_server(self):
+        address = self.__server.getsockname() if self.__server.fileno() != -1 else None
+        self.__server.close()
+        if isinstance(address, str) and address and os.path.exists(address):
+            os.unlink(address)
+
+
+def run_worker(configs: Mapping[str, IndicatorConfig], address: Address):
+    """Process entry point: serve ``configs`` on ``address`` until shut down"""
+    IndicatorWorker(configs, address).serve_forever()
@@ -0,0 +1,307 @@
+"""
+Shared-memory publication of indicator results.
+
+A single ``SharedIndicatorPublisher`` computes indicators once and writes the
+latest value and buy/sell flags per (symbol, indicator) into a fixed-size table
+in ``multiprocessing.shared_memory``. Any number of ``SharedIndicatorReader``
+processes on the same host attach to the table by name and read it through
+NumPy views, without copying or locking.
+
+Every row is guarded by a sequence lock: the writer makes the row's sequence odd,
+updates the payload, then makes it even again. Readers retry until they observe
+the same even sequence before and after reading the payload.
+"""
+
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+import numpy as np
+
+from python_trading_indicators.config import Bar, IndicatorConfig, IndicatorState
+from python_trading_indicators.indicator import IndicatorSnapshot
+
+MAGIC = 0x50544953  # "PTIS"
+LAYOUT_VERSION = 1
+HEADER_SIZE = 64
+SYMBOL_SIZE = 32
+INDICATOR_SIZE = 16
+BUY_FLAG = 1
+SELL_FLAG = 2
+
+HEADER_DTYPE = np.dtype(
+    [("magic", "<u4"), ("layout", "<u4"), ("capacity", "<u4"), ("count", "<u4")]
+)
+ROW_DTYPE = np.dtype(
+    [
+        ("sequence", "<u8"),
+        ("value", "<f8"),
+        ("flags", "<u8"),
+        ("updated_ns", "<i8"),
+        ("symbol", f"S{SYMBOL_SIZE}"),
+        ("indicator", f"S{INDICATOR_SIZE}"),
+    ]
+)
+
+Key = Tuple[str, str]
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        pass
+    # Before Python 3.13 attaching registers the segment with this process's
+    # resource tracker, which would unlink it when the reader exits.
+    shm = SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class SharedIndicatorTable:
+    """
+    Fixed-capacity (symbol, indicator) -> (value, buy, sell) table in shared memory.
+    Use ``create`` in the single writer process and ``attach`` in readers.
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool):
+        self.__shm = shm
+        self.__owner = owner
+        self.__header = np.ndarray((1,), HEADER_DTYPE, buffer=shm.buf)
+        if self.__header["magic"][0] != MAGIC:
+            raise ValueError(f"{shm.name!r} is not an indicator table")
+        if self.__header["layout"][0] != LAYOUT_VERSION:
+            raise ValueError(f"Unsupported indicator table layout in {shm.name!r}")
+        capacity = int(self.__header["capacity"][0])
+        rows = np.ndarray((capacity,), ROW_DTYPE, buffer=shm.buf, offset=HEADER_SIZE)
+        self.__rows = rows
+        self.__sequences = rows["sequence"]
+        self.__values = rows["value"]
+        self.__flags = rows["flags"]
+        self.__updated = rows["updated_ns"]
+        self.__slots: Dict[Key, int] = {}
+        self.__known = 0
+
+    @classmethod
+    def create(cls, capacity: int, name: Optional[str] = None) -> "SharedIndicatorTable":
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        shm = SharedMemory(
+            name=name, create=True, size=HEADER_SIZE + capacity * ROW_DTYPE.itemsize
+        )
+        header = np.ndarray((1,), HEADER_DTYPE, buffer=shm.buf)
+        header[0] = (MAGIC, LAYOUT_VERSION, capacity, 0)
+        np.ndarray((capacity,), ROW_DTYPE, buffer=shm.buf, offset=HEADER_SIZE)[:] = 0
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedIndicatorTable":
+        return cls(_attach(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.__shm.name
+
+    @property
+    def capacity(self) -> int:
+        return len(self.__rows)
+
+    def __len__(self) -> int:
+        return int(self.__header["count"][0])
+
+    def _refresh(self):
+        count = len(self)
+        for slot in range(self.__known, count):
+            row = self.__rows[slot]
+            key = (row["symbol"].decode(), row["indicator"].decode())
+            self.__slots[key] = slot
+        self.__known = count
+
+    def slot(self, symbol: str, indicator: str) -> Optional[int]:
+        key = (symbol, indicator)
+        if key not in self.__slots:
+            self._refresh()
+        return self.__slots.get(key)
+
+    def keys(self) -> Iterator[Key]:
+        self._refresh()
+        return iter(list(self.__slots))
+
+    def _allocate(self, symbol: str, indicator: str) -> int:
+        encoded_symbol = symbol.encode()
+        encoded_indicator = indicator.encode()
+        if len(encoded_symbol) > SYMBOL_SIZE or len(encoded_indicator) > INDICATOR_SIZE:
+            raise ValueError(
+                f"Keys are limited to {SYMBOL_SIZE}-byte symbols and "
+                f"{INDICATOR_SIZE}-byte indicator names"
+            )
+        slot = len(self)
+        if slot >= self.capacity:
+            raise ValueError(f"Indicator table is full ({self.capacity} rows)")
+        self.__rows["symbol"][slot] = encoded_symbol
+        self.__rows["indicator"][slot] = encoded_indicator
+        # Publishing the new count last makes the key visible to readers
+        self.__header["count"][0] = slot + 1
+        self.__slots[(symbol, indicator)] = slot
+        self.__known = slot + 1
+        return slot
+
+    def write(self, symbol: str, indicator: str, value: float, buy: bool, sell: bool):
+        """Write one row (single writer only)"""
+        slot = self.__slots.get((symbol, indicator))
+        if slot is None:
+            slot = self._allocate(symbol, indicator)
+        sequences = self.__sequences
+        sequence = sequences[slot]
+        sequences[slot] = sequence + 1  # Odd: write in progress
+        self.__values[slot] = value
+        self.__flags[slot] = (BUY_FLAG if buy else 0) | (SELL_FLAG if sell else 0)
+        self.__updated[slot] = time.time_ns()
+        sequences[slot] = sequence + 2
+
+    def read_slot(self, slot: int, retries: int = 1000) -> IndicatorSnapshot:
+        sequences = self.__sequences
+        for _ in range(retries):
+            before = int(sequences[slot])
+            if not before & 1:
+                value = float(self.__values[slot])
+                flags = int(self.__flags[slot])
+                if int(sequences[slot]) == before:
+                    return IndicatorSnapshot(
+                        value,
+                        bool(flags & BUY_FLAG),
+                        bool(flags & SELL_FLAG),
+                        before >> 1,
+                    )
+            time.sleep(0)  # Let a writer in this process finish its update
+        raise TimeoutError(f"Row {slot} kept changing during {retries} read attempts")
+
+    def read(self, symbol: str, indicator: str) -> Optional[IndicatorSnapshot]:
+        """Return the latest published result, or None if it was never written"""
+        slot = self.slot(symbol, indicator)
+        if slot is None:
+            return None
+        return self.read_slot(slot)
+
+    def read_all(self, retries: int = 1000) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return consistent copies of (values, buy, sell) for all allocated rows, in
+        slot order (see ``keys``).
+        """
+        count = len(self)
+        before = self.__sequences[:count].copy()
+        values = self.__values[:count].copy()
+        flags = self.__flags[:count].copy()
+        torn = np.flatnonzero((before & 1) | (self.__sequences[:count] != before))
+        for slot in torn:
+            snapshot = self.read_slot(int(slot), retries)
+            values[slot] = snapshot.value
+            flags[slot] = (BUY_FLAG if snapshot.buy else 0) | (
+                SELL_FLAG if snapshot.sell else 0
+            )
+        return values, (flags & BUY_FLAG).astype(bool), (flags & SELL_FLAG).astype(bool)
+
+    def updated_ns(self, symbol: str, indicator: str) -> Optional[int]:
+        slot = self.slot(symbol, indicator)
+        return None if slot is None else int(self.__updated[slot])
+
+    def close(self):
+        # Drop the NumPy views before releasing the underlying buffer
+        self.__header = self.__rows = None  # type: ignore[assignment]
+        self.__sequences = self.__values = None  # type: ignore[assignment]
+        self.__flags = self.__updated = None  # type: ignore[assignment]
+        self.__shm.close()
+        if self.__owner:
+            # A reader sharing this process's tracker may have unregistered
+            # the segment; registering again keeps unlink's unregister valid
+            name = self.__shm._name  # type: ignore[attr-defined]
+            resource_tracker.register(name, "shared_memory")
+            self.__shm.unlink()
+
+    def __enter__(self) -> "SharedIndicatorTable":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+
+class SharedIndicatorPublisher:
+    """
+    Computes each configured indicator once per symbol and publishes the results
+    to a shared table. Keeps one streaming state per (symbol, indicator).
+    """
+
+    def __init__(
+            self,
+            configs: Mapping[str, IndicatorConfig],
+            capacity: int,
+            name: Optional[str] = None,
+    ):
+        self.__configs = dict(configs)
+        self.__table = SharedIndicatorTable.create(capacity, name)
+        self.__states: Dict[Key, IndicatorState] = {}
+
+    @property
+    def name(self) -> str:
+        return self.__table.name
+
+    @property
+    def table(self) -> SharedIndicatorTable:
+        return self.__table
+
+    def compute(self, symbol: str, candles: Any):
+        """Compute every indicator over a candle history and publish the results"""
+        for indicator, config in self.__configs.items():
+            state = config.compute(candles)
+            self.__states[(symbol, indicator)] = state
+            self.__table.write(symbol, indicator, state.value, state.buy, state.sell)
+
+    def update(self, symbol: str, bar: Bar):
+        """Advance every indicator by one closed bar and publish the results"""
+        for indicator, config in self.__configs.items():
+            state = self.__states.get((symbol, indicator))
+            if state is None:
+                state = self.__states[(symbol, indicator)] = config.new_state()
+            config.update(state, bar)
+            self.__table.write(symbol, indicator, state.value, state.buy, state.sell)
+
+    def close(self):
+        self.__table.close()
+
+    def __enter__(self) -> "SharedIndicatorPublisher":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+
+class SharedIndicatorReader:
+    """Read-only client attached to a publisher's table by name"""
+
+    def __init__(self, name: str):
+        self.__table = SharedIndicatorTable.attach(name)
+
+    def read(self, symbol: str, indicator: str) -> Optional[IndicatorSnapshot]:
+        return self.__table.read(symbol, indicator)
+
+    def read_all(self) -> Dict[Key, IndicatorSnapshot]:
+        values, buys, sells = self.__table.read_all()
+        return {
+            key: IndicatorSnapshot(float(values[i]), bool(buys[i]), bool(sells[i]))
+            for i, key in enumerate(self.__table.keys())
+            if i < len(values)
+        }
+
+    def keys(self) -> Iterator[Key]:
+        return self.__table.keys()
+
+    def close(self):
+        self.__table.close()
+
+    def __enter__(self) -> "SharedIndicatorReader":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
@@ -0,0 +1,136 @@
+"""
+Bit-packed buy/sell signal matrices.
+
+``SignalMatrix`` stores the buy and sell flags of up to eight indicators in
+one ``uint16`` per (bar, symbol): indicator ``i`` owns bit ``2 * i`` (buy) and
+bit ``2 * i + 1`` (sell). Ten booleans per cell become two bytes, and the
+matrix saves to / memory-maps from a plain ``.npy`` file.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+MAX_INDICATORS = 8
+FLAGS = ("buy", "sell")
+# Two-bit signal code of one indicator, as stored at its bit offset
+BUY = 1
+SELL = 2
+
+
+class SignalMatrix:
+    """
+    (bars x symbols) matrix of packed buy/sell flags for named indicators::
+
+        signals = SignalMatrix.empty(["rsi", "vix"], bars, symbols)
+        signals.set("rsi", buy=rsi < 30, sell=rsi > 70)      # (bars x symbols)
+        signals.flag("rsi", "buy")                           # bool matrix
+        signals.count("vix", "sell")                         # per symbol
+        signals.save("signals.npy")
+        SignalMatrix.load("signals.npy", ["rsi", "vix"], mmap_mode="r")
+    """
+
+    def __init__(self, indicators: Sequence[str], data: np.ndarray):
+        indicators = tuple(indicators)
+        if len(set(indicators)) != len(indicators):
+            raise ValueError("indicator names must be unique")
+        if len(indicators) > MAX_INDICATORS:
+            raise ValueError(f"At most {MAX_INDICATORS} indicators fit in 16 bits")
+        if data.dtype != np.uint16 or data.ndim != 2:
+            raise ValueError("data must be a 2-D uint16 array (bars x symbols)")
+        self.__indicators = indicators
+        self.__bits: Dict[str, int] = {name: 2 * i for i, name in enumerate(indicators)}
+        self.__data = data
+
+    @classmethod
+    def empty(cls, indicators: Sequence[str], bars: int, symbols: int) -> "SignalMatrix":
+        return cls(indicators, np.zeros((bars, symbols), dtype=np.uint16))
+
+    @classmethod
+    def create_memmap(
+            cls, path: str, indicators: Sequence[str], bars: int, symbols: int
+    ) -> "SignalMatrix":
+        """Create a zeroed ``.npy`` file and fill it in place"""
+        data = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.uint16, shape=(bars, symbols)
+        )
+        return cls(indicators, data)
+
+    @classmethod
+    def load(
+            cls, path: str, indicators: Sequence[str], mmap_mode: Optional[str] = None
+    ) -> "SignalMatrix":
+        """Load a saved matrix; ``mmap_mode="r"`` maps it without reading it all"""
+        return cls(indicators, np.load(path, mmap_mode=mmap_mode))
+
+    def save(self, path: str):
+        np.save(path, self.__data)
+
+    def flush(self):
+        """Write pending changes of a memory-mapped matrix to disk"""
+        if isinstance(self.__data, np.memmap):
+            self.__data.flush()
+
+    @property
+    def indicators(self) -> Tuple[str, ...]:
+        return self.__indicators
+
+    @property
+    def data(self) -> np.ndarray:
+        """The packed uint16 matrix"""
+        return self.__data
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.__data.shape  # type: ignore[return-value]
+
+    def mask(self, indicator: str, flag: str) -> np.uint16:
+        """Bit mask of one indicator's buy or sell flag"""
+        if flag not in FLAGS:
+            raise ValueError(f"flag must be one of {FLAGS}")
+        return np.uint16(1 << (self.__bits[indicator] + FLAGS.index(flag)))
+
+    def set(
+            self,
+            indicator: str,
+            buy: Any = None,
+            sell: Any = None,
+            rows: Any = slice(None),
+    ):
+        """
+        Overwrite an indicator's flags for ``rows`` (all bars by default, or a
+        bar index/slice) from boolean arrays broadcastable to those rows
+        """
+        data = self.__data
+        for flag, values in (("buy", buy), ("sell", sell)):
+            if values is None:
+                continue
+            mask = self.mask(indicator, flag)
+            values = np.asarray(values, dtype=bool)
+            data[rows] = (data[rows] & ~mask) | (values.astype(np.uint16) * mask)
+
+    def codes(self, indicator: str, rows: Any = slice(None)) -> np.ndarray:
+        """Matrix of an indicator's ``BUY | SELL`` codes (uint8)"""
+        return ((self.__data[rows] >> self.__bits[indicator]) & 3).astype(np.uint8)
+
+    def flag(self, indicator: str, flag: str, rows: Any = slice(None)) -> np.ndarray:
+        """Boolean matrix of one flag"""
+        return (self.__data[rows] & self.mask(indicator, flag)) != 0
+
+    def count(self, indicator: str, flag: str, axis: Optional[int] = 0) -> Any:
+        """Number of bars with the flag set, per symbol (``axis=0``) or per bar"""
+        return np.count_nonzero(self.flag(indicator, flag), axis=axis)
+
+    def transitions(
+            self, indicator: str, flag: str, rising: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (bar, symbol) indices where the flag switches on (``rising``) or off.
+        A flag already set on the first bar counts as switching on.
+        """
+        flags = self.flag(indicator, flag)
+        previous = np.zeros_like(flags)
+        previous[1:] = flags[:-1]
+        changed = flags & ~previous if rising else previous & ~flags
+        bars, symbols = np.nonzero(changed)
+        return bars, symbols
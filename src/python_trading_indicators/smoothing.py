@@ -0,0 +1,393 @@
+"""
+Moving-average kernels shared by the indicators.
+
+Each method has a vectorized ``*_series`` function over 1-D or 2-D
+(bars x symbols) arrays and an O(1) streaming class whose ``update`` takes one
+value, or one row of values per symbol. Series have the input's length and are
+NaN until the first ``period`` values are in; EMA and Wilder are seeded with
+their simple mean::
+
+    fast = ema_series(closes, 12)
+    smoother = smoother_for("wilder", 14)
+    for close in closes:
+        value = smoother.update(close)
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Tuple, Type
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pandas import DataFrame
+
+METHODS = ("sma", "ema", "wilder", "wma")
+
+
+def _check_method(method: str):
+    if method not in METHODS:
+        raise ValueError(f"smoothing method must be one of {METHODS}")
+
+
+def _check_period(period: int):
+    if period < 1:
+        raise ValueError("period must be >= 1")
+
+
+def _prepare(values: Any, period: int) -> np.ndarray:
+    _check_period(period)
+    return np.asarray(values)
+
+
+def _nan_head(length: int, period: int, tail: np.ndarray, dtype: Any) -> np.ndarray:
+    # `tail` holds the values from index `period - 1` on
+    result = np.full((length,) + tail.shape[1:], np.nan, dtype=dtype)
+    result[period - 1:] = tail
+    return result
+
+
+def _window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    sums = np.cumsum(values, axis=0, dtype=np.float64)
+    sums = np.concatenate([np.zeros((1,) + sums.shape[1:]), sums])
+    return sums[period:] - sums[:-period]
+
+
+def sma_series(values: Any, period: int, dtype: Any = np.float64) -> np.ndarray:
+    """
+    Simple moving average; float64 running sums whatever ``dtype``. Windows
+    holding a NaN (or infinite) value are NaN, and later windows are not.
+    """
+    values = _prepare(values, period)
+    if len(values) < period:
+        return np.full(values.shape, np.nan, dtype=dtype)
+    with np.errstate(invalid="ignore"):
+        missing = ~np.isfinite(values)
+        means = _window_sums(np.where(missing, 0.0, values), period) / period
+        tail = np.where(_window_sums(missing, period) > 0, np.nan, means)
+    return _nan_head(len(values), period, tail, dtype)
+
+
+def ewm_series(
+        values: Any, alpha: float, initial: Any = None, dtype: Any = np.float64
+) -> np.ndarray:
+    """
+    ``y[i] = y[i - 1] + alpha * (values[i] - y[i - 1])`` from ``y[-1] = initial``
+    (``y[0] = values[0]`` without one), through pandas' compiled EWM. NaN values
+    are skipped (``y[i] = y[i - 1]``) and a NaN ``y`` restarts at the next value.
+    """
+    values = np.asarray(values)
+    if not len(values):
+        return np.empty(values.shape, dtype=dtype)
+    sequence = values.reshape(len(values), -1)
+    if initial is not None:
+        sequence = np.concatenate([np.reshape(initial, (1, -1)), sequence])
+    smoothed = DataFrame(sequence).ewm(alpha=alpha, adjust=False, ignore_na=True).mean().to_numpy(dtype=dtype)
+    if initial is not None:
+        smoothed = smoothed[1:]
+    return smoothed.reshape(values.shape)
+
+
+def _seeded_ewm(values: Any, period: int, alpha: float, dtype: Any) -> np.ndarray:
+    values = _prepare(values, period)
+    if len(values) < period:
+        return np.full(values.shape, np.nan, dtype=dtype)
+    seed = values[:period].sum(axis=0, dtype=np.float64) / period
+    tail = ewm_series(values[period:], alpha, seed, np.float64)
+    return _nan_head(len(values), period, np.concatenate([seed[None], tail]), dtype)
+
+
+def ema_series(values: Any, period: int, dtype: Any = np.float64) -> np.ndarray:
+    """Exponential moving average, ``alpha = 2 / (period + 1)``"""
+    return _seeded_ewm(values, period, 2.0 / (period + 1), dtype)
+
+
+def wilder_series(values: Any, period: int, dtype: Any = np.float64) -> np.ndarray:
+    """Wilder's running moving average (RMA), ``alpha = 1 / period``"""
+    return _seeded_ewm(values, period, 1.0 / period, dtype)
+
+
+def wma_series(values: Any, period: int, dtype: Any = np.float64) -> np.ndarray:
+    """
+    Linearly weighted moving average, weights 1..``period`` oldest to newest;
+    windows holding a NaN value are NaN
+    """
+    values = _prepare(values, period)
+    if len(values) < period:
+        return np.full(values.shape, np.nan, dtype=dtype)
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    windows = sliding_window_view(values.astype(np.float64, copy=False), period, axis=0)
+    tail = windows @ weights / weights.sum()
+    return _nan_head(len(values), period, tail, dtype)
+
+
+_SERIES = {
+    "sma": sma_series,
+    "ema": ema_series,
+    "wilder": wilder_series,
+    "wma": wma_series,
+}
+
+
+def smooth_series(
+        values: Any, period: int, method: str = "sma", dtype: Any = np.float64
+) -> np.ndarray:
+    """The ``method`` moving average of ``values`` (see ``METHODS``)"""
+    _check_method(method)
+    return _SERIES[method](values, period, dtype)
+
+
+class Smoother(ABC):
+    """
+    Streaming moving average. ``update`` adds a value (a scalar, or an array
+    with one value per symbol) and returns the average, NaN until ``period``
+    values are in; ``peek`` returns what ``update`` would without adding it.
+    ``load`` starts a smoother over a whole history at once.
+    """
+
+    __slots__ = ("period", "count", "value")
+
+    def __init__(self, period: int):
+        _check_period(period)
+        self.period = period
+        self.count = 0
+        self.value: Any = np.nan
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+    def update(self, value: Any) -> Any:
+        self.count += 1
+        self.value = self._push(value)
+        return self.value
+
+    def load(self, values: Any) -> "Smoother":
+        """Reset to the state after updating with every row of ``values``"""
+        values = np.asarray(values, dtype=np.float64)
+        self.__init__(self.period)  # type: ignore[misc]
+        # Only the last `period` values stay in a window
+        tail = values[-self.period:]
+        self.count = len(values) - len(tail)
+        for value in tail:
+            self.update(value if value.ndim else float(value))
+        return self
+
+    @abstractmethod
+    def peek(self, value: Any) -> Any:
+        """The average after ``value``, leaving the smoother untouched"""
+
+    @abstractmethod
+    def _push(self, value: Any) -> Any:
+        pass
+
+
+def _finite(value: Any) -> Any:
+    # (value or 0.0, 1 if it is not finite) so a NaN never enters a running sum
+    missing = ~np.isfinite(value)
+    if np.ndim(missing):
+        return np.where(missing, 0.0, value), missing.astype(np.int64)
+    return (0.0, 1) if missing else (value, 0)
+
+
+def _masked(average: Any, missing: Any) -> Any:
+    # NaN where the window holds `missing` non-finite values
+    if np.ndim(average):
+        return np.where(missing > 0, np.nan, average)
+    return float("nan") if missing else average
+
+
+def _add_moment(mean: float, m2: float, count: int, value: float) -> Tuple[float, float]:
+    # Welford update; `count` includes the added value
+    delta = value - mean
+    mean += delta / count
+    return mean, m2 + delta * (value - mean)
+
+
+def _remove_moment(
+        mean: float, m2: float, count: int, value: float
+) -> Tuple[float, float]:
+    # Inverse Welford update; `count` excludes the removed value
+    if not count:
+        return 0.0, 0.0
+    delta = value - mean
+    mean -= delta / count
+    return mean, m2 - delta * (value - mean)
+
+
+class SMA(Smoother):
+    """
+    Simple moving average from a running sum of the finite values, NaN while
+    the window holds a non-finite one
+    """
+
+    __slots__ = ("values", "total", "missing")
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.values: Deque[Any] = deque()
+        self.total: Any = 0.0
+        self.missing: Any = 0
+
+    def peek(self, value: Any) -> Any:
+        if self.count + 1 < self.period:
+            return np.nan * value
+        value, missing = _finite(value)
+        total = self.total + value
+        missing = self.missing + missing
+        if self.count >= self.period:
+            oldest, oldest_missing = _finite(self.values[0])
+            total = total - oldest
+            missing = missing - oldest_missing
+        return self._mean(total, missing)
+
+    def _push(self, value: Any) -> Any:
+        values = self.values
+        if len(values) == self.period:
+            oldest, oldest_missing = _finite(values.popleft())
+            self.total = self.total - oldest
+            self.missing = self.missing - oldest_missing
+        values.append(value)
+        value, missing = _finite(value)
+        self.total = self.total + value
+        self.missing = self.missing + missing
+        if self.count < self.period:
+            return np.nan * self.total
+        return self._mean(self.total, self.missing)
+
+    def _mean(self, total: Any, missing: Any) -> Any:
+        return _masked(total / self.period, missing)
+
+
+class _Exponential(Smoother):
+    """
+    Exponential smoothing seeded with the mean of the first values. Like
+    ``ewm_series``, NaN values leave the average as it is and a NaN average
+    (a NaN among the seed values) restarts at the next value.
+    """
+
+    __slots__ = ("alpha", "total")
+
+    def __init__(self, period: int, alpha: float):
+        super().__init__(period)
+        self.alpha = alpha
+        self.total: Any = 0.0
+
+    def load(self, values: Any) -> Smoother:
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) <= self.period:
+            self.count = 0
+            self.total = 0.0
+            for value in values:
+                self.update(value if value.ndim else float(value))
+            return self
+        # The whole history matters: take the last value of the series
+        self.count = len(values)
+        last = _seeded_ewm(values, self.period, self.alpha, np.float64)[-1]
+        self.value = last if last.ndim else float(last)
+        return self
+
+    def peek(self, value: Any) -> Any:
+        if self.count >= self.period:
+            return self._step(value)
+        if self.count + 1 < self.period:
+            return np.nan * value
+        return (self.total + value) / self.period
+
+    def _push(self, value: Any) -> Any:
+        if self.count > self.period:
+            return self._step(value)
+        self.total = self.total + value
+        if self.count < self.period:
+            return np.nan * value
+        return self.total / self.period
+
+    def _step(self, value: Any) -> Any:
+        previous = self.value
+        stepped = previous + self.alpha * (value - previous)
+        if np.ndim(stepped):
+            skipped = np.where(np.isnan(previous), value, stepped)
+            return np.where(np.isnan(value), previous, skipped)
+        if math.isnan(value):
+            return previous
+        return value if math.isnan(previous) else stepped
+
+
+class EMA(_Exponential):
+    """Exponential moving average, ``alpha = 2 / (period + 1)``"""
+
+    __slots__ = ()
+
+    def __init__(self, period: int):
+        super().__init__(period, 2.0 / (period + 1))
+
+
+class WilderMA(_Exponential):
+    """Wilder's running moving average (RMA), ``alpha = 1 / period``"""
+
+    __slots__ = ()
+
+    def __init__(self, period: int):
+        super().__init__(period, 1.0 / period)
+
+
+class WMA(Smoother):
+    """
+    Linearly weighted moving average. Each value lowers every weight in the
+    window by one: ``weighted - total + period * value`` keeps it O(1). The
+    sums hold the finite values; the average is NaN while the window holds a
+    non-finite one.
+    """
+
+    __slots__ = ("values", "total", "weighted", "missing", "divisor")
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.values: Deque[Any] = deque()
+        self.total: Any = 0.0
+        self.weighted: Any = 0.0
+        self.missing: Any = 0
+        self.divisor = period * (period + 1) / 2
+
+    def peek(self, value: Any) -> Any:
+        if self.count + 1 < self.period:
+            return np.nan * value
+        value, missing = _finite(value)
+        missing = self.missing + missing
+        if len(self.values) == self.period:
+            missing = missing - _finite(self.values[0])[1]
+        return _masked(self._weighted(value) / self.divisor, missing)
+
+    def _weighted(self, value: Any) -> Any:
+        if len(self.values) == self.period:
+            return self.weighted - self.total + self.period * value
+        return self.weighted + (len(self.values) + 1) * value
+
+    def _push(self, value: Any) -> Any:
+        values = self.values
+        finite, missing = _finite(value)
+        self.weighted = self._weighted(finite)
+        if len(values) == self.period:
+            oldest, oldest_missing = _finite(values.popleft())
+            self.total = self.total - oldest
+            self.missing = self.missing - oldest_missing
+        values.append(value)
+        self.total = self.total + finite
+        self.missing = self.missing + missing
+        if self.count < self.period:
+            return np.nan * value
+        return _masked(self.weighted / self.divisor, self.missing)
+
+
+_SMOOTHERS: Dict[str, Type[Smoother]] = {
+    "sma": SMA,
+    "ema": EMA,
+    "wilder": WilderMA,
+    "wma": WMA,
+}
+
+
+def smoother_for(method: str, period: int) -> Smoother:
+    """A streaming ``method`` moving average (see ``METHODS``)"""
+    _check_method(method)
+    return _SMOOTHERS[method](period)
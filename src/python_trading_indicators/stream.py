@@ -0,0 +1,114 @@
+"""
+Streaming indicator with bounded rewind for corrected bars.
+
+``IndicatorStream`` wraps one config and one symbol's state. Besides the live
+state it keeps a checkpoint that lags ``retention`` bars behind, together with
+those bars, so a feed correction for one of the last ``retention`` bars is
+applied by restoring the checkpoint and replaying at most ``retention`` bars.
+Older corrections fall back to a full recompute from the corrected history.
+"""
+
+import copy
+from collections import deque
+from typing import Any, Deque, List
+
+import numpy as np
+
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    IndicatorState,
+    candle_bars,
+    column,
+)
+from python_trading_indicators.indicator import IndicatorSnapshot
+
+
+COLUMNS = ("open", "high", "low", "close", "volume", "timestamp")
+
+
+class IndicatorStream:
+    """
+    One symbol's streaming state for ``config`` that accepts corrections of
+    the last ``retention`` bars::
+
+        stream = IndicatorStream(RSIConfig(14), retention=3, candles=history)
+        stream.update(bar)
+        stream.correct(corrected_bar, bars_ago=1)
+    """
+
+    def __init__(self, config: IndicatorConfig, retention: int = 3, candles: Any = None):
+        if retention < 1:
+            raise ValueError("retention must be >= 1")
+        self.__config = config
+        self.__retention = retention
+        # State before the retained bars, advanced as bars leave the window
+        self.__checkpoint = config.new_state()
+        self.__bars: Deque[Bar] = deque()
+        self.__state = config.new_state()
+        if candles is not None:
+            self.reset(candles)
+
+    @property
+    def config(self) -> IndicatorConfig:
+        return self.__config
+
+    @property
+    def retention(self) -> int:
+        return self.__retention
+
+    @property
+    def state(self) -> IndicatorState:
+        return self.__state
+
+    @property
+    def bars(self) -> List[Bar]:
+        """Return the retained bars, oldest first"""
+        return list(self.__bars)
+
+    def reset(self, candles: Any) -> IndicatorState:
+        """Recompute everything from a full candle history"""
+        count = len(column(candles, "close"))
+        start = count - min(self.__retention, count)
+        head = {
+            name: np.asarray(candles[name])[:start] for name in COLUMNS if name in candles
+        }
+        self.__checkpoint = self.__config.compute(head)
+        self.__bars = deque(candle_bars(candles, start))
+        self.__state = self.__config.replay(
+            self.__bars, copy.deepcopy(self.__checkpoint)
+        )
+        return self.__state
+
+    def update(self, bar: Bar) -> IndicatorState:
+        """Advance by one closed bar"""
+        self.__config.update(self.__state, bar)
+        bars = self.__bars
+        bars.append(bar)
+        if len(bars) > self.__retention:
+            self.__config.update(self.__checkpoint, bars.popleft())
+        return self.__state
+
+    def peek(self, bar: Bar) -> IndicatorSnapshot:
+        """Provisional reading of a forming bar (see ``IndicatorConfig.peek``)"""
+        return self.__config.peek(self.__state, bar)
+
+    def correct(self, bar: Bar, bars_ago: int = 0, candles: Any = None) -> IndicatorState:
+        """
+        Replace the bar ``bars_ago`` bars before the latest one (0 is the latest)
+        and rewind. Corrections beyond the retained bars need the corrected
+        ``candles`` history and trigger a full recompute.
+        """
+        if bars_ago < 0:
+            raise ValueError("bars_ago must be >= 0")
+        bars = self.__bars
+        if bars_ago >= len(bars):
+            if candles is None:
+                raise ValueError(
+                    f"Cannot rewind {bars_ago} bars with {len(bars)} retained; "
+                    "pass the corrected candles to recompute"
+                )
+            return self.reset(candles)
+        bars[len(bars) - 1 - bars_ago] = bar
+        self.__state = self.__config.replay(bars, copy.deepcopy(self.__checkpoint))
+        return self.__state
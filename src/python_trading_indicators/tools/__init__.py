@@ -4,6 +4,29 @@ Tools and utilities for indicators.
 This module contains utility functions and tools used by the indicators.
 """
 
-from .logger import logger
+from .logger import (
+    RateLimitFilter,
+    clear_log_rate_limit,
+    configure_logging,
+    get_logger,
+    logger,
+    set_log_rate_limit,
+    start_queue_logging,
+    stop_queue_logging,
+)
+from .metrics import IndicatorStats, LatencyHistogram, export_json, export_prometheus
 
-__all__ = ["logger"]
+__all__ = [
+    "logger",
+    "get_logger",
+    "RateLimitFilter",
+    "set_log_rate_limit",
+    "clear_log_rate_limit",
+    "configure_logging",
+    "start_queue_logging",
+    "stop_queue_logging",
+    "IndicatorStats",
+    "LatencyHistogram",
+    "export_json",
+    "export_prometheus",
+]
@@ -1,5 +1,152 @@
 import logging
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Dict, Optional
 
 log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-logging.basicConfig(level=logging.INFO, format=log_format)
-logger = logging.getLogger(__name__)
+
+ROOT_LOGGER_NAME = "python_trading_indicators"
+
+# Library loggers never configure the root logger: records are dropped unless the
+# application installs handlers (configure_logging / start_queue_logging).
+logger = logging.getLogger(ROOT_LOGGER_NAME)
+logger.addHandler(logging.NullHandler())
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the per-indicator logger ``python_trading_indicators.<name>``"""
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Sample and rate-limit log records of a single logger.
+
+    ``sample_every`` keeps one record out of every N, ``max_per_second`` caps the
+    remaining records with a token bucket. Records at ``max_level`` or above
+    (warnings by default) are never dropped.
+    """
+
+    def __init__(
+            self,
+            sample_every: int = 1,
+            max_per_second: Optional[float] = None,
+            max_level: int = logging.WARNING,
+    ):
+        super().__init__()
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        if max_per_second is not None and max_per_second <= 0:
+            raise ValueError("max_per_second must be positive")
+        self.__sample_every = sample_every
+        self.__max_per_second = max_per_second
+        self.__max_level = max_level
+        self.__seen = 0
+        self.__tokens = max_per_second or 0.0
+        self.__last_refill = time.monotonic()
+        self.__lock = threading.Lock()
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.__max_level:
+            return True
+        with self.__lock:
+            self.__seen += 1
+            if (self.__seen - 1) % self.__sample_every:
+                self.dropped += 1
+                return False
+            if self.__max_per_second is None:
+                return True
+            now = time.monotonic()
+            self.__tokens = min(
+                self.__max_per_second,
+                self.__tokens + (now - self.__last_refill) * self.__max_per_second,
+            )
+            self.__last_refill = now
+            if self.__tokens < 1.0:
+                self.dropped += 1
+                return False
+            self.__tokens -= 1.0
+            return True
+
+
+_rate_limits: Dict[str, RateLimitFilter] = {}
+
+
+def set_log_rate_limit(
+        name: str,
+        sample_every: int = 1,
+        max_per_second: Optional[float] = None,
+) -> RateLimitFilter:
+    """
+    Install (or replace) sampling/rate limiting on an indicator logger, e.g.
+    ``set_log_rate_limit("rsi", sample_every=100)``.
+    """
+    target = get_logger(name)
+    clear_log_rate_limit(name)
+    rate_limit = RateLimitFilter(sample_every, max_per_second)
+    target.addFilter(rate_limit)
+    _rate_limits[name] = rate_limit
+    return rate_limit
+
+
+def clear_log_rate_limit(name: str):
+    rate_limit = _rate_limits.pop(name, None)
+    if rate_limit is not None:
+        get_logger(name).removeFilter(rate_limit)
+
+
+def configure_logging(level: int = logging.INFO, fmt: str = log_format) -> logging.Handler:
+    """
+    Attach a synchronous stderr handler to the library logger.
+    Mirrors the behaviour the package used to apply at import time.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
+
+
+_queue_handler: Optional[QueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+
+
+def start_queue_logging(
+        *handlers: logging.Handler,
+        level: int = logging.INFO,
+        fmt: str = log_format,
+) -> QueueListener:
+    """
+    Route library log records through an in-memory queue so handler I/O
+    happens on a background thread instead of the compute thread. Records are
+    still formatted on the logging thread, by ``QueueHandler.prepare``.
+
+    Defaults to a single stderr handler when no handlers are given.
+    """
+    global _queue_handler, _queue_listener
+    stop_queue_logging()
+    if not handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(fmt))
+        handlers = (stream_handler,)
+    queue: SimpleQueue = SimpleQueue()
+    _queue_handler = QueueHandler(queue)
+    _queue_listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    logger.addHandler(_queue_handler)
+    logger.setLevel(level)
+    _queue_listener.start()
+    return _queue_listener
+
+
+def stop_queue_logging():
+    """Flush pending records and detach the queue handler, if any"""
+    global _queue_handler, _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+        _queue_handler = None
@@ -0,0 +1,169 @@
+import json
+from typing import Any, Dict, Iterable, List
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded as integer nanoseconds. Each power of two is split into
+    ``2 ** significant_bits`` linear sub-buckets, so any reported percentile is
+    within ``2 ** -significant_bits`` relative error of the recorded value while
+    recording stays O(1) and memory stays fixed.
+    """
+
+    def __init__(self, significant_bits: int = 5):
+        if significant_bits < 1:
+            raise ValueError("significant_bits must be >= 1")
+        self.__bits = significant_bits
+        self.__counts: List[int] = [0] * ((64 + 2) << significant_bits)
+        self.__total_count = 0
+        self.__total_ns = 0
+        self.__min_ns = 0
+        self.__max_ns = 0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.__bits - 1
+        if shift <= 0:
+            return value
+        return (shift << self.__bits) + (value >> shift)
+
+    def _lowest_value(self, index: int) -> int:
+        shift = (index >> self.__bits) - 1
+        if shift <= 0:
+            return index
+        return (index - (shift << self.__bits)) << shift
+
+    def _highest_value(self, index: int) -> int:
+        shift = (index >> self.__bits) - 1
+        if shift <= 0:
+            return index
+        return self._lowest_value(index) + (1 << shift) - 1
+
+    def record(self, value_ns: int):
+        value_ns = max(int(value_ns), 0)
+        self.__counts[self._index(value_ns)] += 1
+        if self.__total_count == 0 or value_ns < self.__min_ns:
+            self.__min_ns = value_ns
+        if value_ns > self.__max_ns:
+            self.__max_ns = value_ns
+        self.__total_count += 1
+        self.__total_ns += value_ns
+
+    def percentile(self, quantile: float) -> int:
+        """Return the recorded value at ``quantile`` (0..1), in nanoseconds"""
+        if not 0.0 <= quantile <= 1.0:
+            raise ValueError("quantile must be between 0 and 1")
+        if self.__total_count == 0:
+            return 0
+        target = max(1, int(round(quantile * self.__total_count)))
+        seen = 0
+        for index, count in enumerate(self.__counts):
+            if count:
+                seen += count
+                if seen >= target:
+                    return min(self._highest_value(index), self.__max_ns)
+        return self.__max_ns
+
+    def reset(self):
+        self.__counts = [0] * len(self.__counts)
+        self.__total_count = 0
+        self.__total_ns = 0
+        self.__min_ns = 0
+        self.__max_ns = 0
+
+    @property
+    def count(self) -> int:
+        return self.__total_count
+
+    @property
+    def total_ns(self) -> int:
+        return self.__total_ns
+
+    @property
+    def min_ns(self) -> int:
+        return self.__min_ns
+
+    @property
+    def max_ns(self) -> int:
+        return self.__max_ns
+
+
+class IndicatorStats:
+    """
+    Compute counters for a single indicator instance.
+
+    Collected by ``Indicator.calculate`` once ``Indicator.enable_stats`` has been
+    called; indicators without stats never touch this class.
+    """
+
+    def __init__(self, name: str, significant_bits: int = 5):
+        self.name = name
+        self.latency = LatencyHistogram(significant_bits)
+        self.rows = 0
+
+    @property
+    def calls(self) -> int:
+        return self.latency.count
+
+    def record(self, elapsed_ns: int, rows: int):
+        self.latency.record(elapsed_ns)
+        self.rows += rows
+
+    def reset(self):
+        self.latency.reset()
+        self.rows = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of the counters (latencies in nanoseconds)"""
+        calls = self.calls
+        snapshot: Dict[str, Any] = {
+            "name": self.name,
+            "calls": calls,
+            "rows": self.rows,
+            "total_ns": self.latency.total_ns,
+            "mean_ns": self.latency.total_ns / calls if calls else 0.0,
+            "min_ns": self.latency.min_ns,
+            "max_ns": self.latency.max_ns,
+        }
+        for quantile in DEFAULT_QUANTILES:
+            snapshot[f"p{quantile * 100:g}_ns"] = self.latency.percentile(quantile)
+        return snapshot
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def export_prometheus(stats: Iterable[IndicatorStats]) -> str:
+    """Render indicator stats in the Prometheus text exposition format"""
+    stats = list(stats)
+    lines = [
+        "# HELP indicator_compute_seconds Time spent in compute_indicator.",
+        "# TYPE indicator_compute_seconds summary",
+    ]
+    for item in stats:
+        label = f'indicator="{_escape_label(item.name)}"'
+        for quantile in DEFAULT_QUANTILES:
+            value = item.latency.percentile(quantile) / 1e9
+            lines.append(
+                f'indicator_compute_seconds{{{label},quantile="{quantile:g}"}} {value:.9g}'
+            )
+        lines.append(
+            f"indicator_compute_seconds_sum{{{label}}} {item.latency.total_ns / 1e9:.9g}"
+        )
+        lines.append(f"indicator_compute_seconds_count{{{label}}} {item.calls}")
+    lines.append("# HELP indicator_rows_total Candle rows passed to compute_indicator.")
+    lines.append("# TYPE indicator_rows_total counter")
+    for item in stats:
+        lines.append(
+            f'indicator_rows_total{{indicator="{_escape_label(item.name)}"}} {item.rows}'
+        )
+    return "\n".join(lines) + "\n"
+
+
+def export_json(stats: Iterable[IndicatorStats]) -> str:
+    """Render indicator stats snapshots as a JSON array"""
+    return json.dumps([item.snapshot() for item in stats])
@@ -1,8 +1,464 @@
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, List, Optional, Tuple
+
 import numpy as np
 from pandas import DataFrame
 
-from python_trading_indicators.indicator import Indicator
-from python_trading_indicators.tools.logger import logger
+from python_trading_indicators.config import (
+    Bar,
+    IndicatorConfig,
+    TimeWindowState,
+    _TimeWindowSum,
+    _WindowSum,
+    candle_bars,
+    candle_timestamps,
+    column,
+    time_window_series,
+    window_seconds,
+    window_start,
+)
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.quantile import (
+    AdaptiveThresholds,
+    RollingQuantile,
+    adaptive_thresholds,
+)
+from python_trading_indicators.smoothing import (
+    _add_moment,
+    _remove_moment,
+    sma_series,
+)
+from python_trading_indicators.tools.logger import get_logger
+from python_trading_indicators.volume import (
+    METHODS as VOLUME_METHODS,
+    VolumeBaseline,
+    latest_volume_confirmed,
+)
+
+logger = get_logger("vix")
+
+TRADING_DAYS = 252
+# "close" uses close-to-close log returns; the others the OHLC range of each bar
+ESTIMATORS = ("close", "parkinson", "garman_klass", "rogers_satchell")
+LN2 = math.log(2)
+
+
+def bars_per_year(
+        interval: float, session: float = 6.5 * 3600, trading_days: int = TRADING_DAYS
+) -> float:
+    """``periods_per_year`` for ``interval``-second bars over ``session``-second days"""
+    return trading_days * session / interval
+
+
+def vix_series(
+        closes: Any,
+        period: int = 14,
+        dtype: Any = np.float64,
+        periods_per_year: float = TRADING_DAYS,
+) -> np.ndarray:
+    """
+    VIX for every bar from index ``period`` on (NaN while undefined), computed
+    like ``VIXIndicator``. ``closes`` may be 1-D, or 2-D with one column per
+    symbol (bars x symbols). With ``dtype=np.float32`` log returns are stored in
+    float32 and the rolling moments still accumulate in float64.
+    """
+    closes = np.asarray(closes, dtype=dtype)
+    if len(closes) <= period:
+        return np.empty((0,) + closes.shape[1:], dtype=dtype)
+    frame = DataFrame(closes.reshape(len(closes), -1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.log(frame / frame.shift(1))
+    volatility = returns.rolling(window=period).std() * np.sqrt(periods_per_year) * 100
+    return volatility.to_numpy(dtype=dtype)[period:].reshape(
+        (len(closes) - period,) + closes.shape[1:]
+    )
+
+
+def _range_variance(
+        estimator: str, log: Any, open_: Any, high: Any, low: Any, close: Any
+) -> Any:
+    # One bar's variance estimate; `log` is math.log for scalars, np.log for arrays
+    high_low = log(high / low)
+    if estimator == "parkinson":
+        return high_low * high_low / (4 * LN2)
+    if estimator == "garman_klass":
+        close_open = log(close / open_)
+        return 0.5 * high_low * high_low - (2 * LN2 - 1) * close_open * close_open
+    return log(high / close) * log(high / open_) + log(low / close) * log(low / open_)
+
+
+def range_volatility_series(
+        opens: Any,
+        highs: Any,
+        lows: Any,
+        closes: Any,
+        period: int = 14,
+        estimator: str = "parkinson",
+        periods_per_year: float = TRADING_DAYS,
+        dtype: Any = np.float64,
+) -> np.ndarray:
+    """
+    Annualized range-based volatility (Parkinson, Garman-Klass or
+    Rogers-Satchell) over the last ``period`` bars, for every bar from index
+    ``period - 1`` on. Bars without a finite variance estimate are left out of
+    their windows' averages (NaN if none is left). Inputs may be 1-D or 2-D
+    (bars x symbols); the rolling sums accumulate in float64.
+    """
+    if estimator not in ESTIMATORS[1:]:
+        raise ValueError(f"estimator must be one of {ESTIMATORS[1:]}")
+    columns = [np.asarray(values, dtype=dtype) for values in (opens, highs, lows, closes)]
+    closes = columns[3]
+    if len(closes) < period:
+        return np.empty((0,) + closes.shape[1:], dtype=dtype)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variances = _range_variance(estimator, np.log, *columns)
+        finite = np.isfinite(variances)
+        # Mean of the finite variances in each window
+        variance = (
+            sma_series(np.where(finite, variances, 0.0), period)
+            / sma_series(finite.astype(np.float64), period)
+        )[period - 1:]
+    volatility = np.sqrt(np.maximum(variance, 0.0)) * math.sqrt(periods_per_year) * 100
+    return volatility.astype(dtype)
+
+
+class VIXState(TimeWindowState):
+    __slots__ = (
+        "prev_close",
+        "returns",
+        "times",
+        "mean",
+        "m2",
+        "ranges",
+        "volumes",
+        "vix",
+        "volume_confirmed",
+        "quantiles",
+        "thresholds",
+    )
+
+    def __init__(
+            self,
+            period: int,
+            window: Optional[float] = None,
+            estimator: str = "close",
+            volume_method: str = "mean",
+            adaptive: Optional[AdaptiveThresholds] = None,
+    ):
+        super().__init__()
+        self.prev_close = 0.0
+        self.returns: Deque[float] = deque()
+        # Timestamps of `returns`, only kept for a time window
+        self.times: Deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+        # Per-bar variances of a range estimator
+        self.ranges: Any = None
+        if estimator != "close":
+            self.ranges = _WindowSum(period) if window is None else _TimeWindowSum()
+        self.volumes = VolumeBaseline(period - 1, volume_method, timed=window is not None)
+        self.vix: Optional[float] = None
+        self.volume_confirmed = False
+        # Recent VIX values behind adaptive thresholds
+        self.quantiles: Optional[RollingQuantile] = (
+            None if adaptive is None else adaptive.new_window()
+        )
+        # (buy, sell) levels the published VIX was held to
+        self.thresholds: Optional[Tuple[float, float]] = None
+
+
+@dataclass(frozen=True)
+class VIXConfig(IndicatorConfig):
+    """
+    ``period`` counts log returns; with a time ``window`` (seconds) the VIX
+    uses the returns of the bars in the last ``window`` seconds instead, and is
+    published once the bars seen span a whole window.
+
+    A range ``estimator`` (see ``ESTIMATORS``) averages per-bar OHLC variance
+    estimates over the last ``period`` bars instead, so it is ready after
+    ``period`` bars. ``periods_per_year`` sets the annualization (252 daily
+    bars; see ``bars_per_year`` for intraday bars).
+
+    Buy / sell fire below ``panic_threshold - 5`` / above ``panic_threshold``;
+    ``adaptive`` thresholds replace those levels with quantiles of the recent
+    VIX values once there are enough of them.
+    """
+
+    period: int = 14
+    panic_threshold: float = 30
+    volume_threshold: float = 1.5
+    window: Optional[float] = None
+    estimator: str = "close"
+    periods_per_year: float = TRADING_DAYS
+    volume_method: str = "mean"
+    adaptive: Optional[AdaptiveThresholds] = None
+
+    def __post_init__(self):
+        if self.period < 1:
+            raise ValueError("period must be >= 1")
+        if self.estimator not in ESTIMATORS:
+            raise ValueError(f"estimator must be one of {ESTIMATORS}")
+        if not self.periods_per_year > 0:
+            raise ValueError("periods_per_year must be > 0")
+        if self.volume_method not in VOLUME_METHODS:
+            raise ValueError(f"volume_method must be one of {VOLUME_METHODS}")
+        object.__setattr__(self, "window", window_seconds(self.window))
+        object.__setattr__(self, "adaptive", adaptive_thresholds(self.adaptive))
+
+    @property
+    def annualization(self) -> float:
+        return math.sqrt(self.periods_per_year) * 100
+
+    def new_state(self) -> VIXState:
+        return VIXState(
+            self.period, self.window, self.estimator, self.volume_method, self.adaptive
+        )
+
+    def compute(self, candles: Any) -> VIXState:
+        if self.window is not None:
+            return self._compute_window(candles)
+        if self.adaptive is not None:
+            # The last `adaptive.window + 1` values, each `period` bars deep
+            length = len(column(candles, "close"))
+            first = max(length - 1 - self.adaptive.window, 0)
+            start = max(first - self.period, 0)
+            state = self._replay(self.new_state(), candle_bars(candles, start), first - start)
+            state.bars += start
+            return state
+        if self.estimator != "close":
+            # Only the last `period` bars can influence the state
+            state = self.new_state()
+            start = max(len(column(candles, "close")) - self.period, 0)
+            state.bars = start
+            for bar in candle_bars(candles, start):
+                self._push_range(state, bar)
+            return state
+        closes = column(candles, "close")
+        volumes = column(candles, "volume")
+        period = self.period
+        state = self.new_state()
+        if len(closes) <= period:
+            for close, volume in zip(closes, volumes):
+                self._push(state, float(close), float(volume))
+            return state
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.log(closes[-period:] / closes[-period - 1: -1])
+        state.bars = len(closes)
+        state.prev_close = float(closes[-1])
+        state.returns.extend(returns.tolist())
+        state.mean = float(returns.mean())
+        state.m2 = float(((returns - state.mean) ** 2).sum())
+        state.volumes = VolumeBaseline(
+            period - 1, self.volume_method, values=volumes[-period:-1]
+        )
+        self._publish(state, float(volumes[-1]), self._volatility(state.m2, period))
+        state.volumes.push(float(volumes[-1]))
+        return state
+
+    def _compute_window(self, candles: Any) -> VIXState:
+        state = self.new_state()
+        closes = column(candles, "close")
+        if not len(closes):
+            return state
+        timestamps = candle_timestamps(candles)
+        # Adaptive thresholds also need the VIX of the `adaptive.window` bars
+        # before the last one
+        first = len(closes) - 1
+        if self.adaptive is not None:
+            first = max(first - self.adaptive.window, 0)
+        # The bar before the window supplies the first return's previous close
+        start = max(window_start(timestamps[: first + 1], self.window) - 1, 0)  # type: ignore[arg-type]
+        state.bars = start
+        state.first_timestamp = float(timestamps[0])
+        state.prev_close = float(closes[start - 1]) if start else 0.0
+        return self._replay(state, candle_bars(candles, start), first - start)
+
+    def _replay(self, state: VIXState, bars: List[Bar], first: int) -> VIXState:
+        # Only the VIX of bars from `first` on feeds the quantiles: the earlier
+        # ones may not span a whole period or window
+        quantiles, state.quantiles = state.quantiles, None
+        self.replay(bars[:first], state)
+        state.quantiles = quantiles
+        return self.replay(bars[first:], state)  # type: ignore[return-value]
+
+    def update(self, state: VIXState, bar: Bar) -> VIXState:  # type: ignore[override]
+        if self.estimator != "close":
+            self._push_range(state, bar)
+        elif self.window is None:
+            self._push(state, bar.close, bar.volume)
+        else:
+            self._push_window(state, bar.close, bar.volume, bar.timestamp)
+        return state
+
+    def peek(self, state: VIXState, bar: Bar) -> IndicatorSnapshot:  # type: ignore[override]
+        if self.window is not None:
+            return self._peek_window(state, bar)
+        sequence = state.bars + 1
+        if self.estimator != "close":
+            if sequence < self.period:
+                return IndicatorSnapshot(state.value, state.buy, state.sell, sequence)
+            vix = self._range_volatility(*state.ranges.preview(self._bar_variance(bar)))
+            return self._reading(vix, state, bar.volume, sequence)
+        if state.bars < self.period:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, sequence)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = float(np.log(bar.close / state.prev_close))
+        _, m2 = self._moments(state, value)
+        return self._reading(self._volatility(m2, self.period), state, bar.volume, sequence)
+
+    def _peek_window(self, state: VIXState, bar: Bar) -> IndicatorSnapshot:
+        # Skip the entries the window would expire instead of popping them
+        cutoff, ready = state.preview(bar.timestamp, self.window)  # type: ignore[arg-type]
+        sequence = state.bars + 1
+        if not ready:
+            return IndicatorSnapshot(state.value, state.buy, state.sell, sequence)
+        if self.estimator != "close":
+            vix = self._range_volatility(
+                *state.ranges.preview(self._bar_variance(bar), cutoff)
+            )
+            return self._reading(vix, state, bar.volume, sequence, cutoff)
+        mean, m2, count = state.mean, state.m2, len(state.returns)
+        for timestamp, value in zip(state.times, state.returns):
+            if timestamp > cutoff:
+                break
+            count -= 1
+            mean, m2 = _remove_moment(mean, m2, count, value)
+        if state.bars:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = float(np.log(bar.close / state.prev_close))
+            count += 1
+            mean, m2 = _add_moment(mean, m2, count, value)
+        return self._reading(self._volatility(m2, count), state, bar.volume, sequence, cutoff)
+
+    def _push(self, state: VIXState, close: float, volume: float):
+        state.bars += 1
+        if state.bars > 1:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = float(np.log(close / state.prev_close))
+            state.mean, state.m2 = self._moments(state, value)
+            returns = state.returns
+            if len(returns) == self.period:
+                returns.popleft()
+            returns.append(value)
+        state.prev_close = close
+        if state.bars > self.period:
+            self._publish(state, volume, self._volatility(state.m2, self.period))
+        state.volumes.push(volume)
+
+    def _push_window(
+            self, state: VIXState, close: float, volume: float, timestamp: Optional[float]
+    ):
+        # Two pointers over the bars: returns enter with their bar and leave
+        # once stamped at or before the cutoff, each exactly once
+        cutoff = state.advance(timestamp, self.window)  # type: ignore[arg-type]
+        state.bars += 1
+        returns = state.returns
+        times = state.times
+        while times and times[0] <= cutoff:
+            times.popleft()
+            state.mean, state.m2 = _remove_moment(
+                state.mean, state.m2, len(returns) - 1, returns.popleft()
+            )
+        state.volumes.expire(cutoff)
+        if state.bars > 1:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = float(np.log(close / state.prev_close))
+            returns.append(value)
+            times.append(state.timestamp)
+            state.mean, state.m2 = _add_moment(state.mean, state.m2, len(returns), value)
+        state.prev_close = close
+        if state.covers(self.window):  # type: ignore[arg-type]
+            self._publish(state, volume, self._volatility(state.m2, len(returns)))
+        state.volumes.push(volume, state.timestamp)
+
+    def _push_range(self, state: VIXState, bar: Bar):
+        # Range estimators need no previous close: a running sum of per-bar
+        # variances over the window is enough. Bars without a finite variance
+        # (e.g. a zero low) are left out of the average
+        state.bars += 1
+        ranges = state.ranges
+        variance = self._bar_variance(bar)
+        if self.window is None:
+            ranges.push(variance)
+            ready = state.bars >= self.period
+        else:
+            cutoff = state.advance(bar.timestamp, self.window)
+            ranges.expire(cutoff)
+            state.volumes.expire(cutoff)
+            ranges.push(state.timestamp, variance)
+            ready = state.covers(self.window)
+        state.prev_close = bar.close
+        if ready:
+            self._publish(
+                state, bar.volume, self._range_volatility(ranges.total, ranges.finite)
+            )
+        state.volumes.push(bar.volume, state.timestamp)
+
+    def _bar_variance(self, bar: Bar) -> float:
+        try:
+            return _range_variance(
+                self.estimator, math.log, bar.open, bar.high, bar.low, bar.close
+            )
+        except (ValueError, ZeroDivisionError):
+            return float("nan")
+
+    def _moments(self, state: VIXState, value: float) -> Tuple[float, float]:
+        # Sliding Welford update over the last `period` log returns
+        returns = state.returns
+        mean = state.mean
+        m2 = state.m2
+        count = len(returns)
+        if count == self.period:
+            count -= 1
+            mean, m2 = _remove_moment(mean, m2, count, returns[0])
+        return _add_moment(mean, m2, count + 1, value)
+
+    def _volatility(self, m2: float, count: int) -> float:
+        if count < 2:
+            return float("nan")
+        return math.sqrt(max(m2, 0.0) / (count - 1)) * self.annualization
+
+    def _range_volatility(self, total: float, count: int) -> float:
+        if count < 1:
+            return float("nan")
+        return math.sqrt(max(total / count, 0.0)) * self.annualization
+
+    def _reading(
+            self,
+            vix: float,
+            state: VIXState,
+            volume: float,
+            sequence: int,
+            cutoff: Optional[float] = None,
+    ) -> IndicatorSnapshot:
+        if math.isnan(vix):
+            return IndicatorSnapshot(0.0, False, False, sequence)
+        confirmed = state.volumes.confirms(volume, self.volume_threshold, cutoff)
+        buy_threshold, sell_threshold = self._thresholds(state)
+        return IndicatorSnapshot(
+            vix, vix < buy_threshold, vix > sell_threshold and confirmed, sequence
+        )
+
+    def _thresholds(self, state: VIXState) -> Tuple[float, float]:
+        buy_threshold = self.panic_threshold - 5
+        if state.quantiles is None:
+            return buy_threshold, self.panic_threshold
+        return self.adaptive.levels(  # type: ignore[union-attr]
+            state.quantiles, buy_threshold, self.panic_threshold
+        )
+
+    def _publish(self, state: VIXState, volume: float, vix: float):
+        state.vix = None if math.isnan(vix) else vix
+        state.volume_confirmed = state.volumes.confirms(volume, self.volume_threshold)
+        state.thresholds = self._thresholds(state)
+        state.value, state.buy, state.sell, _ = self._reading(
+            vix, state, volume, state.bars
+        )
+        state.ready = state.vix is not None
+        if state.quantiles is not None:
+            state.quantiles.push(vix)
 
 
 class VIXIndicator(Indicator):
@@ -13,56 +469,116 @@ class VIXIndicator(Indicator):
             panic_threshold: float = 30,
             volume_threshold: float = 1.5,
             enabled: bool = True,
+            history: Optional[int] = 0,
+            dtype: Any = np.float64,
+            window: Any = None,
+            estimator: str = "close",
+            periods_per_year: float = TRADING_DAYS,
+            volume_method: str = "mean",
+            adaptive: Any = None,
     ):
-        super().__init__(enabled)
+        super().__init__(enabled, history, dtype)
+        if estimator not in ESTIMATORS:
+            raise ValueError(f"estimator must be one of {ESTIMATORS}")
+        if volume_method not in VOLUME_METHODS:
+            raise ValueError(f"volume_method must be one of {VOLUME_METHODS}")
         self.__period = period
         self.__panic_threshold = panic_threshold
         self.__volume_threshold = volume_threshold
-        self.__vix = None
+        self.__window = window_seconds(window)
+        self.__estimator = estimator
+        self.__periods_per_year = periods_per_year
+        self.__volume_method = volume_method
+        # Quantiles of recent VIX values replacing the panic levels
+        self.__adaptive = adaptive_thresholds(adaptive)
+        self.__thresholds = (panic_threshold - 5, panic_threshold)
+        self.__vix: Optional[float] = None
         self.__volume_confirmed = False
 
     def compute_indicator(self, candles: DataFrame):
-        if (
-                len(candles) <= self.__period
-        ):  # Need at least period + 1 for returns calculation
+        self._history.clear()
+        if self.__window is not None:
+            self._compute_window(candles)
+            return
+        ranged = self.__estimator != "close"
+        # Returns need period + 1 candles; range estimators only period
+        if len(candles) < self.__period + (0 if ranged else 1):
             logger.warning("Not enough candles for VIXIndicator")
             self.__vix = None
             self.__volume_confirmed = False
             return
 
-        closes = candles["close"]
-        returns = np.log(closes / closes.shift(1))
-        volatility = returns.rolling(window=self.__period).std() * np.sqrt(252) * 100
-        self.__vix = (
-            volatility.iloc[-1]
-            if not volatility.empty and not np.isnan(volatility.iloc[-1])
-            else None
-        )
+        if ranged:
+            volatility = self._range_series(candles)
+        else:
+            volatility = vix_series(
+                column(candles, "close"),
+                self.__period,
+                self._dtype,
+                self.__periods_per_year,
+            )
+        self._history.assign(volatility)
+        self.__vix = float(volatility[-1]) if not np.isnan(volatility[-1]) else None
+        if self.__adaptive is not None:
+            self.__thresholds = self.__adaptive.latest(
+                volatility, self.__panic_threshold - 5, self.__panic_threshold
+            )
 
-        avg_volume = (
-            candles["volume"].iloc[-self.__period: -1].mean()
-            if len(candles) > 1
-            else 0
+        self.__volume_confirmed = latest_volume_confirmed(
+            candles["volume"],
+            self.__period - 1,
+            self.__volume_threshold,
+            self.__volume_method,
         )
-        latest_volume = candles["volume"].iloc[-1]
-        self.__volume_confirmed = (
-            bool(latest_volume > avg_volume * self.__volume_threshold)
-            if avg_volume > 0
-            else False
+
+        if self.__vix is not None:
+            logger.info(
+                "VIX: %.2f, volume_confirmed=%s", self.__vix, self.__volume_confirmed
+            )
+        else:
+            logger.info("VIX: None, volume_confirmed=%s", self.__volume_confirmed)
+
+    def _range_series(self, candles: DataFrame) -> np.ndarray:
+        if not self._history.enabled:
+            adaptive = self.__adaptive
+            candles = candles.tail(self.__period + (adaptive.window if adaptive else 0))
+        return range_volatility_series(
+            candles["open"],
+            candles["high"],
+            candles["low"],
+            candles["close"],
+            self.__period,
+            self.__estimator,
+            self.__periods_per_year,
+            self._dtype,
         )
 
-        vix_str = f"{self.__vix:.2f}" if self.__vix is not None else "None"
-        logger.info(f"VIX: {vix_str}, volume_confirmed={self.__volume_confirmed}")
+    def _compute_window(self, candles: DataFrame):
+        config = self.config
+        state = config.compute(candles)
+        if not state.covers(config.window):  # type: ignore[arg-type]
+            logger.warning("Not enough candles for VIXIndicator")
+            self.__vix = None
+            self.__volume_confirmed = False
+            return
+        if self._history.enabled:
+            self._history.assign(time_window_series(config, candles))
+        self.__vix = state.vix
+        self.__volume_confirmed = state.volume_confirmed
+        self.__thresholds = state.thresholds  # type: ignore[assignment]
+        logger.info(
+            "VIX: %s, volume_confirmed=%s", state.vix, self.__volume_confirmed
+        )
 
     def evaluate_sell_condition(self) -> bool:
         if not self.is_enabled or self.__vix is None:
             return False
-        return bool(self.__vix > self.__panic_threshold and self.__volume_confirmed)
+        return bool(self.__vix > self.__thresholds[1] and self.__volume_confirmed)
 
     def evaluate_buy_condition(self) -> bool:
         if not self.is_enabled or self.__vix is None:
             return False
-        return bool(self.__vix < self.__panic_threshold - 5)
+        return bool(self.__vix < self.__thresholds[0])
 
     @property
     def current_value(self) -> float:
@@ -75,3 +591,32 @@ class VIXIndicator(Indicator):
     def period(self) -> int:
         """Return the VIX calculation period"""
         return self.__period
+
+    @property
+    def window(self) -> Optional[float]:
+        """Return the time window in seconds, or None for a bar-count period"""
+        return self.__window
+
+    @property
+    def estimator(self) -> str:
+        """Return the volatility estimator"""
+        return self.__estimator
+
+    @property
+    def thresholds(self) -> Tuple[float, float]:
+        """Return the buy and sell levels of the last calculation"""
+        return self.__thresholds
+
+    @property
+    def config(self) -> VIXConfig:
+        """Return the stateless config equivalent to this indicator's parameters"""
+        return VIXConfig(
+            self.__period,
+            self.__panic_threshold,
+            self.__volume_threshold,
+            self.__window,
+            self.__estimator,
+            self.__periods_per_year,
+            self.__volume_method,
+            self.__adaptive,
+        )
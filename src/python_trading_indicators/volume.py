@@ -0,0 +1,296 @@
+"""
+Volume-spike confirmation shared by the indicators.
+
+A bar's volume confirms a signal when it exceeds a baseline of the previous
+volumes times a threshold. The baseline is their mean or median over the last
+``n`` bars, a time window, or the whole history. ``VolumeBaseline`` keeps it
+incrementally (O(1) mean, O(log n) median); ``volume_baseline_series`` and
+``volume_confirmed_series`` compute it for every bar at once::
+
+    baseline = VolumeBaseline(size=20, method="median")
+    for bar in bars:
+        spike = baseline.confirms(bar.volume, 1.5)
+        baseline.push(bar.volume)
+"""
+
+import heapq
+import math
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pandas import Series
+
+METHODS = ("mean", "median")
+
+
+def _check_method(method: str):
+    if method not in METHODS:
+        raise ValueError(f"volume method must be one of {METHODS}")
+
+
+def confirms(latest: float, baseline: float, threshold: float) -> bool:
+    """latest > baseline * threshold, for a positive baseline"""
+    return bool(baseline > 0 and latest > baseline * threshold)
+
+
+def volume_confirmed(latest: float, total: float, count: int, threshold: float) -> bool:
+    """Volume spike test shared by the indicators: latest > mean(prior) * threshold"""
+    if count <= 0:
+        return False
+    return confirms(latest, total / count, threshold)
+
+
+class _RollingMedian:
+    """
+    Median of a multiset with O(log n) insertions and removals: a max-heap of
+    the lower half and a min-heap of the upper half. Removed values are only
+    counted in ``delayed`` and discarded once they reach the top of a heap.
+    """
+
+    __slots__ = ("low", "high", "delayed", "low_size", "high_size")
+
+    def __init__(self):
+        self.low: List[float] = []  # Negated values
+        self.high: List[float] = []
+        self.delayed: Dict[float, int] = {}
+        self.low_size = 0
+        self.high_size = 0
+
+    def add(self, value: float):
+        if not self.low or value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._balance()
+
+    def remove(self, value: float):
+        self.delayed[value] = self.delayed.get(value, 0) + 1
+        if value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self._prune(self.low, -1.0)
+        else:
+            self.high_size -= 1
+            if self.high and value == self.high[0]:
+                self._prune(self.high, 1.0)
+        self._balance()
+
+    def value(self) -> float:
+        if self.low_size > self.high_size:
+            return -self.low[0]
+        return (self.high[0] - self.low[0]) / 2
+
+    def _prune(self, heap: List[float], sign: float):
+        delayed = self.delayed
+        while heap:
+            value = sign * heap[0]
+            count = delayed.get(value)
+            if not count:
+                return
+            if count == 1:
+                del delayed[value]
+            else:
+                delayed[value] = count - 1
+            heapq.heappop(heap)
+
+    def _balance(self):
+        # Keep low_size == high_size or high_size + 1
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1.0)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune(self.high, 1.0)
+
+
+class VolumeBaseline:
+    """
+    Mean or median of the volumes pushed so far, over the last ``size`` of
+    them, or everything when ``size`` is None. With ``timed=True`` volumes are
+    pushed with a timestamp and leave when ``expire`` passes their cutoff.
+    Missing (non-finite) volumes take their place in the window but are left
+    out of the baseline and of ``count``. ``total`` is reset to exactly 0.0
+    whenever no non-zero volume is left, so rounding drift never turns an
+    all-zero window into a positive baseline.
+    """
+
+    __slots__ = ("method", "size", "entries", "total", "count", "nonzero", "median")
+
+    def __init__(
+            self,
+            size: Optional[int] = None,
+            method: str = "mean",
+            timed: bool = False,
+            values: Iterable[float] = (),
+    ):
+        _check_method(method)
+        self.method = method
+        self.size = None if timed else size
+        # (timestamp, volume) of a bounded window; None when cumulative
+        self.entries: Optional[Deque[Tuple[Optional[float], float]]] = None
+        if timed or size is not None:
+            self.entries = deque()
+        self.total = 0.0
+        self.count = 0
+        # Finite non-zero volumes in the window
+        self.nonzero = 0
+        self.median: Optional[_RollingMedian] = (
+            _RollingMedian() if method == "median" else None
+        )
+        for value in values:
+            self.push(float(value))
+
+    def push(self, value: float, timestamp: Optional[float] = None):
+        entries = self.entries
+        if entries is not None:
+            if self.size is not None:
+                if not self.size:
+                    return
+                if len(entries) == self.size:
+                    self._evict()
+            entries.append((timestamp, value))
+        if not math.isfinite(value):
+            return
+        self.total += value
+        self.count += 1
+        if value:
+            self.nonzero += 1
+        if self.median is not None:
+            self.median.add(value)
+
+    def expire(self, cutoff: float):
+        """Remove the volumes stamped at or before ``cutoff``"""
+        entries = self.entries
+        while entries and entries[0][0] <= cutoff:  # type: ignore[operator]
+            self._evict()
+
+    def _evict(self):
+        value = self.entries.popleft()[1]  # type: ignore[union-attr]
+        if not math.isfinite(value):
+            return
+        self.total -= value
+        self.count -= 1
+        if value:
+            self.nonzero -= 1
+            if not self.nonzero:
+                self.total = 0.0  # Drop the rounding drift of the evicted volumes
+        if self.median is not None:
+            self.median.remove(value)
+
+    @property
+    def baseline(self) -> float:
+        """Mean or median of the volumes in the window (NaN when empty)"""
+        if self.count <= 0:
+            return float("nan")
+        if self.median is not None:
+            return self.median.value()
+        return self.total / self.count
+
+    def confirms(
+            self, latest: float, threshold: float, cutoff: Optional[float] = None
+    ) -> bool:
+        """
+        Whether ``latest`` is a spike against the baseline, or against the
+        baseline ``expire(cutoff)`` would leave, without expiring anything
+        """
+        entries = self.entries
+        if cutoff is not None and entries and entries[0][0] <= cutoff:  # type: ignore[operator]
+            return self._confirms_after(latest, threshold, cutoff)
+        if self.median is None:
+            return volume_confirmed(latest, self.total, self.count, threshold)
+        return self.count > 0 and confirms(latest, self.median.value(), threshold)
+
+    def _confirms_after(self, latest: float, threshold: float, cutoff: float) -> bool:
+        # O(expiring) for means; medians cannot leave the heaps untouched, so
+        # they take the median of the remaining volumes in O(window)
+        entries = self.entries
+        expiring = 0
+        total = self.total
+        count = self.count
+        nonzero = self.nonzero
+        for timestamp, value in entries:  # type: ignore[union-attr]
+            if timestamp > cutoff:  # type: ignore[operator]
+                break
+            expiring += 1
+            if math.isfinite(value):
+                total -= value
+                count -= 1
+                nonzero -= bool(value)
+        if self.median is None:
+            return volume_confirmed(latest, total if nonzero else 0.0, count, threshold)
+        remaining = [
+            value
+            for _, value in islice(entries, expiring, None)  # type: ignore[arg-type]
+            if math.isfinite(value)
+        ]
+        return bool(remaining) and confirms(latest, float(np.median(remaining)), threshold)
+
+
+def volume_baseline_series(
+        volumes: Any, window: Optional[int], method: str = "mean"
+) -> np.ndarray:
+    """
+    Baseline of every bar: the mean or median of the finite volumes among the
+    ``window`` previous ones (all previous volumes when ``window`` is None;
+    NaN when there are none). Means use float64 running sums; medians pandas'
+    rolling skiplist.
+    """
+    _check_method(method)
+    volumes = np.asarray(volumes)
+    if method == "median":
+        if window == 0:
+            return np.full(len(volumes), np.nan)
+        prior = Series(volumes, dtype=np.float64).shift(1)
+        rolling = (
+            prior.expanding(min_periods=1)
+            if window is None
+            else prior.rolling(window, min_periods=1)
+        )
+        return rolling.median().to_numpy()
+    # float64 running sums keep float32 volumes accurate over long histories
+    finite = np.isfinite(volumes)
+    sums = np.concatenate(
+        [[0.0], np.cumsum(np.where(finite, volumes, 0.0), dtype=np.float64)]
+    )
+    seen = np.concatenate([[0], np.cumsum(finite)])
+    index = np.arange(len(volumes))
+    start = np.zeros_like(index) if window is None else np.maximum(index - window, 0)
+    counts = seen[index] - seen[start]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (sums[index] - sums[start]) / counts
+
+
+def volume_confirmed_series(
+        volumes: Any, window: Optional[int], threshold: float, method: str = "mean"
+) -> np.ndarray:
+    """
+    ``volume_confirmed`` for every bar, against the mean (or median) of the
+    ``window`` previous volumes (all previous volumes when ``window`` is None)
+    """
+    baseline = volume_baseline_series(volumes, window, method)
+    with np.errstate(invalid="ignore"):
+        return (baseline > 0) & (np.asarray(volumes) > baseline * threshold)
+
+
+def latest_volume_confirmed(
+        volumes: Any, window: Optional[int], threshold: float, method: str = "mean"
+) -> bool:
+    """``volume_confirmed_series`` of the last bar only"""
+    _check_method(method)
+    volumes = np.asarray(volumes, dtype=np.float64)
+    if not len(volumes) or window == 0:
+        return False
+    prior = volumes[:-1] if window is None else volumes[-window - 1: -1]
+    prior = prior[np.isfinite(prior)]
+    if not len(prior):
+        return False
+    baseline = np.median(prior) if method == "median" else prior.mean()
+    return confirms(volumes[-1], float(baseline), threshold)
@@ -3,6 +3,45 @@ import pandas as pd
 import pytest
 
 
+@pytest.fixture
+def random_closes():
+    """Factory of seeded geometric random walks, 1-D or (length x symbols)"""
+
+    def make(length, seed=0, symbols=None):
+        shape = length if symbols is None else (length, symbols)
+        rng = np.random.default_rng(seed)
+        return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, shape), axis=0))
+
+    return make
+
+
+@pytest.fixture
+def random_candles():
+    """
+    Factory of OHLCV candles along a seeded random walk, with a timestamp
+    column when ``timestamps`` are given
+    """
+
+    def make(length, seed=0, timestamps=None):
+        rng = np.random.default_rng(seed)
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, length)))
+        opens = np.concatenate([[100.0], closes[:-1]])
+        candles = pd.DataFrame(
+            {
+                "open": opens,
+                "high": np.maximum(opens, closes) * 1.01,
+                "low": np.minimum(opens, closes) * 0.99,
+                "close": closes,
+                "volume": rng.integers(500, 5000, length).astype(float),
+            }
+        )
+        if timestamps is not None:
+            candles.insert(0, "timestamp", np.asarray(timestamps, dtype=float))
+        return candles
+
+    return make
+
+
 @pytest.fixture
 def sample_candles():
     """Sample candlestick data for testing"""
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators import create
+from python_trading_indicators.atr import (
+    ATRConfig,
+    ATRIndicator,
+    atr_series,
+    true_range_series,
+)
+from python_trading_indicators.config import candle_bars
+
+
+def _candles(length, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.standard_t(3, length) * 0.01))
+    opens = np.concatenate([[100.0], closes[:-1]])
+    return pd.DataFrame(
+        {
+            "open": opens,
+            "high": np.maximum(opens, closes) * np.exp(np.abs(rng.normal(0, 0.005, length))),
+            "low": np.minimum(opens, closes) * np.exp(-np.abs(rng.normal(0, 0.005, length))),
+            "close": closes,
+        }
+    )
+
+
+def _reference(candles, period):
+    """Per-bar true range and Wilder average"""
+    highs, lows, closes = (candles[name].to_numpy() for name in ("high", "low", "close"))
+    ranges = [highs[0] - lows[0]] + [
+        max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        for i in range(1, len(closes))
+    ]
+    atr = np.full(len(closes), np.nan)
+    atr[period - 1] = np.mean(ranges[:period])
+    for i in range(period, len(closes)):
+        atr[i] = (atr[i - 1] * (period - 1) + ranges[i]) / period
+    return np.array(ranges), atr
+
+
+class TestATRSeries:
+    """Test the vectorized true range and ATR"""
+
+    def test_matches_reference(self):
+        candles = _candles(200)
+        ranges, atr = _reference(candles, 14)
+        np.testing.assert_allclose(
+            true_range_series(candles["high"], candles["low"], candles["close"]), ranges
+        )
+        np.testing.assert_allclose(
+            atr_series(candles["high"], candles["low"], candles["close"], 14), atr
+        )
+
+    def test_2d(self):
+        symbols = [_candles(100, seed) for seed in range(3)]
+        columns = [np.column_stack([c[name] for c in symbols]) for name in ("high", "low", "close")]
+        matrix = atr_series(*columns, 10)
+        for symbol, candles in enumerate(symbols):
+            np.testing.assert_allclose(
+                matrix[:, symbol],
+                atr_series(candles["high"], candles["low"], candles["close"], 10),
+            )
+
+
+class TestATRConfig:
+    """Test streaming ATR"""
+
+    def test_streaming_matches_series(self):
+        candles = _candles(300, seed=1)
+        config = ATRConfig(14, 1.5)
+        _, atr = _reference(candles, 14)
+        closes = candles["close"].to_numpy()
+        state = config.new_state()
+        signals = 0
+        for i, bar in enumerate(candle_bars(candles)):
+            preview = config.peek(state, bar)
+            config.update(state, bar)
+            assert preview == pytest.approx((state.value, state.buy, state.sell, state.bars))
+            if i < 13:
+                assert state.atr is None
+                continue
+            assert state.value == pytest.approx(atr[i])
+            move = closes[i] - closes[i - 1]
+            assert state.buy == (i > 13 and move > 1.5 * atr[i - 1])
+            assert state.sell == (i > 13 and move < -1.5 * atr[i - 1])
+            signals += state.buy + state.sell
+        assert signals > 0
+
+    @pytest.mark.parametrize("end", [1, 10, 14, 15, 150])
+    def test_compute_matches_replay(self, end):
+        candles = _candles(160, seed=2)
+        config = ATRConfig(14, 1.0)
+        computed = config.compute(candles[:end])
+        replayed = config.replay(candle_bars(candles[:end]))
+        assert (computed.bars, computed.buy, computed.sell) == (
+            replayed.bars, replayed.buy, replayed.sell
+        )
+        for bar in candle_bars(candles, end):
+            config.update(computed, bar)
+            config.update(replayed, bar)
+            assert computed.value == pytest.approx(replayed.value)
+            assert (computed.buy, computed.sell) == (replayed.buy, replayed.sell)
+
+
+class TestATRIndicator:
+    """Test the ATR indicator contract"""
+
+    def test_insufficient_data(self, insufficient_candles):
+        atr = ATRIndicator()
+        atr.calculate(insufficient_candles)
+        assert atr.current_value == 0.0
+        assert atr.check_sell_condition() is False
+
+    def test_matches_config(self):
+        candles = _candles(200, seed=3)
+        atr = ATRIndicator(14, 1.0, history=None)
+        config = atr.config
+        state = config.new_state()
+        for end, bar in enumerate(candle_bars(candles), 1):
+            config.update(state, bar)
+            if end < 14 or (end % 5 and not state.buy and not state.sell):
+                continue
+            atr.calculate(candles[:end])
+            assert atr.current_value == pytest.approx(state.value)
+            assert atr.check_buy_condition() == state.buy
+            assert atr.check_sell_condition() == state.sell
+        assert len(atr.history()) == len(candles) - 13
+
+    def test_large_drop(self, sample_candles):
+        candles = sample_candles.copy()
+        candles.loc[len(candles)] = [99, 99, 80, 80, 1000]
+        atr = create("atr", period=5, multiplier=2.0)
+        atr.calculate(candles)
+        assert atr.check_sell_condition() is True
+        assert atr.check_buy_condition() is False
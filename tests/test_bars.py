@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.bars import BarBuilder, CandleBuffer
+from python_trading_indicators.config import Bar
+from python_trading_indicators.rsi import RSIConfig, RSIIndicator
+
+
+@pytest.fixture
+def trades():
+    """Ten minutes of random trades"""
+    rng = np.random.default_rng(11)
+    count = 5000
+    timestamps = np.sort(rng.uniform(0, 600, count))
+    prices = 100 + np.cumsum(rng.normal(0, 0.05, count))
+    sizes = rng.integers(1, 20, count).astype(float)
+    return timestamps, prices, sizes
+
+
+def _reference_bars(timestamps, prices, sizes, mode, size):
+    """Straightforward per-trade implementation of the bar semantics"""
+    if mode == "time":
+        keys = np.floor_divide(timestamps, size)
+    elif mode == "tick":
+        keys = np.arange(len(prices)) // size
+    else:
+        keys = np.floor_divide(np.cumsum(sizes) - sizes, size)
+    frame = pd.DataFrame({"key": keys, "t": timestamps, "p": prices, "v": sizes})
+    grouped = frame.groupby("key", sort=False)
+    bars = pd.DataFrame(
+        {
+            "timestamp": grouped["t"].first(),
+            "open": grouped["p"].first(),
+            "high": grouped["p"].max(),
+            "low": grouped["p"].min(),
+            "close": grouped["p"].last(),
+            "volume": grouped["v"].sum(),
+            "trades": grouped["p"].size().astype(float),
+        }
+    ).reset_index(drop=True)
+    if mode == "time":
+        bars["timestamp"] = np.unique(keys) * size
+    return bars
+
+
+def _ingest_in_batches(builder, trades, batch_sizes):
+    timestamps, prices, sizes = trades
+    outputs = []
+    position = 0
+    for batch in batch_sizes:
+        end = position + batch
+        outputs.append(
+            builder.ingest(timestamps[position:end], prices[position:end], sizes[position:end])
+        )
+        position = end
+    outputs.append(builder.flush())
+    return pd.concat([o for o in outputs if len(o)], ignore_index=True)
+
+
+class TestBarBuilder:
+    """Test trade-to-bar aggregation"""
+
+    @pytest.mark.parametrize(
+        "mode,size", [("time", 60), ("time", 7.5), ("tick", 100), ("volume", 500)]
+    )
+    def test_matches_reference_across_batches(self, trades, mode, size):
+        """Test that batched ingestion matches a per-trade reference"""
+        rng = np.random.default_rng(5)
+        batch_sizes = rng.integers(1, 140, 60)
+        batch_sizes = np.append(batch_sizes, len(trades[0]) - batch_sizes.sum())
+        assert batch_sizes[-1] > 0
+
+        built = _ingest_in_batches(BarBuilder(mode, size), trades, batch_sizes)
+        expected = _reference_bars(*trades, mode, size)
+
+        pd.testing.assert_frame_equal(built, expected, check_dtype=False)
+
+    def test_incomplete_bar_is_carried(self):
+        """Test that the last bar waits for more trades"""
+        builder = BarBuilder("tick", 3)
+        assert builder.ingest([1, 2], [10, 11], [1, 1]).empty
+        assert builder.partial == Bar(10, 11, 10, 11, 2, 1.0)
+
+        bars = builder.ingest([3, 4], [9, 12], [1, 1])
+        assert bars[["open", "high", "low", "close", "volume"]].values.tolist() == [
+            [10, 11, 9, 9, 3]
+        ]
+        assert builder.partial == Bar(12, 12, 12, 12, 1, 4.0)
+
+    def test_volume_overshoot_stays_on_grid(self):
+        """Test that a trade crossing a boundary keeps later bars on the volume grid"""
+        builder = BarBuilder("volume", 10)
+        bars = builder.ingest([1, 2], [10, 11], [4, 13])
+        assert bars["volume"].tolist() == [17]
+
+        # Cumulative size is 17: the next bar closes once it reaches 20
+        assert builder.ingest([3], [12], [2]).empty
+        assert builder.ingest([4], [13], [1])["volume"].tolist() == [3]
+
+    def test_validation(self):
+        """Test invalid parameters and inputs"""
+        with pytest.raises(ValueError):
+            BarBuilder("dollar", 10)
+        with pytest.raises(ValueError):
+            BarBuilder("tick", 2.5)
+        with pytest.raises(ValueError):
+            BarBuilder().ingest([1, 2], [1], [1])
+
+    def test_output_feeds_indicators(self, trades):
+        """Test that built bars go straight into indicators"""
+        bars = _ingest_in_batches(BarBuilder("tick", 50), trades, [len(trades[0])])
+        rsi = RSIIndicator(period=14)
+        rsi.calculate(bars)
+
+        assert rsi.current_value == pytest.approx(RSIConfig(14).compute(bars).value)
+
+
+class TestCandleBuffer:
+    """Test the columnar candle ring buffer"""
+
+    def test_keeps_last_candles(self):
+        """Test that only the last `capacity` candles are kept, in order"""
+        buffer = CandleBuffer(capacity=5)
+        for i in range(12):
+            buffer.append(Bar(i, i + 1, i - 1, i + 0.5, 10 * i, float(i)))
+
+        assert len(buffer) == 5
+        assert buffer["open"].tolist() == [7, 8, 9, 10, 11]
+        assert np.isnan(buffer["trades"]).all()
+
+    def test_extend_with_frame(self):
+        """Test bulk appends from a DataFrame larger than the capacity"""
+        buffer = CandleBuffer(capacity=4)
+        buffer.extend(pd.DataFrame({"close": [1.0, 2.0, 3.0]}))
+        buffer.extend({"close": np.arange(4.0, 10.0)})
+
+        assert buffer["close"].tolist() == [6, 7, 8, 9]
+
+    def test_views_are_read_only(self):
+        """Test that column views cannot corrupt the buffer"""
+        buffer = CandleBuffer(capacity=3)
+        buffer.append(Bar(1, 1, 1, 1))
+
+        with pytest.raises(ValueError):
+            buffer["close"][0] = 5
+
+    def test_configs_read_buffer_directly(self, volatile_candles):
+        """Test that stateless configs compute straight from the buffer"""
+        buffer = CandleBuffer(capacity=100)
+        buffer.extend(volatile_candles)
+        frame = buffer.to_frame()
+
+        assert RSIConfig(14).compute(buffer).value == pytest.approx(
+            RSIConfig(14).compute(volatile_candles).value
+        )
+        assert list(frame.columns) == list(buffer.columns)
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators import create
+from python_trading_indicators.bollinger import (
+    BollingerBandsIndicator,
+    BollingerConfig,
+    bollinger_series,
+    percent_b,
+)
+from python_trading_indicators.config import candle_bars
+
+
+class TestBollingerSeries:
+    """Test the vectorized bands"""
+
+    def test_matches_pandas(self, random_candles):
+        closes = random_candles(200)["close"]
+        lower, middle, upper = bollinger_series(closes, 20, 2.5)
+        mean = closes.rolling(20).mean()
+        deviation = closes.rolling(20).std(ddof=0)
+        np.testing.assert_allclose(middle, mean)
+        np.testing.assert_allclose(lower, mean - 2.5 * deviation)
+        np.testing.assert_allclose(upper, mean + 2.5 * deviation)
+
+    def test_2d(self, random_candles):
+        matrix = np.column_stack([random_candles(80, seed)["close"] for seed in range(3)])
+        outputs = bollinger_series(matrix, 10)
+        for symbol in range(3):
+            for output, expected in zip(outputs, bollinger_series(matrix[:, symbol], 10)):
+                np.testing.assert_allclose(output[:, symbol], expected)
+
+    def test_percent_b(self):
+        assert percent_b(95.0, 90.0, 110.0) == pytest.approx(0.25)
+        np.testing.assert_allclose(percent_b([80.0, 100.0], [90.0, 100.0], [110.0, 100.0]), [-0.5, 0.5])
+
+
+class TestBollingerConfig:
+    """Test streaming bands"""
+
+    def test_streaming_matches_series(self, random_candles):
+        candles = random_candles(300, seed=1)
+        config = BollingerConfig(20, 2.0)
+        closes = candles["close"].to_numpy()
+        lower, middle, upper = bollinger_series(closes, 20, 2.0)
+        state = config.new_state()
+        signals = 0
+        for i, bar in enumerate(candle_bars(candles)):
+            preview = config.peek(state, bar)
+            config.update(state, bar)
+            assert preview == pytest.approx((state.value, state.buy, state.sell, state.bars))
+            if i < 19:
+                assert state.middle is None
+                continue
+            assert (state.lower, state.middle, state.upper) == pytest.approx(
+                (lower[i], middle[i], upper[i])
+            )
+            assert state.value == pytest.approx(percent_b(closes[i], lower[i], upper[i]))
+            assert state.buy == (closes[i] < lower[i])
+            assert state.sell == (closes[i] > upper[i])
+            signals += state.buy + state.sell
+        assert signals > 0
+
+    @pytest.mark.parametrize("end", [5, 20, 150])
+    def test_compute_matches_replay(self, end, random_candles):
+        candles = random_candles(160, seed=2)
+        config = BollingerConfig()
+        computed = config.compute(candles[:end])
+        replayed = config.replay(candle_bars(candles[:end]))
+        assert computed.bars == replayed.bars
+        for bar in candle_bars(candles, end):
+            config.update(computed, bar)
+            config.update(replayed, bar)
+            assert computed.value == pytest.approx(replayed.value)
+            assert (computed.buy, computed.sell) == (replayed.buy, replayed.sell)
+
+
+class TestBollingerBandsIndicator:
+    """Test the Bollinger Bands indicator contract"""
+
+    def test_insufficient_data(self, insufficient_candles):
+        bollinger = BollingerBandsIndicator()
+        bollinger.calculate(insufficient_candles)
+        assert bollinger.current_value == 0.0
+        assert bollinger.bands is None
+        assert bollinger.check_buy_condition() is False
+
+    @pytest.mark.parametrize("history", [0, None])
+    def test_matches_config(self, history, random_candles):
+        candles = random_candles(200, seed=3)
+        bollinger = BollingerBandsIndicator(history=history)
+        config = bollinger.config
+        state = config.new_state()
+        for end, bar in enumerate(candle_bars(candles), 1):
+            config.update(state, bar)
+            if end < 20 or (end % 5 and not state.buy and not state.sell):
+                continue
+            bollinger.calculate(candles[:end])
+            assert bollinger.current_value == pytest.approx(state.value)
+            assert bollinger.bands == pytest.approx((state.lower, state.middle, state.upper))
+            assert bollinger.check_buy_condition() == state.buy
+            assert bollinger.check_sell_condition() == state.sell
+        assert len(bollinger.history()) == (0 if history == 0 else len(candles) - 19)
+
+    def test_breakout(self):
+        candles = pd.DataFrame({"close": [100.0] * 19 + [101.0, 120.0]})
+        bollinger = create("bollinger", period=20)
+        bollinger.calculate(candles)
+        assert bollinger.check_sell_condition() is True
+        assert bollinger.current_value > 1
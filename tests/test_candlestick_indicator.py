@@ -33,6 +33,18 @@ class TestCandlestickIndicator:
         assert candlestick.check_buy_condition() is False
         assert candlestick.check_sell_condition() is False
 
+    def test_candlestick_empty_frame(self):
+        """Test candlestick calculation without any candles"""
+        candles = pd.DataFrame(
+            columns=["timestamp", "open", "high", "low", "close", "volume"], dtype=float
+        )
+        for candlestick in (CandlestickIndicator(), CandlestickIndicator(window=300)):
+            candlestick.calculate(candles)
+
+            assert candlestick.check_buy_condition() is False
+            assert candlestick.check_sell_condition() is False
+            assert candlestick.pattern == 0
+
     def test_candlestick_bullish_pattern_with_volume(self):
         """Test bullish candlestick pattern with high volume"""
         data = {
@@ -0,0 +1,148 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+import pytest
+
+from python_trading_indicators.candlestick import (
+    CandlestickConfig,
+    CandlestickIndicator,
+)
+from python_trading_indicators.config import Bar
+from python_trading_indicators.drop import DropConfig, SuddenPriceDropIndicator
+from python_trading_indicators.rsi import RSIConfig, RSIIndicator, rsi_series
+from python_trading_indicators.vix import VIXConfig, VIXIndicator
+
+
+def _bars(candles):
+    return [
+        Bar(row.open, row.high, row.low, row.close, row.volume)
+        for row in candles.itertuples()
+    ]
+
+
+INDICATORS = [
+    RSIIndicator(period=5, buy_threshold=45, sell_threshold=55),
+    VIXIndicator(period=5, panic_threshold=40, volume_threshold=1.2),
+    SuddenPriceDropIndicator(drop_percentage=2, lookback_period=4, volume_threshold=1.1),
+    CandlestickIndicator(lookback_period=3, volume_threshold=1.1),
+    CandlestickIndicator(lookback_period=1, volume_threshold=1.1),
+]
+
+
+class TestIndicatorConfig:
+    """Test the stateless config/state compute API"""
+
+    @pytest.mark.parametrize("indicator", INDICATORS, ids=lambda i: type(i).__name__)
+    @pytest.mark.parametrize("length", [1, 3, 5, 6, 40])
+    def test_compute_matches_indicator(self, indicator, length, random_candles):
+        """Test that config.compute and streaming updates match the indicator"""
+        candles = random_candles(length, seed=length)
+        indicator.calculate(candles)
+        config = indicator.config
+
+        for state in (config.compute(candles), config.replay(_bars(candles))):
+            assert state.value == pytest.approx(indicator.current_value, abs=1e-9)
+            assert state.buy == indicator.check_buy_condition()
+            assert state.sell == indicator.check_sell_condition()
+            assert state.bars == length
+
+    @pytest.mark.parametrize("indicator", INDICATORS, ids=lambda i: type(i).__name__)
+    def test_ready(self, indicator, random_candles):
+        """Test that states turn ready with their first published value"""
+        config = indicator.config
+        assert config.new_state().ready is False
+        candles = random_candles(40, seed=2)
+        assert config.compute(candles).ready is True
+        assert config.replay(_bars(candles)).ready is True
+
+    @pytest.mark.parametrize("indicator", INDICATORS, ids=lambda i: type(i).__name__)
+    def test_update_continues_compute(self, indicator, random_candles):
+        """Test that updating a computed state matches computing on more data"""
+        candles = random_candles(60, seed=7)
+        config = indicator.config
+        state = config.compute(candles.iloc[:30])
+        for bar in _bars(candles.iloc[30:]):
+            config.update(state, bar)
+
+        expected = config.compute(candles)
+        assert state.value == pytest.approx(expected.value, abs=1e-9)
+        assert (state.buy, state.sell) == (expected.buy, expected.sell)
+
+    @pytest.mark.parametrize("indicator", INDICATORS, ids=lambda i: type(i).__name__)
+    def test_peek_matches_update_without_committing(self, indicator, random_candles):
+        """Test that peek previews update() and leaves the state untouched"""
+        config = indicator.config
+        state = config.new_state()
+        rng = np.random.default_rng(3)
+        bars = _bars(random_candles(30, seed=4))
+        for bar in bars:
+            # A few provisional prices for the forming bar, then the close
+            for price in bar.close * (1 + rng.normal(0, 0.01, 3)):
+                forming = bar._replace(close=float(price))
+                preview = config.peek(state, forming)
+
+                expected = config.update(copy.deepcopy(state), forming)
+                assert preview[:3] == pytest.approx(
+                    (expected.value, expected.buy, expected.sell), nan_ok=True
+                )
+                assert preview.sequence == expected.bars
+            config.update(state, bar)
+
+        assert repr(state) == repr(config.replay(bars))
+
+    def test_configs_are_hashable_and_frozen(self):
+        """Test that configs can be used as dict keys and cannot be mutated"""
+        configs = {RSIConfig(14): "rsi", VIXConfig(): "vix", DropConfig(): "drop"}
+
+        assert configs[RSIConfig(period=14)] == "rsi"
+        with pytest.raises(FrozenInstanceError):
+            RSIConfig().period = 5
+
+    def test_invalid_period(self):
+        """Test parameter validation"""
+        with pytest.raises(ValueError):
+            RSIConfig(period=0)
+        with pytest.raises(ValueError):
+            CandlestickConfig(lookback_period=0)
+
+    def test_states_use_slots(self):
+        """Test that per-symbol states carry no instance dict"""
+        state = RSIConfig().new_state()
+
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown = 1
+
+    def test_compute_many_with_thread_pool(self, random_candles):
+        """Test one shared config evaluating many symbols concurrently"""
+        candles_by_symbol = {f"S{i}": random_candles(50, seed=i) for i in range(20)}
+        config = VIXConfig(period=10)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = config.compute_many(candles_by_symbol, executor=executor)
+        sequential = config.compute_many(candles_by_symbol)
+
+        assert list(threaded) == list(candles_by_symbol)
+        for symbol, state in sequential.items():
+            assert threaded[symbol].value == state.value
+
+
+class TestRSISeries:
+    """Test the vectorized RSI kernel"""
+
+    def test_two_dimensional_input(self, random_candles):
+        """Test that each column of a 2-D input is an independent symbol"""
+        closes = np.column_stack(
+            [random_candles(40, seed=i)["close"].to_numpy() for i in range(3)]
+        )
+        values = rsi_series(closes, period=14)
+
+        assert values.shape == (26, 3)
+        for i in range(3):
+            np.testing.assert_allclose(values[:, i], rsi_series(closes[:, i], 14))
+
+    def test_short_input(self):
+        """Test that inputs not longer than the period produce no values"""
+        assert rsi_series([1.0, 2.0, 3.0], period=3).shape == (0,)
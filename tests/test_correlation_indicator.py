@@ -0,0 +1,175 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators import create
+from python_trading_indicators.correlation import (
+    CorrelationIndicator,
+    RollingComoments,
+    comoment_series,
+    latest_comoments,
+    log_returns,
+)
+
+
+def _returns(length, symbols=3, references=2, seed=0):
+    """Symbol returns loading on the reference returns, plus noise"""
+    rng = np.random.default_rng(seed)
+    index = rng.normal(0.0005, 0.01, (length, references))
+    loadings = rng.uniform(-0.5, 2.0, (references, symbols))
+    return index @ loadings + rng.normal(0, 0.01, (length, symbols)), index
+
+
+def _reference(returns, references, window):
+    """pandas rolling statistics, one (symbol, reference) pair at a time"""
+    shape = (len(returns), returns.shape[1], references.shape[1])
+    covariance, correlation, beta = (np.full(shape, np.nan) for _ in range(3))
+    for symbol in range(returns.shape[1]):
+        x = pd.Series(returns[:, symbol])
+        for reference in range(references.shape[1]):
+            y = pd.Series(references[:, reference])
+            covariance[:, symbol, reference] = x.rolling(window).cov(y)
+            correlation[:, symbol, reference] = x.rolling(window).corr(y)
+            beta[:, symbol, reference] = x.rolling(window).cov(y) / y.rolling(window).var()
+    return covariance, correlation, beta
+
+
+class TestComomentSeries:
+    """Test the vectorized rolling statistics"""
+
+    def test_matches_reference(self):
+        returns, references = _returns(300)
+        series = comoment_series(returns, references, 40)
+        for values, expected in zip(series, _reference(returns, references, 40)):
+            assert values.shape == (300, 3, 2)
+            np.testing.assert_allclose(values, expected, rtol=1e-7, atol=1e-12)
+
+    def test_shapes(self):
+        returns, references = _returns(100)
+        full = comoment_series(returns, references, 20)
+        assert comoment_series(returns, references[:, 0], 20).beta.shape == (100, 3)
+        single = comoment_series(returns[:, 1], references[:, 0], 20)
+        assert single.beta.shape == (100,)
+        np.testing.assert_allclose(single.beta, full.beta[:, 1, 0])
+        assert np.isnan(single.beta[:19]).all() and not np.isnan(single.beta[19:]).any()
+        assert np.isnan(comoment_series(returns[:5], references[:5], 20).beta).all()
+        assert comoment_series(returns, references, 20, np.float32).beta.dtype == np.float32
+
+    def test_latest(self):
+        returns, references = _returns(120, seed=1)
+        series = comoment_series(returns, references, 30)
+        latest = latest_comoments(returns, references, 30)
+        for values, last in zip(series, latest):
+            np.testing.assert_allclose(last, values[-1])
+        assert np.isnan(latest_comoments(returns[:10], references[:10], 30).beta).all()
+
+    def test_offset_returns_do_not_cancel(self):
+        returns, references = _returns(2000, seed=2)
+        shifted = comoment_series(returns + 1e4, references - 1e4, 50)
+        for values, expected in zip(shifted, comoment_series(returns, references, 50)):
+            np.testing.assert_allclose(values, expected, rtol=1e-6, atol=1e-12)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            comoment_series([0.1, 0.2], [0.1, 0.2], 1)
+        with pytest.raises(ValueError):
+            comoment_series([0.1, 0.2], [0.1], 2)
+
+
+class TestRollingComoments:
+    """Test the O(1) streaming co-moments"""
+
+    def test_matches_series(self):
+        returns, references = _returns(400, seed=3)
+        series = comoment_series(returns, references, 25)
+        comoments = RollingComoments(25, symbols=3, references=2)
+        for i in range(len(returns)):
+            comoments.update(returns[i], references[i])
+            assert comoments.ready == (i >= 24)
+            if i < 24:
+                assert np.isnan(comoments.beta).all()
+                continue
+            np.testing.assert_allclose(comoments.covariance, series.covariance[i], atol=1e-12)
+            np.testing.assert_allclose(comoments.correlation, series.correlation[i], rtol=1e-7)
+            np.testing.assert_allclose(comoments.beta, series.beta[i], rtol=1e-7)
+
+    def test_scalars_and_copy(self):
+        returns, references = _returns(50, symbols=1, references=1, seed=4)
+        comoments = RollingComoments(10)
+        for x, y in zip(returns[:, 0], references[:, 0]):
+            comoments.update(x, y)
+        clone = copy.deepcopy(comoments)
+        comoments.update(0.01, 0.02)
+        clone.update(0.01, 0.02)
+        assert comoments.beta.shape == (1, 1)
+        assert clone.beta == pytest.approx(comoments.beta)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            RollingComoments(1)
+        with pytest.raises(ValueError):
+            RollingComoments(5, symbols=2).update([0.1, 0.2, 0.3], 0.1)
+
+
+class TestCorrelationIndicator:
+    """Test the correlation indicator contract"""
+
+    def _candles(self, length=200, beta=1.8, seed=5):
+        rng = np.random.default_rng(seed)
+        index = rng.normal(0, 0.01, length)
+        sector = rng.normal(0, 0.01, length)
+        returns = beta * index + 0.3 * sector + rng.normal(0, 0.002, length)
+        return pd.DataFrame(
+            {
+                "close": 100 * np.exp(np.cumsum(returns)),
+                "index": 50 * np.exp(np.cumsum(index)),
+                "sector": 20 * np.exp(np.cumsum(sector)),
+            }
+        )
+
+    def test_insufficient_data(self):
+        indicator = CorrelationIndicator(window=60, references="index")
+        indicator.calculate(self._candles(60))
+        assert indicator.current_value == 0.0
+        assert indicator.beta == {}
+        assert indicator.check_buy_condition() is False
+        assert indicator.check_sell_condition() is False
+
+    def test_values(self):
+        candles = self._candles()
+        indicator = CorrelationIndicator(window=60, references=("index", "sector"))
+        indicator.calculate(candles)
+        returns = log_returns(candles["close"])
+        references = log_returns(candles[["index", "sector"]])
+        expected = latest_comoments(returns, references, 60)
+        assert list(indicator.beta) == ["index", "sector"]
+        assert indicator.beta["index"] == pytest.approx(expected.beta[0])
+        assert indicator.correlation["sector"] == pytest.approx(expected.correlation[1])
+        assert indicator.covariance["index"] == pytest.approx(expected.covariance[0])
+        assert indicator.current_value == pytest.approx(1.8, abs=0.2)
+        assert indicator.check_sell_condition() is True
+        assert indicator.check_buy_condition() is False
+
+    def test_low_beta(self):
+        indicator = create("correlation", window=30, references=["index"])
+        indicator.calculate(self._candles(beta=0.1, seed=6))
+        assert indicator.check_buy_condition() is True
+        assert indicator.check_sell_condition() is False
+
+    def test_history(self):
+        candles = self._candles(150)
+        indicator = CorrelationIndicator(window=40, references="index", history=None)
+        indicator.calculate(candles)
+        series = comoment_series(
+            log_returns(candles["close"]), log_returns(candles["index"]), 40
+        )
+        np.testing.assert_allclose(indicator.history(), series.beta[39:])
+        assert indicator.current_value == pytest.approx(series.beta[-1])
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            CorrelationIndicator(window=1)
+        with pytest.raises(ValueError):
+            CorrelationIndicator(references=())
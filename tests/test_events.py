@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.config import Bar
+from python_trading_indicators.events import (
+    EVENT_DTYPE,
+    SignalEdgeDetector,
+    SignalEvent,
+    matrix_events,
+    series_events,
+)
+from python_trading_indicators.rsi import RSIConfig, RSIIndicator
+from python_trading_indicators.signals import BUY, SELL, SignalMatrix
+
+
+@pytest.fixture
+def closes(random_closes):
+    return random_closes(120, seed=17, symbols=6)
+
+
+class TestSignalEdgeDetector:
+    """Test streaming edge detection"""
+
+    def test_emits_only_changes(self):
+        """Test that repeated signals produce no events"""
+        detector = SignalEdgeDetector()
+        observations = [(0, False, False), (1, True, False), (2, True, False), (3, False, True)]
+        for bar, buy, sell in observations:
+            detector.observe("BTC", "rsi", bar, buy, sell)
+
+        events = detector.drain()
+        assert events == [
+            SignalEvent("BTC", "rsi", 1, 0, BUY),
+            SignalEvent("BTC", "rsi", 3, BUY, SELL),
+        ]
+        assert events[1].sell and not events[1].buy
+        assert detector.drain() == []
+        assert detector.signal("BTC", "rsi") == SELL
+
+    def test_streaming_matches_series(self, closes):
+        """Test that streaming states and series mode emit the same events"""
+        config = RSIConfig(14, 40, 60)
+        symbols = [f"S{i}" for i in range(closes.shape[1])]
+        states = {symbol: config.new_state() for symbol in symbols}
+        detector = SignalEdgeDetector()
+        for row in closes:
+            for symbol, close in zip(symbols, row.tolist()):
+                config.update(states[symbol], Bar(close, close, close, close))
+            detector.observe_states("rsi", states)
+        streamed = [(e.bar, symbols.index(e.symbol), e.previous, e.current) for e in detector.drain()]
+
+        buys, sells = [], []
+        for symbol in range(closes.shape[1]):
+            replayed = config.new_state()
+            flags = []
+            for close in closes[:, symbol].tolist():
+                config.update(replayed, Bar(close, close, close, close))
+                flags.append((replayed.buy, replayed.sell))
+            buys.append([buy for buy, _ in flags])
+            sells.append([sell for _, sell in flags])
+        events = series_events(np.array(buys).T, np.array(sells).T)
+
+        assert events.dtype == EVENT_DTYPE
+        assert streamed == [
+            (event["bar"], event["symbol"], event["previous"], event["current"])
+            for event in events
+        ]
+
+    def test_observe_indicator(self, closes):
+        """Test edge detection on Indicator objects"""
+        candles = pd.DataFrame({"close": closes[:, 0]})
+        rsi = RSIIndicator(14, 40, 60)
+        detector = SignalEdgeDetector()
+        changes = 0
+        previous = (False, False)
+        for end in range(1, len(candles) + 1):
+            rsi.calculate(candles.iloc[:end])
+            current = (rsi.check_buy_condition(), rsi.check_sell_condition())
+            changes += current != previous
+            previous = current
+            detector.observe_indicator("S0", "rsi", rsi, end - 1)
+
+        assert len(detector.drain()) == changes > 0
+
+
+class TestVectorizedEvents:
+    """Test series and matrix transition events"""
+
+    def test_series_events_one_symbol(self):
+        """Test a 1-D series with a start bar offset"""
+        events = series_events([0, 1, 1, 0, 0], [0, 0, 1, 1, 0], indicator=3, start_bar=10)
+
+        assert events.tolist() == [
+            (11, 0, 3, 0, BUY),
+            (12, 0, 3, BUY, BUY | SELL),
+            (13, 0, 3, BUY | SELL, SELL),
+            (14, 0, 3, SELL, 0),
+        ]
+
+    def test_matrix_events(self, closes):
+        """Test events of every indicator in a packed signal matrix"""
+        rng = np.random.default_rng(3)
+        signals = SignalMatrix.empty(["rsi", "vix"], 50, 4)
+        flags = {name: (rng.random((50, 4)) < 0.3, rng.random((50, 4)) < 0.3) for name in ("rsi", "vix")}
+        for name, (buy, sell) in flags.items():
+            signals.set(name, buy=buy, sell=sell)
+
+        events = matrix_events(signals)
+        expected = np.concatenate(
+            [series_events(*flags["rsi"], indicator=0), series_events(*flags["vix"], indicator=1)]
+        )
+        np.testing.assert_array_equal(
+            events, np.sort(expected, order=("bar", "symbol", "indicator"))
+        )
+        assert set(matrix_events(signals, ["vix"])["indicator"]) == {1}
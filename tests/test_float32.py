@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.bars import CandleBuffer
+from python_trading_indicators.candlestick import CandlestickIndicator, candlestick_series
+from python_trading_indicators.drop import SuddenPriceDropIndicator, drop_series
+from python_trading_indicators.rsi import RSIIndicator, rsi_series
+from python_trading_indicators.vix import VIXIndicator, vix_series
+
+# Documented float32 error bounds relative to float64 (see README)
+RSI_ABS_BOUND = 1e-3
+VIX_REL_BOUND = 1e-4
+
+
+@pytest.fixture
+def market():
+    """500 bars x 50 symbols"""
+    rng = np.random.default_rng(21)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (500, 50)), axis=0))
+    opens = np.vstack([closes[:1], closes[:-1]]) * (1 + rng.normal(0, 0.002, closes.shape))
+    volumes = rng.integers(100, 10_000, closes.shape).astype(float)
+    return opens, closes, volumes
+
+
+class TestFloat32Kernels:
+    """Test float32 kernels against float64"""
+
+    def test_rsi_within_bound(self, market):
+        """Test the RSI error bound on a multi-symbol matrix"""
+        _, closes, _ = market
+        values = rsi_series(closes, 14, np.float32)
+
+        assert values.dtype == np.float32
+        np.testing.assert_allclose(values, rsi_series(closes, 14), rtol=0, atol=RSI_ABS_BOUND)
+
+    def test_vix_within_bound(self, market):
+        """Test the VIX error bound on a multi-symbol matrix"""
+        _, closes, _ = market
+        values = vix_series(closes, 14, np.float32)
+
+        assert values.dtype == np.float32
+        np.testing.assert_allclose(values, vix_series(closes, 14), rtol=VIX_REL_BOUND)
+
+    def test_signal_kernels(self, market):
+        """Test that drop and candlestick signals agree with float64"""
+        opens, closes, volumes = market
+        for symbol in range(closes.shape[1]):
+            drops = drop_series(closes[:, symbol], volumes[:, symbol], 2, 5, 1.5, np.float32)
+            candles = candlestick_series(
+                opens[:, symbol], closes[:, symbol], volumes[:, symbol], 3, 1.5, np.float32
+            )
+            assert drops.dtype == candles.dtype == np.float32
+            np.testing.assert_array_equal(
+                drops, drop_series(closes[:, symbol], volumes[:, symbol], 2, 5, 1.5)
+            )
+            np.testing.assert_array_equal(
+                candles,
+                candlestick_series(
+                    opens[:, symbol], closes[:, symbol], volumes[:, symbol], 3, 1.5
+                ),
+            )
+
+
+class TestFloat32Indicators:
+    """Test the dtype option of the indicators and buffers"""
+
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            lambda dtype: RSIIndicator(14, history=None, dtype=dtype),
+            lambda dtype: VIXIndicator(14, history=None, dtype=dtype),
+            lambda dtype: SuddenPriceDropIndicator(2, 5, history=None, dtype=dtype),
+            lambda dtype: CandlestickIndicator(3, history=None, dtype=dtype),
+        ],
+    )
+    def test_history_dtype(self, factory, market):
+        """Test that the history is stored in the requested dtype"""
+        opens, closes, volumes = market
+        candles = pd.DataFrame(
+            {"open": opens[:, 0], "close": closes[:, 0], "volume": volumes[:, 0]}
+        )
+        single, double = factory(np.float32), factory(np.float64)
+        single.calculate(candles)
+        double.calculate(candles)
+
+        assert single.history().dtype == np.float32
+        np.testing.assert_allclose(single.history(), double.history(), rtol=1e-4, atol=1e-3)
+        assert single.current_value == pytest.approx(double.current_value, rel=1e-4, abs=1e-3)
+
+    def test_candle_buffer_dtype(self, market):
+        """Test a float32 candle buffer"""
+        _, closes, _ = market
+        buffer = CandleBuffer(100, dtype=np.float32)
+        buffer.extend({"close": closes[:, 0]})
+
+        assert buffer.dtype == buffer["close"].dtype == np.float32
+        np.testing.assert_allclose(buffer["close"], closes[-100:, 0], rtol=1e-7)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from python_trading_indicators.candlestick import CandlestickIndicator
+from python_trading_indicators.config import Bar
+from python_trading_indicators.drop import SuddenPriceDropIndicator
+from python_trading_indicators.history import ValueHistory
+from python_trading_indicators.rsi import RSIIndicator
+from python_trading_indicators.vix import VIXIndicator
+
+
+class TestValueHistory:
+    """Test the retention policies"""
+
+    def test_none_keeps_nothing(self):
+        """Test that size 0 retains no values"""
+        history = ValueHistory(0)
+        history.extend(np.arange(10.0))
+
+        assert not history.enabled
+        assert len(history.view()) == 0
+
+    def test_bounded_keeps_last_values(self):
+        """Test the ring buffer across many appends and bulk extends"""
+        history = ValueHistory(4)
+        for value in range(11):
+            history.append(value)
+        assert history.view().tolist() == [7, 8, 9, 10]
+
+        history.extend(np.arange(20.0, 26.0))
+        assert history.view().tolist() == [22, 23, 24, 25]
+        history.assign([1.0, 2.0])
+        assert history.view().tolist() == [1, 2]
+
+    def test_unbounded_keeps_everything(self):
+        """Test that size None grows as needed"""
+        history = ValueHistory(None)
+        for start in range(0, 100, 7):
+            history.extend(np.arange(start, min(start + 7, 100), dtype=float))
+
+        np.testing.assert_array_equal(history.view(), np.arange(100.0))
+
+    def test_view_is_read_only(self):
+        """Test that the returned view cannot be modified"""
+        history = ValueHistory(3)
+        history.extend([1.0, 2.0])
+
+        with pytest.raises(ValueError):
+            history.view()[0] = 5.0
+
+    def test_invalid_size(self):
+        """Test that negative sizes are rejected"""
+        with pytest.raises(ValueError):
+            ValueHistory(-1)
+
+
+INDICATORS = [
+    lambda history: RSIIndicator(5, 45, 55, history=history),
+    lambda history: VIXIndicator(5, 40, 1.2, history=history),
+    lambda history: SuddenPriceDropIndicator(2, 4, 1.1, history=history),
+    lambda history: CandlestickIndicator(3, 1.1, history=history),
+    lambda history: CandlestickIndicator(1, 1.1, history=history),
+]
+
+
+class TestIndicatorHistory:
+    """Test the history() accessor of the indicators"""
+
+    @pytest.mark.parametrize("factory", INDICATORS)
+    def test_history_matches_streaming_values(self, factory, random_candles):
+        """Test that every retained value matches the streaming config"""
+        candles = random_candles(60, seed=8)
+        indicator = factory(None)
+        indicator.calculate(candles)
+        history = indicator.history()
+
+        config = indicator.config
+        state = config.new_state()
+        values = []
+        for row in candles.itertuples():
+            config.update(state, Bar(row.open, row.high, row.low, row.close, row.volume))
+            values.append(state.value)
+        np.testing.assert_allclose(history, values[len(candles) - len(history):])
+        assert history[-1] == pytest.approx(indicator.current_value)
+
+    @pytest.mark.parametrize("factory", INDICATORS)
+    def test_retention_policies(self, factory, random_candles):
+        """Test none, last-N and full retention"""
+        candles = random_candles(60, seed=9)
+        full, last, none = factory(None), factory(10), factory(0)
+        for indicator in (full, last, none):
+            indicator.calculate(candles)
+
+        assert len(full.history()) > 10
+        np.testing.assert_array_equal(last.history(), full.history()[-10:])
+        assert len(none.history()) == 0
+        assert none.current_value == full.current_value
+
+    def test_insufficient_data_clears_history(self, random_candles):
+        """Test that a calculation without enough candles empties the history"""
+        rsi = RSIIndicator(period=5, history=None)
+        rsi.calculate(random_candles(20, seed=1))
+        rsi.calculate(random_candles(3, seed=1))
+
+        assert len(rsi.history()) == 0
@@ -1,7 +1,12 @@
+import threading
+
+import numpy as np
+import pandas as pd
 import pytest
 from pandas import DataFrame
 
-from python_trading_indicators.indicator import Indicator
+from python_trading_indicators.indicator import Indicator, IndicatorSnapshot
+from python_trading_indicators.rsi import RSIIndicator
 
 
 class TestIndicatorImplementation(Indicator):
@@ -105,3 +110,87 @@ class TestIndicatorBase:
 
         # When disabled, should return False (no signal) regardless of actual condition
         assert indicator.check_sell_condition() is False
+
+
+class TestIndicatorSnapshot:
+    """Test snapshot publication for concurrent readers"""
+
+    def test_snapshot_without_concurrent_mode(self, sample_candles):
+        """Test that snapshot reflects the live state by default"""
+        indicator = TestIndicatorImplementation()
+        indicator.buy_condition = True
+        indicator.calculate(sample_candles)
+
+        assert indicator.snapshot == IndicatorSnapshot(1.0, True, False, 1)
+
+    def test_concurrent_reads_use_published_snapshot(self, sample_candles):
+        """Test that readers only observe state published by calculate"""
+        indicator = TestIndicatorImplementation()
+        indicator.enable_concurrent_reads()
+        indicator.calculate(sample_candles)
+
+        # Writer-side changes are invisible until the next calculation publishes them
+        indicator.buy_condition = True
+        assert indicator.check_buy_condition() is False
+        assert indicator.snapshot.sequence == 1
+
+        indicator.calculate(sample_candles)
+        assert indicator.check_buy_condition() is True
+        assert indicator.snapshot == IndicatorSnapshot(1.0, True, False, 2)
+
+    def test_concurrent_current_value_uses_published_snapshot(self, sample_candles):
+        """Test that current_value never runs ahead of the published signals"""
+        indicator = TestIndicatorImplementation()
+        assert indicator.current_value == 0.0
+        indicator.enable_concurrent_reads()
+        indicator.calculate(sample_candles)
+
+        # A writer halfway through its next calculation
+        indicator._current_value = 2.0
+        indicator.buy_condition = True
+        assert indicator.current_value == 1.0
+        assert indicator.check_buy_condition() is False
+
+        indicator.calculate(sample_candles)
+        assert indicator.current_value == 1.0
+        assert indicator.snapshot == IndicatorSnapshot(1.0, True, False, 2)
+
+    def test_disabled_indicator_in_concurrent_mode(self):
+        """Test that disabled indicators still provide no signal"""
+        indicator = TestIndicatorImplementation(enabled=False)
+        indicator.buy_condition = True
+        indicator.enable_concurrent_reads()
+
+        assert indicator.check_buy_condition() is False
+
+    def test_threaded_readers_see_consistent_triples(self):
+        """Test that concurrent readers never observe a half-updated result"""
+        rng = np.random.default_rng(1)
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+        candles = pd.DataFrame({"close": closes})
+        rsi = RSIIndicator(period=14, buy_threshold=45, sell_threshold=55)
+        rsi.enable_concurrent_reads()
+        stop = threading.Event()
+        torn = []
+
+        def reader():
+            while not stop.is_set():
+                value, buy, sell, sequence = rsi.snapshot
+                if sequence and (buy != (value < 45) or sell != (value > 55)):
+                    torn.append((value, buy, sell))
+                snapshot = rsi.snapshot
+                value = rsi.current_value
+                if rsi.snapshot is snapshot and value != snapshot.value:
+                    torn.append((value, snapshot.sequence))
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for end in range(50, 400, 5):
+            rsi.calculate(candles.iloc[:end])
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        assert torn == []
+        assert rsi.snapshot.sequence == len(range(50, 400, 5))
@@ -0,0 +1,109 @@
+import logging
+import subprocess
+import sys
+from logging.handlers import QueueHandler
+
+import pytest
+
+from python_trading_indicators.rsi import RSIIndicator
+from python_trading_indicators.tools.logger import (
+    RateLimitFilter,
+    clear_log_rate_limit,
+    get_logger,
+    logger,
+    set_log_rate_limit,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(level=logging.INFO):
+    return logging.LogRecord(
+        "python_trading_indicators.rsi", level, "", 0, "msg", None, None
+    )
+
+
+class TestLogging:
+    """Test the library logging layer"""
+
+    def test_import_does_not_configure_root_logger(self):
+        """Test that importing the package leaves the root logger alone"""
+        code = (
+            "import logging, python_trading_indicators.rsi; "
+            "assert not logging.getLogger().handlers; "
+            "assert logging.getLogger().level == logging.WARNING"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+        assert any(isinstance(h, logging.NullHandler) for h in logger.handlers)
+
+    def test_per_indicator_logger_names(self):
+        """Test that each indicator logs under its own child logger"""
+        assert get_logger("rsi").name == "python_trading_indicators.rsi"
+        assert get_logger("rsi").parent is logger
+
+    def test_sampling(self):
+        """Test that sampling keeps one record out of N"""
+        rate_limit = RateLimitFilter(sample_every=10)
+        kept = sum(rate_limit.filter(_record()) for _ in range(100))
+
+        assert kept == 10
+        assert rate_limit.dropped == 90
+
+    def test_rate_limit(self):
+        """Test that the token bucket caps records per second"""
+        rate_limit = RateLimitFilter(max_per_second=5)
+        kept = sum(rate_limit.filter(_record()) for _ in range(100))
+
+        assert 5 <= kept <= 6
+
+    def test_warnings_are_never_dropped(self):
+        """Test that warnings bypass sampling"""
+        rate_limit = RateLimitFilter(sample_every=1000)
+        rate_limit.filter(_record())
+
+        assert all(rate_limit.filter(_record(logging.WARNING)) for _ in range(10))
+
+    def test_invalid_parameters(self):
+        """Test parameter validation"""
+        with pytest.raises(ValueError):
+            RateLimitFilter(sample_every=0)
+        with pytest.raises(ValueError):
+            RateLimitFilter(max_per_second=0)
+
+    def test_queue_logging_delivers_records(self, sample_candles):
+        """Test that queued records reach the handler after the listener stops"""
+        handler = ListHandler()
+        start_queue_logging(handler)
+        try:
+            RSIIndicator(period=5).calculate(sample_candles)
+        finally:
+            stop_queue_logging()
+
+        messages = [record.getMessage() for record in handler.records]
+        assert any(message.startswith("RSI: ") for message in messages)
+        assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
+
+    def test_set_log_rate_limit_on_indicator(self, sample_candles):
+        """Test sampling installed on an indicator logger"""
+        handler = ListHandler()
+        set_log_rate_limit("rsi", sample_every=5)
+        start_queue_logging(handler)
+        try:
+            rsi = RSIIndicator(period=5)
+            for _ in range(10):
+                rsi.calculate(sample_candles)
+        finally:
+            stop_queue_logging()
+            clear_log_rate_limit("rsi")
+
+        assert len([r for r in handler.records if r.name.endswith(".rsi")]) == 2
+        assert not get_logger("rsi").filters
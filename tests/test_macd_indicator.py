@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators import create
+from python_trading_indicators.config import candle_bars
+from python_trading_indicators.macd import MACDConfig, MACDIndicator, macd_series
+
+
+class TestMACDSeries:
+    """Test the vectorized MACD"""
+
+    def test_matches_pandas(self, random_candles):
+        closes = random_candles(200)["close"]
+        line, signal, histogram = macd_series(closes, 12, 26, 9)
+
+        def ema(values, span):
+            # Seeded with the simple mean of the first `span` values
+            values = values.dropna()
+            seeded = values.copy()
+            seeded.iloc[: span - 1] = np.nan
+            seeded.iloc[span - 1] = values.iloc[:span].mean()
+            result = pd.Series(np.nan, index=values.index)
+            result.iloc[span - 1:] = seeded.iloc[span - 1:].ewm(
+                span=span, adjust=False
+            ).mean()
+            return result.reindex(closes.index)
+
+        expected = ema(closes, 12) - ema(closes, 26)
+        np.testing.assert_allclose(line[25:], expected[25:])
+        assert np.isnan(line[:25]).all()
+        np.testing.assert_allclose(signal, ema(pd.Series(line), 9))
+        np.testing.assert_allclose(histogram, line - signal)
+        assert np.isnan(signal[:33]).all() and not np.isnan(signal[33])
+
+    def test_2d(self, random_candles):
+        matrix = np.column_stack([random_candles(120, seed)["close"] for seed in range(3)])
+        outputs = macd_series(matrix, 5, 13, 4, np.float32)
+        for symbol in range(3):
+            for output, expected in zip(outputs, macd_series(matrix[:, symbol], 5, 13, 4)):
+                assert output.dtype == np.float32
+                np.testing.assert_allclose(output[:, symbol], expected, rtol=1e-5)
+
+
+class TestMACDConfig:
+    """Test streaming MACD"""
+
+    def test_streaming_matches_series(self, random_candles):
+        candles = random_candles(300, seed=1)
+        config = MACDConfig(12, 26, 9)
+        line, signal, histogram = macd_series(candles["close"], 12, 26, 9)
+        state = config.new_state()
+        crosses = 0
+        for i, bar in enumerate(candle_bars(candles)):
+            preview = config.peek(state, bar)
+            config.update(state, bar)
+            assert preview == pytest.approx((state.value, state.buy, state.sell, state.bars))
+            if i < 25:
+                assert state.macd is None
+                continue
+            assert state.macd == pytest.approx(line[i])
+            if i >= 34:
+                assert state.histogram == pytest.approx(histogram[i])
+                assert state.buy == (histogram[i - 1] <= 0 < histogram[i])
+                assert state.sell == (histogram[i - 1] >= 0 > histogram[i])
+                crosses += state.buy + state.sell
+        assert crosses > 0
+
+    @pytest.mark.parametrize("end", [10, 26, 34, 35, 150])
+    def test_compute_matches_replay(self, end, random_candles):
+        candles = random_candles(160, seed=2)
+        config = MACDConfig()
+        computed = config.compute(candles[:end])
+        replayed = config.replay(candle_bars(candles[:end]))
+        assert computed.bars == replayed.bars
+        assert (computed.value, computed.buy, computed.sell) == pytest.approx(
+            (replayed.value, replayed.buy, replayed.sell)
+        )
+        for bar in candle_bars(candles, end):
+            config.update(computed, bar)
+            config.update(replayed, bar)
+            assert computed.value == pytest.approx(replayed.value)
+            assert (computed.buy, computed.sell) == (replayed.buy, replayed.sell)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            MACDConfig(26, 12)
+        with pytest.raises(ValueError):
+            MACDIndicator(signal=0)
+
+
+class TestMACDIndicator:
+    """Test the MACD indicator contract"""
+
+    def test_insufficient_data(self, insufficient_candles):
+        macd = MACDIndicator()
+        macd.calculate(insufficient_candles)
+        assert macd.current_value == 0.0
+        assert macd.check_buy_condition() is False
+        assert macd.check_sell_condition() is False
+
+    def test_matches_config(self, random_candles):
+        candles = random_candles(400, seed=3)
+        macd = MACDIndicator(history=None)
+        config = macd.config
+        state = config.new_state()
+        for end, bar in enumerate(candle_bars(candles), 1):
+            config.update(state, bar)
+            if end % 7 and not state.buy and not state.sell:
+                continue
+            macd.calculate(candles[:end])
+            assert macd.current_value == pytest.approx(state.value)
+            assert macd.check_buy_condition() == state.buy
+            assert macd.check_sell_condition() == state.sell
+        assert macd.histogram == pytest.approx(state.histogram)
+        assert len(macd.history()) == len(candles) - 25
+
+    def test_trend(self, trending_up_candles):
+        macd = MACDIndicator(3, 6, 3)
+        macd.calculate(trending_up_candles)
+        assert macd.current_value > 0
+        assert isinstance(create("macd", fast=3, slow=6), MACDIndicator)
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from python_trading_indicators.rsi import RSIIndicator
+from python_trading_indicators.tools.metrics import (
+    IndicatorStats,
+    LatencyHistogram,
+    export_json,
+    export_prometheus,
+)
+
+
+class TestLatencyHistogram:
+    """Test the HDR-style latency histogram"""
+
+    def test_empty_histogram(self):
+        """Test percentiles on an empty histogram"""
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.percentile(0.99) == 0
+
+    def test_small_values_are_exact(self):
+        """Test that values below the sub-bucket range are recorded exactly"""
+        histogram = LatencyHistogram(significant_bits=5)
+        for value in range(1, 51):
+            histogram.record(value)
+
+        assert histogram.count == 50
+        assert histogram.percentile(0.5) == 25
+        assert histogram.percentile(1.0) == 50
+        assert histogram.min_ns == 1
+        assert histogram.max_ns == 50
+
+    def test_relative_error_bound(self):
+        """Test that large values stay within the configured relative error"""
+        histogram = LatencyHistogram(significant_bits=5)
+        for value in range(1000, 1_001_000, 1000):
+            histogram.record(value)
+
+        for quantile, expected in ((0.5, 500_000), (0.9, 900_000), (0.99, 990_000)):
+            assert histogram.percentile(quantile) == pytest.approx(
+                expected, rel=2 ** -5
+            )
+
+    def test_reset(self):
+        """Test that reset clears all counters"""
+        histogram = LatencyHistogram()
+        histogram.record(12345)
+        histogram.reset()
+
+        assert histogram.count == 0
+        assert histogram.total_ns == 0
+        assert histogram.max_ns == 0
+
+    def test_invalid_quantile(self):
+        """Test that out-of-range quantiles are rejected"""
+        with pytest.raises(ValueError):
+            LatencyHistogram().percentile(1.5)
+
+
+class TestIndicatorStats:
+    """Test indicator instrumentation through the Indicator base class"""
+
+    def test_stats_disabled_by_default(self, sample_candles):
+        """Test that no stats are collected unless enabled"""
+        rsi = RSIIndicator(period=5)
+        rsi.calculate(sample_candles)
+
+        assert rsi.stats is None
+
+    def test_stats_collected_when_enabled(self, sample_candles):
+        """Test call counts and rows processed"""
+        rsi = RSIIndicator(period=5)
+        stats = rsi.enable_stats()
+        rsi.calculate(sample_candles)
+        rsi.calculate(sample_candles)
+
+        snapshot = stats.snapshot()
+        assert snapshot["name"] == "RSIIndicator"
+        assert snapshot["calls"] == 2
+        assert snapshot["rows"] == 2 * len(sample_candles)
+        assert snapshot["total_ns"] > 0
+        assert snapshot["p50_ns"] <= snapshot["p99_ns"] <= snapshot["max_ns"]
+
+    def test_disabled_indicator_not_counted(self, sample_candles):
+        """Test that disabled indicators do not record calls"""
+        rsi = RSIIndicator(period=5, enabled=False)
+        stats = rsi.enable_stats()
+        rsi.calculate(sample_candles)
+
+        assert stats.calls == 0
+
+    def test_stats_name(self):
+        """Test naming the stats of an indicator"""
+        rsi = RSIIndicator()
+        stats = rsi.enable_stats(name="rsi_14")
+
+        assert stats.name == "rsi_14"
+        assert stats.snapshot()["name"] == "rsi_14"
+
+    def test_disable_stats(self, sample_candles):
+        """Test that stats can be switched off again"""
+        rsi = RSIIndicator(period=5)
+        rsi.enable_stats()
+        rsi.disable_stats()
+        rsi.calculate(sample_candles)
+
+        assert rsi.stats is None
+
+    def test_prometheus_export(self):
+        """Test Prometheus text exposition output"""
+        stats = IndicatorStats("RSIIndicator")
+        stats.record(2000, 10)
+        text = export_prometheus([stats])
+
+        assert "# TYPE indicator_compute_seconds summary" in text
+        assert 'indicator_compute_seconds_count{indicator="RSIIndicator"} 1' in text
+        assert 'indicator_rows_total{indicator="RSIIndicator"} 10' in text
+
+    def test_json_export(self):
+        """Test JSON snapshot export"""
+        stats = IndicatorStats("VIXIndicator")
+        stats.record(1500, 20)
+        payload = json.loads(export_json([stats]))
+
+        assert payload[0]["name"] == "VIXIndicator"
+        assert payload[0]["calls"] == 1
+        assert payload[0]["rows"] == 20
@@ -0,0 +1,132 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from python_trading_indicators.optimize import (
+    RSIThresholdGrid,
+    VIXThresholdGrid,
+    walk_forward,
+)
+from python_trading_indicators.rsi import RSIIndicator
+from python_trading_indicators.vix import VIXIndicator
+
+
+@pytest.fixture
+def candles(random_candles):
+    return random_candles(600, seed=12)
+
+
+def _reference(buy, sell, closes, start):
+    """Bar-by-bar long-only backtest of precomputed buy/sell signals"""
+    long = False
+    log_return = 0.0
+    trades = held = 0
+    for t in range(start, len(closes)):
+        if sell[t]:
+            long = False
+        elif buy[t]:
+            trades += not long
+            long = True
+        if long and t + 1 < len(closes):
+            log_return += np.log(closes[t + 1] / closes[t])
+            held += 1
+    return {
+        "buy_signals": int(np.sum(buy[start:])),
+        "sell_signals": int(np.sum(sell[start:])),
+        "trades": trades,
+        "total_return": np.expm1(log_return),
+        "exposure": held / (len(closes) - start - 1),
+    }
+
+
+def _indicator_signals(indicator, candles):
+    """Signals of an Indicator recalculated on every prefix of the candles"""
+    buys, sells = [], []
+    for end in range(1, len(candles) + 1):
+        indicator.calculate(candles.iloc[:end])
+        buys.append(indicator.check_buy_condition())
+        sells.append(indicator.check_sell_condition())
+    return np.array(buys), np.array(sells)
+
+
+class TestThresholdGrids:
+    """Test grid evaluation against per-combination recalculation"""
+
+    def test_rsi_grid(self, candles):
+        """Test every RSI combination against RSIIndicator signals"""
+        candles = candles.iloc[:150]
+        grid = RSIThresholdGrid(10, (30, 40, 45), (55, 60, 70))
+        result = grid.evaluate(candles, start=20)
+
+        assert result.trades.shape == (3, 3)
+        closes = candles["close"].to_numpy()
+        for buy_threshold in grid.buy_thresholds:
+            for sell_threshold in grid.sell_thresholds:
+                buys, sells = _indicator_signals(
+                    RSIIndicator(10, buy_threshold, sell_threshold), candles
+                )
+                expected = _reference(buys, sells, closes, 20)
+                assert result.at(
+                    buy_threshold=buy_threshold, sell_threshold=sell_threshold
+                ) == pytest.approx(expected)
+
+    def test_vix_grid(self, candles):
+        """Test every panic threshold against VIXIndicator signals"""
+        candles = candles.iloc[:150]
+        grid = VIXThresholdGrid(10, (20, 30, 40), volume_threshold=1.2)
+        result = grid.evaluate(candles)
+
+        closes = candles["close"].to_numpy()
+        for panic_threshold in grid.panic_thresholds:
+            buys, sells = _indicator_signals(
+                VIXIndicator(10, panic_threshold, 1.2), candles
+            )
+            expected = _reference(buys, sells, closes, 0)
+            assert result.at(panic_threshold=panic_threshold) == pytest.approx(expected)
+
+    def test_best(self, candles):
+        """Test selecting the best combination"""
+        result = RSIThresholdGrid(14).evaluate(candles)
+        best = result.best("total_return")
+
+        assert result.at(**best)["total_return"] == pytest.approx(
+            np.max(result.total_return)
+        )
+        with pytest.raises(ValueError):
+            result.best("sharpe")
+
+
+class TestWalkForward:
+    """Test walk-forward splits"""
+
+    def test_splits(self, candles):
+        """Test window layout and out-of-sample scoring"""
+        grid = RSIThresholdGrid(14, (30, 40), (60, 70))
+        splits = walk_forward(grid, candles, train_size=200, test_size=100)
+
+        assert [(s.train_start, s.test_start, s.test_end) for s in splits] == [
+            (14, 214, 314),
+            (114, 314, 414),
+            (214, 414, 514),
+        ]
+        for split in splits:
+            window = candles.iloc[split.train_start - 14: split.test_end]
+            expected = grid.restrict(**split.parameters).evaluate(window, start=200 + 14)
+            assert split.out_of_sample == pytest.approx(expected.at(**split.parameters))
+
+    def test_process_pool_matches_serial(self, candles):
+        """Test that windows spread across processes give the same splits"""
+        grid = VIXThresholdGrid(10, (20, 30, 40))
+        serial = walk_forward(grid, candles, 150, 100, step=150)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            parallel = walk_forward(grid, candles, 150, 100, step=150, executor=pool)
+
+        assert parallel == serial
+
+    def test_validation(self, candles):
+        """Test invalid parameters"""
+        with pytest.raises(ValueError):
+            walk_forward(RSIThresholdGrid(), candles, train_size=1, test_size=10)
+        with pytest.raises(ValueError):
+            walk_forward(RSIThresholdGrid(), candles, 100, 10, metric="sharpe")
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.candlestick import CandlestickIndicator
+from python_trading_indicators.config import candle_bars
+from python_trading_indicators.patterns import (
+    BEARISH_ENGULFING,
+    BULLISH_ENGULFING,
+    DOJI,
+    EVENING_STAR,
+    HAMMER,
+    INSIDE_BAR,
+    MORNING_STAR,
+    OUTSIDE_BAR,
+    PATTERNS,
+    SHOOTING_STAR,
+    PatternConfig,
+    detect_patterns,
+    pattern_names,
+)
+
+
+def _codes(*bars):
+    """Pattern codes of (open, high, low, close) bars"""
+    return detect_patterns(*np.array(bars, dtype=float).T)
+
+
+def _random_ohlc(length, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, length)))
+    opens = np.concatenate([[100.0], closes[:-1]]) * np.exp(rng.normal(0, 0.003, length))
+    highs = np.maximum(opens, closes) * np.exp(np.abs(rng.normal(0, 0.005, length)))
+    lows = np.minimum(opens, closes) * np.exp(-np.abs(rng.normal(0, 0.005, length)))
+    return opens, highs, lows, closes
+
+
+def _reference(opens, highs, lows, closes, i):
+    """Plain per-bar implementation of the documented rules"""
+    def parts(j):
+        o, h, l, c = opens[j], highs[j], lows[j], closes[j]
+        top, bottom = max(o, c), min(o, c)
+        return o, h, l, c, top, bottom, top - bottom
+
+    o, h, l, c, top, bottom, body = parts(i)
+    code = 0
+    doji = h - l > 0 and body <= 0.1 * (h - l)
+    if doji:
+        code |= DOJI
+    elif h > l and 0 < bottom - l and bottom - l >= 2 * body and h - top <= body:
+        code |= HAMMER
+    if not doji and h > l and 0 < h - top and h - top >= 2 * body and bottom - l <= body:
+        code |= SHOOTING_STAR
+    if i >= 1:
+        po, ph, pl, pc, ptop, pbottom, pbody = parts(i - 1)
+        covers = top >= ptop and bottom <= pbottom and body > pbody
+        if c > o and pc < po and covers:
+            code |= BULLISH_ENGULFING
+        if c < o and pc > po and covers:
+            code |= BEARISH_ENGULFING
+        if h < ph and l > pl:
+            code |= INSIDE_BAR
+        if h > ph and l < pl:
+            code |= OUTSIDE_BAR
+    if i >= 2:
+        fo, _, _, fc, _, _, fbody = parts(i - 2)
+        _, _, _, _, stop, sbottom, sbody = parts(i - 1)
+        middle = (fo + fc) / 2
+        small = sbody <= 0.3 * fbody
+        if fc < fo and small and stop < middle and c > o and c > middle:
+            code |= MORNING_STAR
+        if fc > fo and small and sbottom > middle and c < o and c < middle:
+            code |= EVENING_STAR
+    return code
+
+
+class TestDetectPatterns:
+    """Test the vectorized pattern engine"""
+
+    def test_single_bar_patterns(self):
+        codes = _codes(
+            (10.0, 11.0, 9.0, 10.05),  # doji
+            (10.0, 10.55, 8.0, 10.5),  # hammer
+            (10.5, 12.5, 9.95, 10.0),  # shooting star
+        )
+        assert codes[0] & DOJI
+        assert codes[1] & HAMMER and not codes[1] & SHOOTING_STAR
+        assert codes[2] & SHOOTING_STAR and not codes[2] & HAMMER
+
+    def test_flat_bar(self):
+        """Test that a flat bar (o = h = l = c) is neither hammer nor star"""
+        assert pattern_names(_codes((10.0, 10.0, 10.0, 10.0))[0]) == []
+        config = PatternConfig()
+        state = config.new_state()
+        flat = pd.DataFrame({name: [10.0] * 3 for name in ("open", "high", "low", "close")})
+        for bar in candle_bars(flat):
+            config.update(state, bar)
+            assert not state.buy and not state.sell
+
+    def test_engulfing_and_ranges(self):
+        codes = _codes(
+            (10.0, 10.2, 9.4, 9.5),
+            (9.4, 10.4, 9.3, 10.3),  # bullish engulfing, outside bar
+            (10.2, 10.3, 9.5, 9.6),  # inside bar
+            (9.5, 10.4, 9.3, 10.0),
+            (10.1, 10.5, 9.2, 9.4),  # bearish engulfing
+        )
+        assert codes[1] & BULLISH_ENGULFING and codes[1] & OUTSIDE_BAR
+        assert codes[2] & INSIDE_BAR
+        assert codes[4] & BEARISH_ENGULFING
+
+    def test_stars(self):
+        morning = _codes(
+            (11.0, 11.1, 9.9, 10.0), (9.9, 10.0, 9.7, 9.8), (9.9, 10.9, 9.8, 10.8)
+        )
+        evening = _codes(
+            (10.0, 11.1, 9.9, 11.0), (11.1, 11.3, 11.0, 11.2), (11.1, 11.2, 10.1, 10.2)
+        )
+        assert morning[2] & MORNING_STAR
+        assert evening[2] & EVENING_STAR
+
+    def test_matches_reference(self):
+        """Test every bar of a random walk against a per-bar implementation"""
+        columns = _random_ohlc(2000)
+        codes = detect_patterns(*columns)
+        assert codes.dtype == np.uint16
+        expected = [_reference(*columns, i) for i in range(len(codes))]
+        np.testing.assert_array_equal(codes, expected)
+        assert np.bitwise_or.reduce(codes) == sum(PATTERNS.values())
+
+    def test_2d(self):
+        """Test that a (bars x symbols) matrix equals per-symbol codes"""
+        symbols = [_random_ohlc(300, seed) for seed in range(4)]
+        matrix = detect_patterns(*(np.column_stack(parts) for parts in zip(*symbols)))
+        for symbol, columns in enumerate(symbols):
+            np.testing.assert_array_equal(matrix[:, symbol], detect_patterns(*columns))
+
+    def test_short_inputs(self):
+        assert len(detect_patterns([], [], [], [])) == 0
+        assert len(_codes((1.0, 2.0, 0.5, 1.5))) == 1
+
+    def test_pattern_names(self):
+        assert pattern_names(DOJI | INSIDE_BAR) == ["doji", "inside_bar"]
+        assert pattern_names(0) == []
+
+
+class TestPatternConfig:
+    """Test streaming pattern detection"""
+
+    def test_streaming_matches_batch(self):
+        opens, highs, lows, closes = _random_ohlc(300, seed=1)
+        candles = pd.DataFrame({"open": opens, "high": highs, "low": lows, "close": closes})
+        codes = detect_patterns(opens, highs, lows, closes)
+        config = PatternConfig()
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            config.update(state, bar)
+            assert state.code == codes[i]
+            assert state.buy == bool(codes[i] & (HAMMER | BULLISH_ENGULFING | MORNING_STAR))
+        computed = config.compute(candles)
+        assert (computed.code, computed.bars) == (state.code, state.bars)
+        for end in (1, 2):
+            assert config.compute(candles[:end]).code == codes[end - 1]
+
+    def test_candlestick_indicator_pattern(self):
+        candles = pd.DataFrame(
+            {
+                "open": [11.0, 9.9, 9.9],
+                "high": [11.1, 10.0, 10.9],
+                "low": [9.9, 9.7, 9.8],
+                "close": [10.0, 9.8, 10.8],
+                "volume": [100.0, 100.0, 300.0],
+            }
+        )
+        indicator = CandlestickIndicator(lookback_period=3)
+        indicator.compute_indicator(candles)
+        assert indicator.pattern & MORNING_STAR
+        indicator.compute_indicator(candles.drop(columns=["high", "low"]))
+        assert indicator.pattern == 0
+
+
+@pytest.mark.parametrize("ratio", [0.05, 0.2])
+def test_doji_ratio(ratio):
+    codes = detect_patterns([10.0], [11.0], [9.0], [10.15], doji_ratio=ratio)
+    assert bool(codes[0] & DOJI) == (0.15 <= ratio * 2)
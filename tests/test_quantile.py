@@ -0,0 +1,172 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from python_trading_indicators.config import candle_bars
+from python_trading_indicators.quantile import (
+    AdaptiveThresholds,
+    RollingQuantile,
+    adaptive_thresholds,
+)
+from python_trading_indicators.rsi import RSIConfig, RSIIndicator, rsi_series
+from python_trading_indicators.vix import VIXConfig, VIXIndicator
+
+
+def _values(length, seed=0):
+    # Few distinct values so the skip list sees plenty of duplicates
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 30, length).astype(float)
+    values[rng.random(length) < 0.05] = np.nan
+    return values
+
+
+def _timestamps(length, seed=1):
+    # Bars one to three minutes apart
+    return np.cumsum(np.random.default_rng(seed).integers(1, 4, length)) * 60.0
+
+
+class TestRollingQuantile:
+    """Test the skip-list window against numpy"""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 100])
+    def test_matches_numpy(self, size):
+        values = _values(1500)
+        window = RollingQuantile(size)
+        for i, value in enumerate(values):
+            window.push(value)
+            kept = values[max(i - size + 1, 0): i + 1]
+            kept = kept[~np.isnan(kept)]
+            assert window.count == len(kept)
+            for q in (0.0, 0.1, 0.5, 0.9, 1.0):
+                if len(kept):
+                    assert window.quantile(q) == pytest.approx(np.quantile(kept, q))
+                else:
+                    assert np.isnan(window.quantile(q))
+
+    def test_copy_and_pickle(self):
+        window = RollingQuantile(5000, _values(5000))
+        for clone in (copy.deepcopy(window), pickle.loads(pickle.dumps(window))):
+            assert clone.count == window.count
+            assert clone.quantile(0.3) == window.quantile(0.3)
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            RollingQuantile(0)
+
+
+class TestAdaptiveThresholds:
+    """Test the streaming, latest and vectorized levels"""
+
+    def test_series_matches_streaming(self):
+        values = _values(600, seed=2)
+        adaptive = AdaptiveThresholds(50, 0.1, 0.9, min_periods=10)
+        lower, upper = adaptive.series(values)
+        window = adaptive.new_window()
+        for i, value in enumerate(values):
+            levels = adaptive.levels(window, -1.0, -2.0)
+            assert adaptive.latest(values[: i + 1], -1.0, -2.0) == pytest.approx(levels)
+            if window.count < 10:
+                assert levels == (-1.0, -2.0)
+                assert np.isnan(lower[i]) and np.isnan(upper[i])
+            else:
+                assert levels == pytest.approx((lower[i], upper[i]))
+            window.push(value)
+
+    def test_series_2d(self):
+        matrix = np.column_stack([_values(200, seed) for seed in range(3)])
+        adaptive = AdaptiveThresholds(20, 0.2, 0.8, min_periods=5)
+        lower, upper = adaptive.series(matrix)
+        assert lower.shape == upper.shape == matrix.shape
+        for symbol in range(3):
+            expected = adaptive.series(matrix[:, symbol])
+            np.testing.assert_array_equal(lower[:, symbol], expected[0])
+            np.testing.assert_array_equal(upper[:, symbol], expected[1])
+
+    def test_validation(self):
+        assert AdaptiveThresholds(100).min_periods == 100
+        assert adaptive_thresholds({"window": 10, "upper": 0.95}).upper == 0.95
+        assert adaptive_thresholds(None) is None
+        for kwargs in (
+            {"window": 0},
+            {"lower": 0.9, "upper": 0.1},
+            {"upper": 1.5},
+            {"window": 10, "min_periods": 11},
+        ):
+            with pytest.raises(ValueError):
+                AdaptiveThresholds(**kwargs)
+
+
+class TestAdaptiveRSI:
+    """Test RSI signals against quantiles of its own history"""
+
+    adaptive = AdaptiveThresholds(60, 0.2, 0.8, min_periods=20)
+
+    def test_streaming_matches_batch(self, random_candles):
+        candles = random_candles(300, seed=1, timestamps=_timestamps(300))
+        config = RSIConfig(14, adaptive=self.adaptive)
+        values = rsi_series(candles["close"], 14)
+        lower, upper = self.adaptive.series(values)
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            preview = config.peek(state, bar)
+            config.update(state, bar)
+            assert preview == (state.value, state.buy, state.sell, state.bars)
+            if i < 14 + 20:
+                continue
+            j = i - 14
+            assert state.thresholds == pytest.approx((lower[j], upper[j]))
+            assert state.buy == (values[j] < state.thresholds[0])
+            assert state.sell == (values[j] > state.thresholds[1])
+        computed = config.compute(candles)
+        assert computed.thresholds == pytest.approx(state.thresholds)
+        assert computed.quantiles.quantile(0.5) == pytest.approx(state.quantiles.quantile(0.5))
+
+        indicator = RSIIndicator(14, adaptive=self.adaptive)
+        indicator.calculate(candles)
+        assert indicator.thresholds == pytest.approx(state.thresholds)
+        assert indicator.check_buy_condition() == state.buy
+        assert indicator.check_sell_condition() == state.sell
+        assert indicator.config == config
+
+    def test_fixed_until_min_periods(self, random_candles):
+        candles = random_candles(30, seed=1, timestamps=_timestamps(30))
+        indicator = RSIIndicator(14, 25, 75, adaptive={"window": 60, "min_periods": 20})
+        indicator.calculate(candles)
+        assert indicator.thresholds == (25, 75)
+        assert RSIConfig(14, 25, 75, self.adaptive).compute(candles).thresholds == (25, 75)
+
+
+class TestAdaptiveVIX:
+    """Test VIX levels against quantiles of its own history"""
+
+    adaptive = AdaptiveThresholds(40, 0.1, 0.9, min_periods=10)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"estimator": "parkinson"}, {"window": 900}]
+    )
+    def test_compute_matches_streaming(self, kwargs, random_candles):
+        candles = random_candles(250, seed=3, timestamps=_timestamps(250))
+        config = VIXConfig(10, adaptive=self.adaptive, **kwargs)
+        streamed = config.replay(candle_bars(candles))
+        for end in (30, 120, 250):
+            state = config.compute(candles[:end])
+            expected = config.replay(candle_bars(candles[:end]))
+            assert state.bars == expected.bars
+            assert state.thresholds == pytest.approx(expected.thresholds)
+            assert (state.value, state.buy, state.sell) == pytest.approx(
+                (expected.value, expected.buy, expected.sell)
+            )
+        indicator = VIXIndicator(10, adaptive=self.adaptive, **kwargs)
+        indicator.calculate(candles)
+        assert indicator.thresholds == pytest.approx(streamed.thresholds)
+        assert indicator.current_value == pytest.approx(streamed.value)
+
+    def test_levels_follow_history(self, random_candles):
+        candles = random_candles(250, seed=4, timestamps=_timestamps(250))
+        state = VIXConfig(10, adaptive=self.adaptive).replay(candle_bars(candles))
+        history = VIXIndicator(10, history=None)
+        history.calculate(candles)
+        recent = history.history()[-41:-1]
+        assert state.thresholds == pytest.approx(tuple(np.quantile(recent, [0.1, 0.9])))
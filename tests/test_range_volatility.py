@@ -0,0 +1,207 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.config import candle_bars, time_window_series
+from python_trading_indicators.vix import (
+    ESTIMATORS,
+    VIXConfig,
+    VIXIndicator,
+    bars_per_year,
+    range_volatility_series,
+    vix_series,
+)
+
+RANGE_ESTIMATORS = ESTIMATORS[1:]
+
+
+def _simulated_candles(bars, sigma=0.01, steps=200, seed=0):
+    """OHLC bars of a driftless random walk with per-bar volatility ``sigma``"""
+    rng = np.random.default_rng(seed)
+    paths = np.cumsum(rng.normal(0, sigma / math.sqrt(steps), (bars, steps)), axis=1)
+    paths += np.concatenate([[0.0], paths[:-1, -1]]).cumsum()[:, None]
+    opens = np.concatenate([[0.0], paths[:-1, -1]])
+    log_prices = np.column_stack([opens, paths])
+    return pd.DataFrame(
+        {
+            "timestamp": np.arange(bars) * 60.0,
+            "open": 100 * np.exp(opens),
+            "high": 100 * np.exp(log_prices.max(axis=1)),
+            "low": 100 * np.exp(log_prices.min(axis=1)),
+            "close": 100 * np.exp(paths[:, -1]),
+            "volume": rng.integers(100, 2000, bars).astype(float),
+        }
+    )
+
+
+def _direct(candles, period, estimator):
+    o, h, l, c = (np.log(candles[name]) for name in ("open", "high", "low", "close"))
+    if estimator == "parkinson":
+        variance = (h - l) ** 2 / (4 * math.log(2))
+    elif estimator == "garman_klass":
+        variance = 0.5 * (h - l) ** 2 - (2 * math.log(2) - 1) * (c - o) ** 2
+    else:
+        variance = (h - c) * (h - o) + (l - c) * (l - o)
+    mean = variance.rolling(period).mean().to_numpy()[period - 1:]
+    return np.sqrt(mean) * math.sqrt(252) * 100
+
+
+class TestRangeEstimators:
+    """Test the Parkinson, Garman-Klass and Rogers-Satchell estimators"""
+
+    @pytest.mark.parametrize("estimator", RANGE_ESTIMATORS)
+    def test_series_matches_formula(self, estimator):
+        """Test the vectorized series against the textbook formulas"""
+        candles = _simulated_candles(100)
+        values = range_volatility_series(
+            candles["open"], candles["high"], candles["low"], candles["close"], 10, estimator
+        )
+        np.testing.assert_allclose(values, _direct(candles, 10, estimator), rtol=1e-9)
+
+    def test_series_2d(self):
+        """Test that a (bars x symbols) matrix equals per-symbol series"""
+        frames = [_simulated_candles(60, seed=seed) for seed in range(3)]
+        columns = [
+            np.column_stack([frame[name] for frame in frames])
+            for name in ("open", "high", "low", "close")
+        ]
+        matrix = range_volatility_series(*columns, period=8, estimator="garman_klass")
+        for symbol, frame in enumerate(frames):
+            np.testing.assert_allclose(
+                matrix[:, symbol],
+                range_volatility_series(
+                    frame["open"], frame["high"], frame["low"], frame["close"], 8,
+                    "garman_klass",
+                ),
+            )
+
+    @pytest.mark.parametrize("estimator", RANGE_ESTIMATORS)
+    def test_streaming_matches_series(self, estimator):
+        """Test O(1) streaming updates, compute and peek against the series"""
+        candles = _simulated_candles(80, seed=1)
+        config = VIXConfig(period=10, estimator=estimator)
+        expected = range_volatility_series(
+            candles["open"], candles["high"], candles["low"], candles["close"], 10, estimator
+        )
+        state = config.new_state()
+        values = []
+        for bar in candle_bars(candles):
+            snapshot = config.peek(state, bar)
+            config.update(state, bar)
+            assert snapshot == (state.value, state.buy, state.sell, state.bars)
+            if state.bars >= 10:
+                values.append(state.vix)
+        np.testing.assert_allclose(values, expected)
+        assert config.compute(candles).vix == pytest.approx(expected[-1])
+
+    @pytest.mark.parametrize("estimator", RANGE_ESTIMATORS)
+    def test_time_window(self, estimator):
+        """Test that a time window over regular bars matches the period"""
+        candles = _simulated_candles(80, seed=2)
+        expected = range_volatility_series(
+            candles["open"], candles["high"], candles["low"], candles["close"], 10, estimator
+        )
+        config = VIXConfig(estimator=estimator, window=600)
+        # The time window starts once the history spans it: one bar later
+        np.testing.assert_allclose(time_window_series(config, candles), expected[1:])
+
+    @pytest.mark.parametrize("estimator", RANGE_ESTIMATORS)
+    def test_indicator(self, estimator):
+        """Test VIXIndicator with a range estimator"""
+        candles = _simulated_candles(60, seed=3)
+        indicator = VIXIndicator(period=10, estimator=estimator, history=None)
+        indicator.compute_indicator(candles)
+        expected = range_volatility_series(
+            candles["open"], candles["high"], candles["low"], candles["close"], 10, estimator
+        )
+        np.testing.assert_allclose(indicator.history(), expected)
+        assert indicator.current_value == pytest.approx(expected[-1])
+        assert indicator.config.compute(candles).value == pytest.approx(expected[-1])
+
+        # Range estimators need `period` candles, not period + 1
+        short = VIXIndicator(period=10, estimator=estimator)
+        short.compute_indicator(candles[:10])
+        assert short.current_value > 0
+
+    @pytest.mark.parametrize("estimator", RANGE_ESTIMATORS)
+    def test_bad_bar(self, estimator):
+        """Test that a bar without a finite variance is left out of every path"""
+        candles = _simulated_candles(60, seed=5)
+        candles.loc[5, "low"] = 0.0
+        expected = range_volatility_series(
+            candles["open"], candles["high"], candles["low"], candles["close"], 10, estimator
+        )
+        clean = candles.drop(index=5)
+        # Windows holding the bad bar average their other nine bars
+        np.testing.assert_allclose(
+            expected[:6],
+            range_volatility_series(
+                clean["open"], clean["high"], clean["low"], clean["close"], 9, estimator
+            )[:6],
+        )
+        assert np.isfinite(expected).all()
+
+        config = VIXConfig(period=10, estimator=estimator)
+        state = config.new_state()
+        values = []
+        for bar in candle_bars(candles):
+            snapshot = config.peek(state, bar)
+            config.update(state, bar)
+            assert snapshot == (state.value, state.buy, state.sell, state.bars)
+            if state.bars >= 10:
+                values.append(state.vix)
+        np.testing.assert_allclose(values, expected)
+        assert config.compute(candles).value == pytest.approx(expected[-1])
+        assert config.replay(candle_bars(candles)).value == pytest.approx(expected[-1])
+        for history in (0, None):
+            indicator = VIXIndicator(period=10, estimator=estimator, history=history)
+            indicator.compute_indicator(candles)
+            assert indicator.current_value == pytest.approx(expected[-1])
+
+        timed = VIXConfig(estimator=estimator, window=600)
+        np.testing.assert_allclose(time_window_series(timed, candles), expected[1:])
+
+    def test_efficiency(self):
+        """Test that Parkinson estimates scatter less than close-to-close ones"""
+        sigma = 0.01
+        candles = _simulated_candles(4000, sigma=sigma, seed=4)
+        true = sigma * math.sqrt(252) * 100
+        close = vix_series(candles["close"], 10)
+        parkinson = range_volatility_series(
+            candles["open"], candles["high"], candles["low"], candles["close"], 10
+        )
+        close_error = np.sqrt(np.mean((close - true) ** 2))
+        parkinson_error = np.sqrt(np.mean((parkinson - true) ** 2))
+        assert parkinson_error < 0.7 * close_error
+
+
+class TestAnnualization:
+    """Test the configurable annualization factor"""
+
+    def test_bars_per_year(self):
+        assert bars_per_year(300) == pytest.approx(252 * 78)
+        assert bars_per_year(3600, session=24 * 3600, trading_days=365) == 365 * 24
+
+    def test_periods_per_year_scales(self):
+        candles = _simulated_candles(50, seed=5)
+        periods = bars_per_year(300)
+        daily = vix_series(candles["close"], 10)
+        intraday = vix_series(candles["close"], 10, periods_per_year=periods)
+        np.testing.assert_allclose(intraday, daily * math.sqrt(periods / 252))
+        config = VIXConfig(period=10, periods_per_year=periods)
+        assert config.compute(candles).vix == pytest.approx(intraday[-1])
+        indicator = VIXIndicator(period=10, periods_per_year=periods)
+        indicator.compute_indicator(candles)
+        assert indicator.current_value == pytest.approx(intraday[-1])
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            VIXConfig(estimator="yang_zhang")
+        with pytest.raises(ValueError):
+            VIXConfig(periods_per_year=0)
+        with pytest.raises(ValueError):
+            VIXIndicator(estimator="yang_zhang")
+        with pytest.raises(ValueError):
+            range_volatility_series([1.0], [1.0], [1.0], [1.0], 1, "close")
@@ -0,0 +1,125 @@
+import subprocess
+import sys
+
+import pytest
+
+import python_trading_indicators
+from python_trading_indicators import registry
+from python_trading_indicators.indicator import Indicator
+from python_trading_indicators.registry import (
+    available_indicators,
+    create,
+    create_from_config,
+    get_indicator_class,
+    register_indicator,
+)
+from python_trading_indicators.rsi import RSIIndicator
+from python_trading_indicators.vix import VIXIndicator
+
+
+class TestLazyPackage:
+    """Test lazy attribute loading of the package"""
+
+    def test_import_does_not_load_pandas(self):
+        """Test that importing the package does not import pandas or numpy"""
+        code = (
+            "import sys, python_trading_indicators; "
+            "assert 'pandas' not in sys.modules; "
+            "assert 'numpy' not in sys.modules; "
+            "assert 'python_trading_indicators.rsi' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazy_attributes(self):
+        """Test that exported indicator classes resolve on access"""
+        assert python_trading_indicators.RSIIndicator is RSIIndicator
+        assert python_trading_indicators.Indicator is Indicator
+        assert "VIXIndicator" in dir(python_trading_indicators)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes raise AttributeError"""
+        with pytest.raises(AttributeError):
+            python_trading_indicators.DoesNotExist
+
+
+class TestRegistry:
+    """Test building indicators by name"""
+
+    def test_builtin_names(self):
+        """Test that all built-in indicators are registered"""
+        names = available_indicators()
+        for name in ("rsi", "vix", "drop", "candlestick", "passthrough"):
+            assert name in names
+
+    def test_create_with_params(self):
+        """Test creating an indicator with parameters"""
+        rsi = create("rsi", period=21, buy_threshold=25)
+
+        assert isinstance(rsi, RSIIndicator)
+        assert rsi.period == 21
+
+    def test_create_is_case_insensitive(self):
+        """Test case-insensitive names"""
+        assert isinstance(create("VIX"), VIXIndicator)
+
+    def test_create_from_config(self):
+        """Test creating an indicator from a config mapping"""
+        config = {"name": "vix", "period": 10, "enabled": False}
+        vix = create_from_config(config)
+
+        assert isinstance(vix, VIXIndicator)
+        assert vix.period == 10
+        assert vix.is_enabled is False
+        assert config["name"] == "vix"  # Input mapping is not mutated
+
+    def test_config_requires_name(self):
+        """Test that configs without a name are rejected"""
+        with pytest.raises(ValueError):
+            create_from_config({"period": 14})
+
+    def test_unknown_name(self):
+        """Test that unknown names raise a helpful error"""
+        with pytest.raises(ValueError, match="available"):
+            create("does_not_exist")
+
+    def test_register_lazy_reference(self, monkeypatch):
+        """Test registering a custom indicator by 'module:attribute' reference"""
+        monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+        register_indicator("rsi_alias", "python_trading_indicators.rsi:RSIIndicator")
+
+        assert get_indicator_class("rsi_alias") is RSIIndicator
+
+    def test_register_class(self, monkeypatch):
+        """Test registering a custom indicator class"""
+        monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+        register_indicator("vix_alias", VIXIndicator)
+
+        assert isinstance(create("vix_alias", period=5), VIXIndicator)
+
+    def test_register_invalid_reference(self):
+        """Test that malformed references are rejected"""
+        with pytest.raises(ValueError):
+            register_indicator("broken", "no_colon_here")
+
+    def test_entry_point_plugins_load_lazily(self, monkeypatch):
+        """Test that entry point indicators are only imported when created"""
+        from importlib import metadata
+
+        entry_point = metadata.EntryPoint(
+            name="plugin_rsi",
+            value="python_trading_indicators.rsi:RSIIndicator",
+            group=registry.ENTRY_POINT_GROUP,
+        )
+
+        def fake_entry_points(group=None):
+            if group is None:
+                return {registry.ENTRY_POINT_GROUP: [entry_point]}
+            return [entry_point]
+
+        monkeypatch.setattr(metadata, "entry_points", fake_entry_points)
+        monkeypatch.setattr(registry, "_entry_points_loaded", False)
+        monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+
+        assert "plugin_rsi" in available_indicators()
+        assert registry._registry["plugin_rsi"] is entry_point
+        assert isinstance(create("plugin_rsi", period=3), RSIIndicator)
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.config import Bar
+from python_trading_indicators.resample import TimeframeAggregator, resample_candles
+from python_trading_indicators.rsi import RSIConfig
+from python_trading_indicators.vix import VIXConfig
+
+
+@pytest.fixture
+def minute_candles():
+    """Two days of 1-minute candles with a few missing minutes"""
+    rng = np.random.default_rng(3)
+    timestamps = np.arange(0, 2 * 24 * 3600, 60, dtype=float)
+    timestamps = np.delete(timestamps, [5, 6, 7, 400, 1000])
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, len(timestamps))))
+    opens = np.concatenate([[100.0], closes[:-1]])
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": opens,
+            "high": np.maximum(opens, closes) + rng.random(len(closes)),
+            "low": np.minimum(opens, closes) - rng.random(len(closes)),
+            "close": closes,
+            "volume": rng.integers(1, 100, len(closes)).astype(float),
+        }
+    )
+
+
+def _bars(candles):
+    return [
+        Bar(row.open, row.high, row.low, row.close, row.volume, row.timestamp)
+        for row in candles.itertuples()
+    ]
+
+
+TIMEFRAMES = {"5m": 300, "15m": 900, "1h": 3600}
+
+
+class TestResampleCandles:
+    """Test the vectorized batch path"""
+
+    def test_ohlcv_aggregation(self):
+        """Test OHLCV reductions for a single bucket split"""
+        candles = pd.DataFrame(
+            {
+                "timestamp": [0, 60, 120, 300],
+                "open": [1, 2, 3, 4],
+                "high": [5, 9, 6, 7],
+                "low": [0.5, 0.2, 0.9, 3],
+                "close": [2, 3, 4, 5],
+                "volume": [10, 20, 30, 40],
+            }
+        )
+        bars = resample_candles(candles, 300)
+
+        assert bars["timestamp"].tolist() == [0, 300]
+        assert bars["open"].tolist() == [1, 4]
+        assert bars["high"].tolist() == [9, 7]
+        assert bars["low"].tolist() == [0.2, 3]
+        assert bars["close"].tolist() == [4, 5]
+        assert bars["volume"].tolist() == [60, 40]
+
+    def test_datetime_timestamps(self):
+        """Test datetime64 timestamp columns"""
+        candles = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-01", periods=10, freq="min"),
+                "open": 1.0,
+                "high": 1.0,
+                "low": 1.0,
+                "close": 1.0,
+                "volume": 1.0,
+            }
+        )
+
+        assert len(resample_candles(candles, 300)) == 2
+
+    def test_empty_input(self):
+        """Test that empty inputs produce an empty frame"""
+        empty = pd.DataFrame(
+            {name: [] for name in ("timestamp", "open", "high", "low", "close", "volume")}
+        )
+
+        assert resample_candles(empty, 300).empty
+
+
+class TestTimeframeAggregator:
+    """Test incremental multi-timeframe aggregation"""
+
+    def test_streaming_matches_batch(self, minute_candles):
+        """Test that streamed bars equal the vectorized resampling"""
+        aggregator = TimeframeAggregator(TIMEFRAMES)
+        emitted = {name: [] for name in TIMEFRAMES}
+        for bar in _bars(minute_candles):
+            for name, completed in aggregator.update(bar).items():
+                emitted[name].append(completed)
+        for name, completed in aggregator.flush().items():
+            emitted[name].append(completed)
+
+        for name, timeframe in TIMEFRAMES.items():
+            expected = resample_candles(minute_candles, timeframe)
+            streamed = pd.DataFrame(emitted[name])
+            np.testing.assert_allclose(
+                streamed[["timestamp", "open", "high", "low", "close", "volume"]],
+                expected,
+            )
+
+    def test_indicators_fed_with_completed_bars(self, minute_candles):
+        """Test that timeframe indicator states match batch computation"""
+        indicators = {"15m": {"rsi": RSIConfig(14)}, "1h": {"vix": VIXConfig(10)}}
+        aggregator = TimeframeAggregator(TIMEFRAMES, indicators, base_interval=60)
+        for bar in _bars(minute_candles):
+            aggregator.update(bar)
+
+        for name, key, config in (("15m", "rsi", RSIConfig(14)), ("1h", "vix", VIXConfig(10))):
+            expected = config.compute(resample_candles(minute_candles, TIMEFRAMES[name]))
+            state = aggregator.state(name, key)
+            assert state.bars == expected.bars
+            assert state.value == pytest.approx(expected.value)
+
+    def test_base_interval_completes_eagerly(self):
+        """Test that the last base bar of a bucket completes it immediately"""
+        aggregator = TimeframeAggregator({"5m": 300}, base_interval=60)
+        for minute in range(4):
+            assert aggregator.update(Bar(1, 2, 0, 1, 1, minute * 60.0)) == {}
+        completed = aggregator.update(Bar(1, 3, 0, 2, 1, 240.0))
+
+        assert completed["5m"] == Bar(1, 3, 0, 2, 5, 0.0)
+        assert aggregator.forming("5m") is None
+
+    def test_forming_bar(self):
+        """Test access to the forming bar"""
+        aggregator = TimeframeAggregator({"5m": 300})
+        aggregator.update(Bar(10, 11, 9, 10.5, 5, 0.0))
+        aggregator.update(Bar(10.5, 12, 10, 11, 7, 60.0))
+
+        assert aggregator.forming("5m") == Bar(10, 12, 9, 11, 12, 0.0)
+
+    def test_peek_on_forming_bar(self, minute_candles):
+        """Test provisional readings on the forming bar before it completes"""
+        config = RSIConfig(5)
+        aggregator = TimeframeAggregator({"1h": 3600}, {"1h": {"rsi": config}})
+        bars = _bars(minute_candles)
+        for bar in bars[:-30]:
+            aggregator.update(bar)
+        state = aggregator.state("1h", "rsi")
+        committed = state.bars
+
+        preview = aggregator.peek("1h", "rsi")
+        forming = aggregator.forming("1h")
+        assert preview == config.peek(state, forming)
+        assert state.bars == committed
+
+        for bar in bars[-30:]:
+            aggregator.update(bar)
+        aggregator.flush()
+        assert aggregator.peek("1h", "rsi") is None
+
+    def test_validation(self):
+        """Test invalid configurations and bars"""
+        with pytest.raises(ValueError):
+            TimeframeAggregator({"bad": 0})
+        with pytest.raises(ValueError):
+            TimeframeAggregator({"5m": 300}, {"1h": {"rsi": RSIConfig()}})
+        with pytest.raises(ValueError):
+            TimeframeAggregator({"5m": 300}).update(Bar(1, 1, 1, 1))
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from python_trading_indicators.rsi import RSIConfig, rsi_series
+from python_trading_indicators.screener import (
+    Screener,
+    StreamingTopK,
+    bottom_k,
+    select,
+    top_k,
+)
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(4).permutation(1000).astype(float)
+
+
+class TestRankingFunctions:
+    """Test the argpartition-based rankings"""
+
+    def test_top_and_bottom_k(self, values):
+        """Test that rankings match a full sort"""
+        order = np.argsort(values)
+
+        np.testing.assert_array_equal(top_k(values, 10), order[::-1][:10])
+        np.testing.assert_array_equal(bottom_k(values, 10), order[:10])
+        assert top_k(values, 10).dtype == np.intp
+
+    def test_k_edge_cases(self, values):
+        """Test k of zero and k beyond the number of values"""
+        assert len(top_k(values, 0)) == 0
+        np.testing.assert_array_equal(bottom_k(values[:5], 50), np.argsort(values[:5]))
+        with pytest.raises(ValueError):
+            top_k(values, -1)
+
+    def test_nan_values_are_skipped(self):
+        """Test that NaN values never rank"""
+        values = np.array([5.0, np.nan, 1.0, 9.0, np.nan])
+
+        assert top_k(values, 10).tolist() == [3, 0, 2]
+        assert bottom_k(values, 2).tolist() == [2, 0]
+        assert select(values, above=0).tolist() == [0, 2, 3]
+
+    def test_select(self, values):
+        """Test threshold filters"""
+        assert select(values, below=3).tolist() == sorted(np.flatnonzero(values < 3))
+        assert len(select(values, below=600, above=400)) == 199
+
+    def test_cross_sectional_rsi(self, random_closes):
+        """Test screening the last row of a multi-symbol RSI computation"""
+        closes = random_closes(100, seed=2, symbols=300)
+        latest = rsi_series(closes, 14)[-1]
+
+        oversold = bottom_k(latest, 5)
+        assert latest[oversold].tolist() == sorted(latest)[:5]
+
+
+class TestStreamingTopK:
+    """Test the incremental heap ranking"""
+
+    def test_matches_argpartition_under_updates(self):
+        """Test that heap rankings follow arbitrary value changes"""
+        rng = np.random.default_rng(6)
+        size = 200
+        values = np.full(size, np.nan)
+        largest = StreamingTopK(size, 10, largest=True)
+        smallest = StreamingTopK(size, 10, largest=False)
+        for step in range(5000):
+            index = int(rng.integers(size))
+            value = np.nan if step % 97 == 0 else float(rng.normal())
+            values[index] = value
+            largest.update(index, value)
+            smallest.update(index, value)
+            if step % 250 == 0:
+                np.testing.assert_array_equal(largest.indices(), top_k(values, 10))
+                np.testing.assert_array_equal(smallest.indices(4), bottom_k(values, 4))
+
+
+class TestScreener:
+    """Test the per-symbol screener"""
+
+    def test_states_and_queries(self, random_closes):
+        """Test feeding compute_many results and querying symbols"""
+        symbols = [f"S{i:03d}" for i in range(50)]
+        closes = random_closes(60, seed=9, symbols=50)
+        candles = {symbol: {"close": closes[:, i]} for i, symbol in enumerate(symbols)}
+        states = RSIConfig(14).compute_many(candles)
+
+        for streaming_k in (None, 5):
+            screener = Screener(symbols, streaming_k=streaming_k)
+            screener.update_states(states)
+            ranked = sorted(symbols, key=lambda symbol: states[symbol].value)
+
+            assert screener.symbols_at(screener.bottom_k(5)) == ranked[:5]
+            assert screener.symbols_at(screener.top_k(7)) == ranked[::-1][:7]
+            assert set(screener.symbols_at(screener.select(below=30))) == {
+                symbol for symbol in symbols if states[symbol].value < 30
+            }
+
+    def test_warming_up_states_never_rank(self, random_closes):
+        """Test that states without enough bars are screened as NaN"""
+        closes = random_closes(100, seed=3, symbols=2)
+        candles = {
+            "A": {"close": closes[:, 0]},
+            "B": {"close": closes[:, 1]},
+            "NEW": {"close": closes[:5, 0]},
+        }
+        states = RSIConfig(14).compute_many(candles)
+        assert states["A"].ready and states["B"].ready and not states["NEW"].ready
+
+        for streaming_k in (None, 2):
+            screener = Screener(["A", "B", "NEW"], streaming_k=streaming_k)
+            screener.update_states(states)
+
+            assert np.isnan(screener.values[2])
+            assert "NEW" not in screener.symbols_at(screener.bottom_k(3))
+            assert "NEW" not in screener.symbols_at(screener.select(above=-1.0))
+
+    def test_streaming_updates(self):
+        """Test incremental updates with heaps against a batch reload"""
+        symbols = ["A", "B", "C", "D"]
+        screener = Screener(symbols, streaming_k=2)
+        screener.set_values([40.0, 20.0, 60.0, 50.0])
+        screener.update("C", 10.0)
+        screener.update_many({"B": 70.0})
+
+        assert screener.symbols_at(screener.top_k(2)) == ["B", "D"]
+        assert screener.symbols_at(screener.bottom_k(2)) == ["C", "A"]
+        assert screener.symbols_at(screener.top_k(4)) == ["B", "D", "A", "C"]
+        assert screener.values.tolist() == [40.0, 70.0, 10.0, 50.0]
+
+    def test_validation(self):
+        """Test invalid inputs"""
+        with pytest.raises(ValueError):
+            Screener(["A", "A"])
+        with pytest.raises(ValueError):
+            Screener(["A", "B"]).set_values([1.0])
+        with pytest.raises(KeyError):
+            Screener(["A"]).update("B", 1.0)
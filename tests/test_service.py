@@ -0,0 +1,213 @@
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from python_trading_indicators.config import Bar
+from python_trading_indicators.indicator import IndicatorSnapshot
+from python_trading_indicators.rsi import RSIConfig
+from python_trading_indicators.service import (
+    ConsistentHashRing,
+    Coordinator,
+    IndicatorWorker,
+    run_worker,
+)
+from python_trading_indicators.service.protocol import (
+    decode_bars,
+    decode_results,
+    encode_bars,
+    encode_results,
+)
+from python_trading_indicators.vix import VIXConfig
+
+CONFIGS = {"rsi": RSIConfig(period=5), "vix": VIXConfig(period=5)}
+
+
+def _bars(symbols, steps, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = {symbol: 100.0 for symbol in symbols}
+    for _ in range(steps):
+        bars = {}
+        for symbol in symbols:
+            close = prices[symbol] * float(np.exp(rng.normal(0, 0.02)))
+            bars[symbol] = Bar(prices[symbol], close * 1.01, close * 0.99, close, 1000.0)
+            prices[symbol] = close
+        yield bars
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestConsistentHashRing:
+    """Test symbol partitioning"""
+
+    def test_balanced_partition(self):
+        """Test that symbols spread roughly evenly over nodes"""
+        ring = ConsistentHashRing(["a", "b", "c"], replicas=128)
+        counts = Counter(ring.node_for(f"SYM{i}") for i in range(3000))
+
+        assert set(counts) == {"a", "b", "c"}
+        assert min(counts.values()) > 600
+
+    def test_adding_node_moves_few_symbols(self):
+        """Test that adding a node only remaps a fraction of the symbols"""
+        symbols = [f"SYM{i}" for i in range(2000)]
+        ring = ConsistentHashRing(["a", "b", "c"])
+        before = {symbol: ring.node_for(symbol) for symbol in symbols}
+        ring.add_node("d")
+        moved = [symbol for symbol in symbols if ring.node_for(symbol) != before[symbol]]
+
+        assert all(ring.node_for(symbol) == "d" for symbol in moved)
+        assert len(moved) < len(symbols) / 2
+
+    def test_empty_ring(self):
+        """Test that an empty ring cannot place symbols"""
+        with pytest.raises(ValueError):
+            ConsistentHashRing().node_for("BTC")
+
+
+class TestProtocol:
+    """Test the binary wire format"""
+
+    def test_bars_round_trip(self):
+        """Test encoding and decoding bars"""
+        bars = {"BTC": Bar(1.0, 2.0, 0.5, 1.5, 10.0), "ÉTH": Bar(3.0, 4.0, 2.0, 3.5, 0.0)}
+
+        assert decode_bars(encode_bars(bars)) == bars
+
+    def test_bar_timestamps_round_trip(self):
+        """Test that bar timestamps cross the wire, and a missing one stays None"""
+        bars = {
+            "AAPL": Bar(1.0, 2.0, 0.5, 1.5, 10.0, timestamp=1.7e9),
+            "MSFT": Bar(3.0, 4.0, 2.0, 3.5, 0.0),
+        }
+
+        decoded = decode_bars(encode_bars(bars))
+        assert decoded == bars
+        assert decoded["AAPL"].timestamp == 1.7e9
+        assert decoded["MSFT"].timestamp is None
+
+    def test_results_round_trip(self):
+        """Test encoding and decoding results"""
+        rows = [("BTC", "rsi", IndicatorSnapshot(25.0, True, False))]
+
+        assert decode_results(encode_results(rows)) == {
+            ("BTC", "rsi"): IndicatorSnapshot(25.0, True, False)
+        }
+
+
+class TestCoordinator:
+    """Test the coordinator with several workers on localhost"""
+
+    def test_sharded_results_match_local_computation(self):
+        """Test that gathered signal tables match a single-process computation"""
+        symbols = [f"SYM{i}" for i in range(30)]
+        workers = [IndicatorWorker(CONFIGS).start() for _ in range(3)]
+        states = {(s, n): c.new_state() for s in symbols for n, c in CONFIGS.items()}
+        try:
+            with Coordinator({f"w{i}": w.address for i, w in enumerate(workers)}) as coordinator:
+                for bars in _bars(symbols, 20):
+                    table = coordinator.process(bars, timeout=5.0)
+                    for (symbol, name), state in states.items():
+                        CONFIGS[name].update(state, bars[symbol])
+
+                    assert table.complete
+                    assert len(table.results) == len(states)
+                for key, state in states.items():
+                    assert table.results[key].value == pytest.approx(state.value)
+                    assert table.results[key].buy == state.buy
+        finally:
+            for worker in workers:
+                worker.stop()
+
+    def test_time_window_configs(self):
+        """Test that workers can serve configs that need bar timestamps"""
+        configs = {"vix": VIXConfig(window=300)}
+        state = configs["vix"].new_state()
+        worker = IndicatorWorker(configs).start()
+        try:
+            with Coordinator({"w": worker.address}) as coordinator:
+                for step, bars in enumerate(_bars(["BTC"], 20)):
+                    bars = {"BTC": bars["BTC"]._replace(timestamp=60.0 * step)}
+                    table = coordinator.process(bars, timeout=5.0)
+                    configs["vix"].update(state, bars["BTC"])
+
+                    assert table.complete
+                    assert table.results[("BTC", "vix")].value == pytest.approx(state.value)
+        finally:
+            worker.stop()
+
+    def test_unix_socket_worker(self):
+        """Test a worker listening on a Unix socket"""
+        path = os.path.join(tempfile.mkdtemp(), "worker.sock")
+        worker = IndicatorWorker(CONFIGS, address=path).start()
+        try:
+            with Coordinator({"local": path}) as coordinator:
+                table = coordinator.process(next(_bars(["BTC"], 1)), timeout=5.0)
+
+            assert table.complete
+            assert set(table.results) == {("BTC", "rsi"), ("BTC", "vix")}
+        finally:
+            worker.stop()
+        assert not os.path.exists(path)
+
+    def test_deadline_reports_missing_workers(self):
+        """Test that a worker that never answers is reported as missing"""
+        silent = socket.socket()
+        silent.bind(("127.0.0.1", 0))
+        silent.listen(1)
+        worker = IndicatorWorker(CONFIGS).start()
+        try:
+            workers = {"ok": worker.address, "silent": silent.getsockname()}
+            with Coordinator(workers) as coordinator:
+                symbols = [f"SYM{i}" for i in range(50)]
+                started = time.monotonic()
+                table = coordinator.process(next(_bars(symbols, 1)), timeout=0.3)
+
+            assert time.monotonic() - started < 2.0
+            assert table.missing_nodes == ["silent"]
+            answered = {symbol for symbol, _ in table.results}
+            assert answered == {s for s in symbols if coordinator.ring.node_for(s) == "ok"}
+        finally:
+            worker.stop()
+            silent.close()
+
+    def test_worker_processes(self):
+        """Test workers running in separate processes"""
+        context = multiprocessing.get_context("spawn")
+        addresses = {f"w{i}": ("127.0.0.1", _free_port()) for i in range(2)}
+        processes = [
+            context.Process(target=run_worker, args=(CONFIGS, address))
+            for address in addresses.values()
+        ]
+        for process in processes:
+            process.start()
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    coordinator = Coordinator(addresses, connect_timeout=1.0)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.1)
+            with coordinator:
+                for bars in _bars([f"SYM{i}" for i in range(10)], 10):
+                    table = coordinator.process(bars, timeout=5.0)
+                    assert table.complete
+                coordinator.close(shutdown_workers=True)
+        finally:
+            for process in processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+        assert all(process.exitcode == 0 for process in processes)
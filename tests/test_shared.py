@@ -0,0 +1,131 @@
+import multiprocessing
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.config import Bar
+from python_trading_indicators.indicator import IndicatorSnapshot
+from python_trading_indicators.rsi import RSIConfig
+from python_trading_indicators.shared import (
+    SharedIndicatorPublisher,
+    SharedIndicatorReader,
+    SharedIndicatorTable,
+)
+from python_trading_indicators.vix import VIXConfig
+
+
+def _read_in_child(name, queue):
+    with SharedIndicatorReader(name) as reader:
+        queue.put((reader.read("BTC", "rsi"), sorted(reader.keys())))
+
+
+class TestSharedIndicatorTable:
+    """Test the shared-memory result table"""
+
+    def test_write_and_read(self):
+        """Test a round trip through the table"""
+        with SharedIndicatorTable.create(capacity=4) as table:
+            table.write("BTC", "rsi", 25.5, True, False)
+
+            assert table.read("BTC", "rsi") == IndicatorSnapshot(25.5, True, False, 1)
+            assert table.read("ETH", "rsi") is None
+            assert len(table) == 1
+
+    def test_attach_sees_writes(self):
+        """Test that an attached table reads the writer's rows"""
+        with SharedIndicatorTable.create(capacity=4) as table:
+            table.write("BTC", "vix", 42.0, False, True)
+            with SharedIndicatorTable.attach(table.name) as reader:
+                assert reader.read("BTC", "vix").sell is True
+                table.write("ETH", "vix", 12.0, True, False)
+                assert reader.read("ETH", "vix").value == 12.0
+
+    def test_read_all(self):
+        """Test vectorized reads of all rows"""
+        with SharedIndicatorTable.create(capacity=8) as table:
+            for i in range(5):
+                table.write(f"S{i}", "rsi", float(i), i % 2 == 0, i % 2 == 1)
+            values, buys, sells = table.read_all()
+
+            np.testing.assert_array_equal(values, [0.0, 1.0, 2.0, 3.0, 4.0])
+            np.testing.assert_array_equal(buys, [True, False, True, False, True])
+            np.testing.assert_array_equal(sells, ~buys)
+
+    def test_capacity_and_key_limits(self):
+        """Test that full tables and oversized keys are rejected"""
+        with SharedIndicatorTable.create(capacity=1) as table:
+            table.write("BTC", "rsi", 1.0, False, False)
+            with pytest.raises(ValueError):
+                table.write("ETH", "rsi", 1.0, False, False)
+            with pytest.raises(ValueError):
+                table.write("X" * 40, "rsi", 1.0, False, False)
+
+    def test_concurrent_reader_never_sees_torn_rows(self):
+        """Test the sequence lock under a concurrently writing thread"""
+        with SharedIndicatorTable.create(capacity=1) as table:
+            table.write("BTC", "rsi", 0.0, True, False)
+            stop = threading.Event()
+
+            def writer():
+                i = 0
+                while not stop.is_set():
+                    i += 1
+                    # Even values are buys, odd values are sells
+                    table.write("BTC", "rsi", float(i), i % 2 == 0, i % 2 == 1)
+
+            thread = threading.Thread(target=writer)
+            thread.start()
+            try:
+                with SharedIndicatorTable.attach(table.name) as reader:
+                    for _ in range(20000):
+                        value, buy, sell, _ = reader.read("BTC", "rsi")
+                        assert buy == (int(value) % 2 == 0)
+                        assert sell == (not buy)
+            finally:
+                stop.set()
+                thread.join()
+
+
+class TestSharedIndicatorPublisher:
+    """Test computing once and reading from other processes"""
+
+    def test_publish_and_read_from_other_process(self, volatile_candles):
+        """Test that a child process reads the published results"""
+        configs = {"rsi": RSIConfig(period=14), "vix": VIXConfig(period=14)}
+        with SharedIndicatorPublisher(configs, capacity=16) as publisher:
+            publisher.compute("BTC", volatile_candles)
+            expected = RSIConfig(period=14).compute(volatile_candles)
+
+            context = multiprocessing.get_context("spawn")
+            queue = context.Queue()
+            process = context.Process(target=_read_in_child, args=(publisher.name, queue))
+            process.start()
+            snapshot, keys = queue.get(timeout=30)
+            process.join(timeout=30)
+
+            assert snapshot.value == pytest.approx(expected.value)
+            assert (snapshot.buy, snapshot.sell) == (expected.buy, expected.sell)
+            assert keys == [("BTC", "rsi"), ("BTC", "vix")]
+
+    def test_streaming_updates(self, volatile_candles):
+        """Test that bar updates are published to readers"""
+        configs = {"rsi": RSIConfig(period=5)}
+        with SharedIndicatorPublisher(configs, capacity=4) as publisher:
+            with SharedIndicatorReader(publisher.name) as reader:
+                state = RSIConfig(period=5).new_state()
+                for row in volatile_candles.itertuples():
+                    bar = Bar(row.open, row.high, row.low, row.close, row.volume)
+                    publisher.update("ETH", bar)
+                    RSIConfig(period=5).update(state, bar)
+
+                assert reader.read("ETH", "rsi").value == pytest.approx(state.value)
+                assert reader.read_all()[("ETH", "rsi")].value == pytest.approx(
+                    state.value
+                )
+
+    def test_reader_of_missing_table(self):
+        """Test that attaching to a non-existent table fails"""
+        with pytest.raises(FileNotFoundError):
+            SharedIndicatorReader("python_trading_indicators_missing_table")
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from python_trading_indicators.rsi import rsi_series
+from python_trading_indicators.signals import SignalMatrix
+
+INDICATORS = ["rsi", "vix", "drop", "candlestick", "passthrough"]
+
+
+@pytest.fixture
+def flags():
+    """Random buy/sell flags per indicator, (bars x symbols)"""
+    rng = np.random.default_rng(13)
+    return {
+        name: (rng.random((300, 40)) < 0.2, rng.random((300, 40)) < 0.1)
+        for name in INDICATORS
+    }
+
+
+@pytest.fixture
+def signals(flags):
+    matrix = SignalMatrix.empty(INDICATORS, 300, 40)
+    for name, (buy, sell) in flags.items():
+        matrix.set(name, buy=buy, sell=sell)
+    return matrix
+
+
+class TestSignalMatrix:
+    """Test packed signal storage"""
+
+    def test_round_trip(self, signals, flags):
+        """Test that every flag reads back unchanged"""
+        assert signals.data.dtype == np.uint16
+        assert signals.data.nbytes == 300 * 40 * 2
+        for name, (buy, sell) in flags.items():
+            np.testing.assert_array_equal(signals.flag(name, "buy"), buy)
+            np.testing.assert_array_equal(signals.flag(name, "sell"), sell)
+
+    def test_set_overwrites_only_its_bits(self, signals, flags):
+        """Test that updating one indicator leaves the others intact"""
+        signals.set("vix", sell=np.zeros(40, dtype=bool), rows=slice(100, 200))
+
+        expected = flags["vix"][1].copy()
+        expected[100:200] = False
+        np.testing.assert_array_equal(signals.flag("vix", "sell"), expected)
+        np.testing.assert_array_equal(signals.flag("vix", "buy"), flags["vix"][0])
+        np.testing.assert_array_equal(signals.flag("drop", "sell"), flags["drop"][1])
+
+    def test_count(self, signals, flags):
+        """Test counts per symbol and per bar"""
+        np.testing.assert_array_equal(signals.count("rsi", "buy"), flags["rsi"][0].sum(axis=0))
+        np.testing.assert_array_equal(
+            signals.count("rsi", "sell", axis=1), flags["rsi"][1].sum(axis=1)
+        )
+        assert signals.count("drop", "buy", axis=None) == flags["drop"][0].sum()
+
+    def test_transitions(self):
+        """Test rising and falling edges along the bars"""
+        signals = SignalMatrix.empty(["rsi"], 5, 2)
+        signals.set("rsi", buy=[[1, 0], [1, 1], [0, 1], [1, 1], [0, 0]])
+
+        bars, symbols = signals.transitions("rsi", "buy")
+        assert list(zip(bars, symbols)) == [(0, 0), (1, 1), (3, 0)]
+        bars, symbols = signals.transitions("rsi", "buy", rising=False)
+        assert list(zip(bars, symbols)) == [(2, 0), (4, 0), (4, 1)]
+
+    def test_save_and_memmap(self, signals, tmp_path):
+        """Test .npy persistence and memory-mapped loading"""
+        path = str(tmp_path / "signals.npy")
+        signals.save(path)
+        loaded = SignalMatrix.load(path, INDICATORS, mmap_mode="r")
+
+        assert isinstance(loaded.data, np.memmap)
+        np.testing.assert_array_equal(loaded.data, signals.data)
+        np.testing.assert_array_equal(
+            loaded.flag("candlestick", "sell"), signals.flag("candlestick", "sell")
+        )
+
+    def test_create_memmap(self, tmp_path, random_closes):
+        """Test filling an on-disk matrix bar block by bar block"""
+        closes = random_closes(200, seed=1, symbols=8)
+        rsi = rsi_series(closes, 14)
+        path = str(tmp_path / "rsi.npy")
+
+        signals = SignalMatrix.create_memmap(path, ["rsi"], len(rsi), 8)
+        for start in range(0, len(rsi), 50):
+            block = rsi[start: start + 50]
+            signals.set("rsi", buy=block < 30, sell=block > 70, rows=slice(start, start + 50))
+        signals.flush()
+
+        loaded = SignalMatrix.load(path, ["rsi"])
+        np.testing.assert_array_equal(loaded.flag("rsi", "buy"), rsi < 30)
+        np.testing.assert_array_equal(loaded.flag("rsi", "sell"), rsi > 70)
+
+    def test_validation(self):
+        """Test invalid layouts and flags"""
+        with pytest.raises(ValueError):
+            SignalMatrix.empty([f"i{n}" for n in range(9)], 2, 2)
+        with pytest.raises(ValueError):
+            SignalMatrix.empty(["a", "a"], 2, 2)
+        with pytest.raises(ValueError):
+            SignalMatrix(["a"], np.zeros((2, 2), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            SignalMatrix.empty(["a"], 2, 2).flag("a", "hold")
+        with pytest.raises(KeyError):
+            SignalMatrix.empty(["a"], 2, 2).flag("b", "buy")
@@ -0,0 +1,221 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.config import candle_bars
+from python_trading_indicators.rsi import RSIConfig, RSIIndicator, rsi_series
+from python_trading_indicators.smoothing import (
+    METHODS,
+    ema_series,
+    ewm_series,
+    sma_series,
+    smooth_series,
+    smoother_for,
+    wilder_series,
+    wma_series,
+)
+
+
+def _prices(length, symbols=None, seed=0):
+    shape = (length,) if symbols is None else (length, symbols)
+    return 100 + np.cumsum(np.random.default_rng(seed).normal(0, 1, shape), axis=0)
+
+
+def _reference(values, period, method):
+    """Plain loops over the textbook definitions"""
+    result = np.full(len(values), np.nan)
+    if method in ("ema", "wilder"):
+        alpha = 2 / (period + 1) if method == "ema" else 1 / period
+        for i in range(period - 1, len(values)):
+            if i == period - 1:
+                result[i] = values[:period].mean()
+            else:
+                result[i] = result[i - 1] + alpha * (values[i] - result[i - 1])
+        return result
+    weights = np.ones(period) if method == "sma" else np.arange(1, period + 1)
+    for i in range(period - 1, len(values)):
+        result[i] = np.dot(values[i - period + 1: i + 1], weights) / weights.sum()
+    return result
+
+
+class TestSeries:
+    """Test the vectorized kernels"""
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("period", [1, 2, 9, 30])
+    def test_matches_reference(self, method, period):
+        values = _prices(200)
+        np.testing.assert_allclose(
+            smooth_series(values, period, method), _reference(values, period, method)
+        )
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_2d(self, method):
+        matrix = _prices(150, symbols=4)
+        smoothed = smooth_series(matrix, 10, method)
+        assert smoothed.shape == matrix.shape
+        for symbol in range(4):
+            np.testing.assert_allclose(
+                smoothed[:, symbol], smooth_series(matrix[:, symbol], 10, method)
+            )
+
+    def test_named_kernels(self):
+        values = _prices(50)
+        for kernel, method in (
+            (sma_series, "sma"),
+            (ema_series, "ema"),
+            (wilder_series, "wilder"),
+            (wma_series, "wma"),
+        ):
+            np.testing.assert_array_equal(kernel(values, 5), smooth_series(values, 5, method))
+        np.testing.assert_allclose(sma_series(values, 5), pd.Series(values).rolling(5).mean())
+
+    def test_short_and_dtype(self):
+        assert np.isnan(smooth_series([1.0, 2.0], 3, "ema")).all()
+        assert len(smooth_series([], 3, "wma")) == 0
+        assert sma_series(np.float32([1, 2, 3]), 2, np.float32).dtype == np.float32
+        np.testing.assert_allclose(ewm_series([1.0, 1.0], 0.5, initial=3.0), [2.0, 1.5])
+
+    def test_sma_nan(self):
+        values = np.arange(20.0)
+        values[3] = np.nan
+        expected = pd.Series(values).rolling(3).mean().to_numpy()
+        with np.errstate(all="raise"):
+            np.testing.assert_allclose(sma_series(values, 3), expected)
+        matrix = np.column_stack([values, np.arange(20.0)])
+        np.testing.assert_allclose(sma_series(matrix, 3)[:, 0], expected)
+        smoother = smoother_for("sma", 3)
+        rows = smoother_for("sma", 3)
+        for i, value in enumerate(values):
+            assert smoother.peek(value) == pytest.approx(expected[i], nan_ok=True)
+            assert smoother.update(value) == pytest.approx(expected[i], nan_ok=True)
+            np.testing.assert_allclose(rows.update(matrix[i])[0], expected[i])
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            smooth_series([1.0], 3, "hull")
+        with pytest.raises(ValueError):
+            sma_series([1.0], 0)
+        with pytest.raises(ValueError):
+            smoother_for("hull", 3)
+
+
+class TestSmoothers:
+    """Test the O(1) streaming kernels against the series"""
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("period", [1, 3, 14])
+    def test_matches_series(self, method, period):
+        values = _prices(120, seed=1)
+        expected = smooth_series(values, period, method)
+        smoother = smoother_for(method, period)
+        for i, value in enumerate(values):
+            preview = smoother.peek(value)
+            assert smoother.update(value) == pytest.approx(expected[i], nan_ok=True)
+            assert preview == pytest.approx(smoother.value, nan_ok=True)
+            assert smoother.ready == (i + 1 >= period)
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("missing", [[3], [1], [3, 4, 20]])
+    def test_nan_matches_series(self, method, missing):
+        values = _prices(40, seed=7)
+        values[missing] = np.nan
+        expected = smooth_series(values, 3, method)
+        # Every method recovers once the NaN is skipped or leaves the window
+        assert np.isfinite(expected[-10:]).all()
+        smoother = smoother_for(method, 3)
+        for i, value in enumerate(values):
+            preview = smoother.peek(value)
+            assert smoother.update(value) == pytest.approx(expected[i], nan_ok=True)
+            assert preview == pytest.approx(smoother.value, nan_ok=True)
+        matrix = np.column_stack([values, _prices(40, seed=8)])
+        rows = smoother_for(method, 3)
+        for i, row in enumerate(matrix):
+            np.testing.assert_allclose(rows.update(row), smooth_series(matrix, 3, method)[i])
+        for length in (2, 5, 40):
+            loaded = smoother_for(method, 3).load(values[:length])
+            assert loaded.value == pytest.approx(expected[length - 1], nan_ok=True)
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_rows_of_symbols(self, method):
+        matrix = _prices(60, symbols=3, seed=2)
+        expected = smooth_series(matrix, 7, method)
+        smoother = smoother_for(method, 7)
+        for i, row in enumerate(matrix):
+            np.testing.assert_allclose(smoother.update(row), expected[i])
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("length", [0, 4, 5, 80])
+    def test_load(self, method, length):
+        values = _prices(100, seed=3)
+        loaded = smoother_for(method, 5).load(values[:length])
+        updated = smoother_for(method, 5)
+        for value in values[:length]:
+            updated.update(value)
+        assert loaded.count == updated.count
+        for value in values[length:]:
+            assert loaded.update(value) == pytest.approx(updated.update(value), nan_ok=True)
+
+    def test_copy(self):
+        smoother = smoother_for("wma", 4)
+        for value in range(6):
+            smoother.update(float(value))
+        clone = copy.deepcopy(smoother)
+        assert clone.update(10.0) == smoother.update(10.0)
+
+
+class TestRSISmoothing:
+    """Test the RSI smoothing choices"""
+
+    def test_cutler(self):
+        closes = _prices(100, seed=4)
+        diffs = np.diff(closes)
+        gains = pd.Series(np.maximum(diffs, 0)).rolling(14).mean().to_numpy()[13:]
+        losses = pd.Series(np.maximum(-diffs, 0)).rolling(14).mean().to_numpy()[13:]
+        np.testing.assert_allclose(
+            rsi_series(closes, 14, smoothing="cutler"), 100 - 100 / (1 + gains / losses)
+        )
+
+    @pytest.mark.parametrize("smoothing", ["wilder", "cutler", "ema"])
+    def test_streaming_matches_series(self, smoothing):
+        closes = _prices(200, seed=5)
+        candles = pd.DataFrame({"close": closes})
+        values = rsi_series(closes, 14, smoothing=smoothing)
+        config = RSIConfig(14, smoothing=smoothing)
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            preview = config.peek(state, bar)
+            config.update(state, bar)
+            assert preview == (state.value, state.buy, state.sell, state.bars)
+            if i >= 14:
+                assert state.value == pytest.approx(values[i - 14])
+        for end in (10, 15, 200):
+            computed = config.compute(candles[:end])
+            replayed = config.replay(candle_bars(candles[:end]))
+            assert computed.value == pytest.approx(replayed.value)
+            next_bar = candle_bars(candles)[min(end, 199)]
+            assert config.update(computed, next_bar).value == pytest.approx(
+                config.update(replayed, next_bar).value
+            )
+
+        indicator = RSIIndicator(14, smoothing=smoothing)
+        indicator.calculate(candles)
+        assert indicator.current_value == pytest.approx(values[-1])
+        assert indicator.config == config
+
+    def test_smoothings_differ(self):
+        closes = _prices(100, seed=6)
+        wilder, cutler, ema = (
+            rsi_series(closes, 14, smoothing=name) for name in ("wilder", "cutler", "ema")
+        )
+        assert not np.allclose(wilder, cutler) and not np.allclose(wilder, ema)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            RSIConfig(smoothing="sma")
+        with pytest.raises(ValueError):
+            RSIIndicator(smoothing="hull")
+        with pytest.raises(ValueError):
+            rsi_series([1.0, 2.0], smoothing="hull")
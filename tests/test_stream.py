@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from python_trading_indicators.candlestick import CandlestickConfig
+from python_trading_indicators.config import Bar
+from python_trading_indicators.drop import DropConfig
+from python_trading_indicators.rsi import RSIConfig
+from python_trading_indicators.stream import IndicatorStream
+from python_trading_indicators.vix import VIXConfig
+
+
+def _bar(candles, i):
+    return Bar(*candles[["open", "high", "low", "close", "volume"]].iloc[i].tolist())
+
+
+CONFIGS = [
+    RSIConfig(period=5, buy_threshold=45, sell_threshold=55),
+    VIXConfig(period=5, panic_threshold=40, volume_threshold=1.2),
+    DropConfig(drop_percentage=2, lookback_period=4, volume_threshold=1.1),
+    CandlestickConfig(lookback_period=3, volume_threshold=1.1),
+]
+
+
+def _assert_same(state, expected):
+    assert state.bars == expected.bars
+    assert state.value == pytest.approx(expected.value)
+    assert (state.buy, state.sell) == (expected.buy, expected.sell)
+
+
+class TestIndicatorStream:
+    """Test streaming with bounded rewind"""
+
+    @pytest.mark.parametrize("config", CONFIGS, ids=lambda c: type(c).__name__)
+    @pytest.mark.parametrize("bars_ago", [0, 1, 2])
+    def test_correction_matches_recompute(self, config, bars_ago, random_candles):
+        """Test that a rewound correction equals a full recompute"""
+        candles = random_candles(40, seed=bars_ago)
+        stream = IndicatorStream(config, retention=3, candles=candles[:20])
+        for i in range(20, 40):
+            stream.update(_bar(candles, i))
+        _assert_same(stream.state, config.compute(candles))
+
+        corrected = candles.copy()
+        index = len(candles) - 1 - bars_ago
+        corrected.loc[index, ["close", "volume"]] *= [0.9, 3.0]
+        stream.correct(_bar(corrected, index), bars_ago)
+
+        _assert_same(stream.state, config.compute(corrected))
+
+        # The checkpoint keeps advancing correctly after the correction
+        extra = random_candles(5, seed=7)
+        for i in range(5):
+            stream.update(_bar(extra, i))
+        _assert_same(stream.state, config.compute(pd.concat([corrected, extra])))
+
+    def test_old_correction_falls_back_to_recompute(self, random_candles):
+        """Test corrections beyond the retained bars"""
+        config = RSIConfig(5)
+        candles = random_candles(30, seed=1)
+        stream = IndicatorStream(config, retention=2, candles=candles)
+
+        corrected = candles.copy()
+        corrected.loc[25, "close"] *= 1.1
+        with pytest.raises(ValueError):
+            stream.correct(_bar(corrected, 25), bars_ago=4)
+        stream.correct(_bar(corrected, 25), bars_ago=4, candles=corrected)
+
+        _assert_same(stream.state, config.compute(corrected))
+        assert len(stream.bars) == 2
+
+    def test_short_history(self, random_candles):
+        """Test a stream started from fewer candles than the retention"""
+        config = VIXConfig(3)
+        candles = random_candles(10, seed=2)
+        stream = IndicatorStream(config, retention=5, candles=candles[:2])
+        for i in range(2, 10):
+            stream.update(_bar(candles, i))
+
+        _assert_same(stream.state, config.compute(candles))
+        assert stream.peek(_bar(candles, 9)) == config.peek(stream.state, _bar(candles, 9))
+
+    def test_validation(self):
+        """Test invalid parameters"""
+        with pytest.raises(ValueError):
+            IndicatorStream(RSIConfig(), retention=0)
+        with pytest.raises(ValueError):
+            IndicatorStream(RSIConfig()).correct(Bar(1, 1, 1, 1), bars_ago=-1)
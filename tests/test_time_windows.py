@@ -0,0 +1,240 @@
+import copy
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.candlestick import (
+    CandlestickConfig,
+    CandlestickIndicator,
+    candlestick_series,
+)
+from python_trading_indicators.config import Bar, candle_bars, time_window_series
+from python_trading_indicators.drop import (
+    DropConfig,
+    SuddenPriceDropIndicator,
+    drop_series,
+)
+from python_trading_indicators.quantile import AdaptiveThresholds
+from python_trading_indicators.stream import IndicatorStream
+from python_trading_indicators.vix import VIXConfig, VIXIndicator, vix_series
+
+
+def _irregular_timestamps(length, seed=0):
+    # One-minute bars with random gaps of up to five minutes
+    rng = np.random.default_rng(seed)
+    return np.cumsum(60 * rng.integers(1, 6, length)).astype(float)
+
+
+def _in_window(candles, i, window):
+    timestamps = candles["timestamp"].to_numpy()
+    return candles[(timestamps > timestamps[i] - window) & (timestamps <= timestamps[i])]
+
+
+CONFIGS = [
+    VIXConfig(period=5, panic_threshold=40, volume_threshold=1.2, window=600),
+    DropConfig(drop_percentage=2, lookback_period=5, volume_threshold=1.1, window=600),
+    CandlestickConfig(lookback_period=3, volume_threshold=1.1, window=600),
+]
+
+
+class TestRegularBars:
+    """Test that a time window over regular bars matches the bar-count window"""
+
+    def test_vix_matches_period(self, random_candles):
+        """Test VIX over period * interval seconds against vix_series"""
+        candles = random_candles(80, timestamps=np.arange(80) * 60.0)
+        config = VIXConfig(period=6, window=360)
+        expected = vix_series(candles["close"], 6)
+        np.testing.assert_allclose(time_window_series(config, candles), expected)
+
+    def test_drop_matches_lookback(self, random_candles):
+        """Test the drop signal once the window is covered"""
+        candles = random_candles(200, seed=1, timestamps=np.arange(200) * 60.0)
+        config = DropConfig(drop_percentage=1, lookback_period=4, volume_threshold=1.0)
+        expected = drop_series(candles["close"], candles["volume"], 1, 4, 1.0)
+        timed = time_window_series(
+            DropConfig(drop_percentage=1, volume_threshold=1.0, window=240), candles
+        )
+        # Time windows start once the history spans the window: one bar later
+        np.testing.assert_array_equal(timed, expected[1:])
+        assert timed.any()
+        assert config.compute(candles).value == timed[-1]
+
+    def test_candlestick_matches_lookback(self, random_candles):
+        """Test the candlestick signal once the window is covered"""
+        candles = random_candles(200, seed=2, timestamps=np.arange(200) * 60.0)
+        expected = candlestick_series(
+            candles["open"], candles["close"], candles["volume"], 3, 1.0
+        )
+        timed = time_window_series(
+            CandlestickConfig(volume_threshold=1.0, window=180), candles
+        )
+        np.testing.assert_array_equal(timed, expected[1:])
+        assert timed.any()
+
+
+class TestIrregularBars:
+    """Test time windows over bars with gaps against direct window slices"""
+
+    def test_vix(self, random_candles):
+        """Test VIX against the std of the returns stamped inside the window"""
+        candles = random_candles(120, seed=3, timestamps=_irregular_timestamps(120))
+        config = VIXConfig(panic_threshold=40, window=900)
+        returns = np.log(candles["close"] / candles["close"].shift(1))
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            config.update(state, bar)
+            if not state.covers(900):
+                continue
+            window = _in_window(candles, i, 900)
+            expected = returns[window.index].std() * np.sqrt(252) * 100
+            if np.isnan(expected):
+                assert state.vix is None
+            else:
+                assert state.vix == pytest.approx(expected)
+
+    def test_drop(self, random_candles):
+        """Test the drop state against the window's max close and volumes"""
+        candles = random_candles(150, seed=4, timestamps=_irregular_timestamps(150))
+        config = DropConfig(drop_percentage=2, volume_threshold=1.0, window=600)
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            config.update(state, bar)
+            if not state.covers(600):
+                continue
+            window = _in_window(candles, i, 600)
+            drop = bar.close / window["close"].max() - 1 < -0.02
+            prior = window["volume"].iloc[:-1]
+            confirmed = len(prior) > 0 and bar.volume > prior.mean()
+            assert (state.drop_detected, state.volume_confirmed) == (drop, confirmed)
+
+    def test_candlestick(self, random_candles):
+        """Test the direction balance over the candles inside the window"""
+        candles = random_candles(150, seed=5, timestamps=_irregular_timestamps(150))
+        config = CandlestickConfig(volume_threshold=1.0, window=600)
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            config.update(state, bar)
+            window = _in_window(candles, i, 600)
+            directions = np.sign(window["close"] - window["open"])
+            assert state.balance == directions.sum()
+
+    @pytest.mark.parametrize("config", CONFIGS, ids=lambda c: type(c).__name__)
+    def test_compute_matches_replay(self, config, random_candles):
+        """Test that compute, which replays only the window, equals a full replay"""
+        candles = random_candles(100, seed=6, timestamps=_irregular_timestamps(100))
+        for end in (1, 5, 30, 100):
+            head = candles[:end]
+            expected = config.replay(candle_bars(head))
+            state = config.compute(head)
+            assert state.bars == expected.bars
+            assert state.value == pytest.approx(expected.value)
+            assert (state.buy, state.sell) == (expected.buy, expected.sell)
+
+    @pytest.mark.parametrize("config", CONFIGS, ids=lambda c: type(c).__name__)
+    def test_peek(self, config, random_candles):
+        """Test that peek previews update without changing the state"""
+        candles = random_candles(60, seed=7, timestamps=_irregular_timestamps(60))
+        state = config.compute(candles[:50])
+        bar = candle_bars(candles, 50)[0]
+        before = copy.deepcopy(state)
+        snapshot = config.peek(state, bar)
+        assert state.bars == before.bars and state.value == before.value
+        config.update(state, bar)
+        assert snapshot == (state.value, state.buy, state.sell, state.bars)
+
+    @pytest.mark.parametrize(
+        "config",
+        CONFIGS
+        + [
+            VIXConfig(period=5, volume_threshold=1.2, window=600, volume_method="median"),
+            VIXConfig(window=600, estimator="parkinson", adaptive=AdaptiveThresholds(20)),
+            DropConfig(2, 5, 1.1, window=600, volume_method="median"),
+            CandlestickConfig(3, 1.1, window=600, volume_method="median"),
+        ],
+        ids=lambda c: type(c).__name__,
+    )
+    def test_peek_every_bar_without_copies(self, config, monkeypatch, random_candles):
+        """Test that peek previews the expirations instead of updating a copy"""
+        candles = random_candles(120, seed=10, timestamps=_irregular_timestamps(120))
+        state = config.new_state()
+        monkeypatch.setattr(copy, "deepcopy", None)
+        for bar in candle_bars(candles):
+            snapshot = config.peek(state, bar)
+            config.update(state, bar)
+            assert snapshot == (state.value, state.buy, state.sell, state.bars)
+        with pytest.raises(ValueError):
+            config.peek(state, bar._replace(timestamp=bar.timestamp - 60))
+
+    @pytest.mark.parametrize("config", CONFIGS, ids=lambda c: type(c).__name__)
+    def test_stream_correction(self, config, random_candles):
+        """Test that a rewound correction keeps the bar timestamps"""
+        candles = random_candles(60, seed=9, timestamps=_irregular_timestamps(60))
+        stream = IndicatorStream(config, retention=3, candles=candles)
+        corrected = candles.copy()
+        corrected.loc[58, "close"] *= 0.9
+        stream.correct(candle_bars(corrected, 58)[0], bars_ago=1)
+        expected = config.compute(corrected)
+        assert stream.state.value == pytest.approx(expected.value)
+        assert stream.state.timestamp == expected.timestamp
+
+
+class TestTimeWindowIndicators:
+    """Test the Indicator classes in time-window mode"""
+
+    @pytest.mark.parametrize(
+        "indicator",
+        [
+            VIXIndicator(window=timedelta(minutes=15), history=None),
+            SuddenPriceDropIndicator(window=900, history=None),
+            CandlestickIndicator(window=900, history=None),
+        ],
+        ids=lambda i: type(i).__name__,
+    )
+    def test_matches_config(self, indicator, random_candles):
+        """Test current value, signals and history against the config"""
+        candles = random_candles(200, seed=8, timestamps=_irregular_timestamps(200))
+        candles["timestamp"] = pd.to_datetime(candles["timestamp"], unit="s")
+        indicator.compute_indicator(candles)
+        config = indicator.config
+        assert config.window == 900
+        state = config.compute(candles)
+        assert indicator.current_value == pytest.approx(state.value)
+        assert indicator.check_buy_condition() == state.buy
+        assert indicator.check_sell_condition() == state.sell
+        history = indicator.history()
+        assert history[-1] == pytest.approx(state.value)
+        np.testing.assert_allclose(history, time_window_series(config, candles))
+
+    def test_insufficient_history(self, random_candles):
+        """Test that a history shorter than the window gives no signal"""
+        candles = random_candles(10, timestamps=np.arange(10) * 60.0)
+        indicator = SuddenPriceDropIndicator(window=3600)
+        indicator.compute_indicator(candles)
+        assert indicator.current_value == 0.0
+        assert not indicator.check_buy_condition()
+
+
+class TestValidation:
+    """Test time window errors"""
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            VIXConfig(window=0)
+        with pytest.raises(ValueError):
+            DropConfig(window=timedelta(seconds=-1))
+
+    def test_missing_timestamps(self):
+        config = CandlestickConfig(window=60)
+        with pytest.raises(ValueError):
+            config.update(config.new_state(), Bar(1, 1, 1, 1, 1))
+        with pytest.raises(ValueError):
+            config.compute({"open": [1.0], "close": [1.0], "volume": [1.0]})
+
+    def test_decreasing_timestamps(self):
+        config = VIXConfig(window=60)
+        state = config.update(config.new_state(), Bar(1, 1, 1, 1, 1, 120.0))
+        with pytest.raises(ValueError):
+            config.update(state, Bar(1, 1, 1, 1, 1, 60.0))
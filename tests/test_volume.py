@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_trading_indicators.candlestick import (
+    CandlestickConfig,
+    CandlestickIndicator,
+    candlestick_series,
+)
+from python_trading_indicators.config import candle_bars
+from python_trading_indicators.drop import DropConfig, SuddenPriceDropIndicator, drop_series
+from python_trading_indicators.vix import VIXConfig, VIXIndicator
+from python_trading_indicators.volume import (
+    VolumeBaseline,
+    latest_volume_confirmed,
+    volume_baseline_series,
+    volume_confirmed_series,
+)
+
+
+def _volumes(length, seed=0):
+    # Few distinct values so the median sees plenty of duplicates
+    return np.random.default_rng(seed).integers(1, 20, length).astype(float) * 100
+
+
+def _expected_baseline(volumes, window, method):
+    values = []
+    for i in range(len(volumes)):
+        prior = volumes[:i] if window is None else volumes[max(i - window, 0): i]
+        prior = prior[np.isfinite(prior)]
+        if not len(prior):
+            values.append(np.nan)
+        else:
+            values.append(np.median(prior) if method == "median" else prior.mean())
+    return np.array(values)
+
+
+class TestVolumeBaseline:
+    """Test the incremental mean and median"""
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    @pytest.mark.parametrize("window", [None, 0, 1, 2, 7, 50])
+    def test_matches_direct(self, method, window):
+        volumes = _volumes(300)
+        baseline = VolumeBaseline(window, method)
+        values = []
+        for volume in volumes:
+            values.append(baseline.baseline)
+            baseline.push(volume)
+        np.testing.assert_allclose(values, _expected_baseline(volumes, window, method))
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    def test_initial_values(self, method):
+        volumes = _volumes(40, seed=1)
+        baseline = VolumeBaseline(10, method, values=volumes[:25])
+        for volume in volumes[25:]:
+            baseline.push(volume)
+        expected = np.median(volumes[-10:]) if method == "median" else volumes[-10:].mean()
+        assert baseline.baseline == pytest.approx(expected)
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    def test_time_window(self, method):
+        volumes = _volumes(200, seed=2)
+        timestamps = np.cumsum(np.random.default_rng(2).integers(1, 5, 200)) * 60.0
+        baseline = VolumeBaseline(method=method, timed=True)
+        for i, (volume, timestamp) in enumerate(zip(volumes, timestamps)):
+            baseline.expire(timestamp - 600)
+            prior = volumes[:i][timestamps[:i] > timestamp - 600]
+            if len(prior):
+                expected = np.median(prior) if method == "median" else prior.mean()
+                assert baseline.baseline == pytest.approx(expected)
+            else:
+                assert np.isnan(baseline.baseline)
+            baseline.push(volume, timestamp)
+
+    def test_confirms(self):
+        baseline = VolumeBaseline(3, "median", values=[100.0, 100.0, 1000.0])
+        assert baseline.confirms(160.0, 1.5)  # Median 100, the mean would be 400
+        mean = VolumeBaseline(3, "mean", values=[100.0, 100.0, 1000.0])
+        assert not mean.confirms(160.0, 1.5)
+        assert not VolumeBaseline(3).confirms(160.0, 1.5)
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            VolumeBaseline(method="mode")
+        with pytest.raises(ValueError):
+            DropConfig(volume_method="mode")
+        with pytest.raises(ValueError):
+            VIXIndicator(volume_method="mode")
+
+
+class TestVolumeSeries:
+    """Test the vectorized baseline and confirmation"""
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    @pytest.mark.parametrize("window", [None, 0, 1, 4])
+    def test_baseline_series(self, method, window):
+        volumes = _volumes(100, seed=3)
+        np.testing.assert_allclose(
+            volume_baseline_series(volumes, window, method),
+            _expected_baseline(volumes, window, method),
+        )
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    def test_latest_matches_series(self, method):
+        volumes = _volumes(100, seed=4)
+        series = volume_confirmed_series(volumes, 4, 1.2, method)
+        for end in range(1, 100):
+            assert latest_volume_confirmed(volumes[:end], 4, 1.2, method) == series[end - 1]
+
+
+class TestMissingVolumes:
+    """Test that NaN volumes are skipped alike by every path"""
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    @pytest.mark.parametrize("window", [None, 4])
+    def test_baseline(self, method, window):
+        volumes = _volumes(60, seed=6)
+        volumes[[10, 11, 30]] = np.nan
+        expected = _expected_baseline(volumes, window, method)
+        np.testing.assert_allclose(volume_baseline_series(volumes, window, method), expected)
+        baseline = VolumeBaseline(window, method)
+        for i, volume in enumerate(volumes):
+            assert baseline.baseline == pytest.approx(expected[i], nan_ok=True)
+            baseline.push(volume)
+        series = volume_confirmed_series(volumes, window, 1.2, method)
+        for end in range(1, 60):
+            assert latest_volume_confirmed(volumes[:end], window, 1.2, method) == series[end - 1]
+
+    @pytest.mark.parametrize("method", ["mean", "median"])
+    def test_drop(self, method, random_candles):
+        candles = _with_volumes(random_candles(40, seed=7), 7)
+        candles.loc[10, "volume"] = np.nan
+        candles.loc[39, ["close", "volume"]] = [candles["close"][38] * 0.9, 1e6]
+        config = DropConfig(1, 4, 1.2, volume_method=method)
+        indicator = SuddenPriceDropIndicator(1, 4, 1.2, volume_method=method)
+        indicator.compute_indicator(candles)
+        assert indicator.check_sell_condition() is True
+        assert config.compute(candles).sell is True
+        assert config.replay(candle_bars(candles)).sell is True
+
+
+
+class TestZeroVolumes:
+    """Test that rounding drift never gives an all-zero window a baseline"""
+
+    def test_baseline(self):
+        baseline = VolumeBaseline(2, values=[0.1, 0.2, 0.0, 0.0])
+        assert baseline.total == 0.0
+        assert not baseline.confirms(1.0, 1.5)
+        timed = VolumeBaseline(timed=True)
+        for timestamp, volume in enumerate([0.1, 0.2, 0.0, 0.0]):
+            timed.push(volume, float(timestamp))
+        assert not timed.confirms(1.0, 1.5, cutoff=1.0)
+        timed.expire(1.0)
+        assert timed.total == 0.0
+        assert not timed.confirms(1.0, 1.5)
+
+    def test_drop_streaming_matches_batch(self):
+        candles = pd.DataFrame(
+            {
+                "open": [100.0] * 5,
+                "high": [100.0] * 5,
+                "low": [100.0, 100.0, 100.0, 100.0, 90.0],
+                "close": [100.0, 100.0, 100.0, 100.0, 90.0],
+                "volume": [0.1, 0.2, 0.0, 0.0, 5.0],
+            }
+        )
+        config = DropConfig(drop_percentage=5, lookback_period=3)
+        indicator = SuddenPriceDropIndicator(drop_percentage=5, lookback_period=3)
+        indicator.compute_indicator(candles)
+        assert indicator.check_sell_condition() is False
+        assert config.compute(candles).sell is False
+        assert config.replay(candle_bars(candles)).sell is False
+
+def _with_volumes(candles, seed):
+    """``candles`` with ``_volumes``, whose duplicates exercise the medians"""
+    candles["volume"] = _volumes(len(candles), seed)
+    return candles
+
+
+class TestMedianIndicators:
+    """Test that the indicators agree on median baselines in every mode"""
+
+    def test_drop(self, random_candles):
+        candles = _with_volumes(random_candles(120, seed=5), 5)
+        config = DropConfig(1, 4, 1.2, volume_method="median")
+        series = drop_series(
+            candles["close"], candles["volume"], 1, 4, 1.2, volume_method="median"
+        )
+        state = config.new_state()
+        values = []
+        for bar in candle_bars(candles):
+            values.append(config.peek(state, bar).value)
+            config.update(state, bar)
+        np.testing.assert_array_equal(values[3:], series)
+        indicator = SuddenPriceDropIndicator(1, 4, 1.2, volume_method="median")
+        indicator.compute_indicator(candles)
+        assert indicator.current_value == series[-1] == config.compute(candles).value
+
+    @pytest.mark.parametrize("lookback", [1, 3])
+    def test_candlestick(self, lookback, random_candles):
+        candles = _with_volumes(random_candles(120, seed=6), 6)
+        config = CandlestickConfig(lookback, 1.2, volume_method="median")
+        series = candlestick_series(
+            candles["open"], candles["close"], candles["volume"], lookback, 1.2,
+            volume_method="median",
+        )
+        state = config.replay(candle_bars(candles))
+        assert state.value == series[-1] == config.compute(candles).value
+        indicator = CandlestickIndicator(lookback, 1.2, volume_method="median")
+        indicator.compute_indicator(candles)
+        assert indicator.current_value == series[-1]
+
+    def test_vix(self, random_candles):
+        candles = _with_volumes(random_candles(120, seed=7), 7)
+        config = VIXConfig(5, panic_threshold=20, volume_threshold=1.2, volume_method="median")
+        expected = volume_confirmed_series(candles["volume"], 4, 1.2, "median")
+        state = config.new_state()
+        for i, bar in enumerate(candle_bars(candles)):
+            config.update(state, bar)
+            if i >= 5:
+                assert state.volume_confirmed == expected[i]
+        indicator = VIXIndicator(5, 20, 1.2, volume_method="median")
+        indicator.compute_indicator(candles)
+        assert indicator.check_sell_condition() == config.compute(candles).sell